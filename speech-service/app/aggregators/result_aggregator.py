@@ -7,7 +7,7 @@ VAD, ASR, and Diarization workers and publishes unified chunk completion events.
 
 import asyncio
 import time
-from typing import Dict, Any, Optional, Set
+from typing import Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 import structlog
 from datetime import datetime, timedelta
@@ -99,7 +99,8 @@ class ResultAggregator(EventSubscriberMixin, EventPublisherMixin):
         
         # State tracking
         self.is_running = False
-        self.chunk_states: Dict[str, ChunkAggregationState] = {}
+        # Keyed by (session_id, chunk_id): one tuple hash per lookup, no string formatting
+        self.chunk_states: Dict[Tuple[str, int], ChunkAggregationState] = {}
         self.cleanup_task: Optional[asyncio.Task] = None
         
         # Statistics
@@ -125,9 +126,11 @@ class ResultAggregator(EventSubscriberMixin, EventPublisherMixin):
         self.logger.info("Starting Result Aggregator")
         
         # Subscribe to completion events from all workers
-        await self.subscribe_to_event("vad_completed", self._handle_vad_completed)
-        await self.subscribe_to_event("asr_completed", self._handle_asr_completed)
-        await self.subscribe_to_event("diarization_completed", self._handle_diarization_completed)
+        await self.subscribe_many([
+            ("vad_completed", self._handle_vad_completed),
+            ("asr_completed", self._handle_asr_completed),
+            ("diarization_completed", self._handle_diarization_completed),
+        ])
         
         # Start cleanup task
         self.cleanup_task = asyncio.create_task(self._cleanup_expired_chunks())
@@ -193,20 +196,20 @@ class ResultAggregator(EventSubscriberMixin, EventPublisherMixin):
                 )
                 return
             
-            chunk_key = f"{session_id}_{chunk_id}"
+            chunk_key = (session_id, chunk_id)
             
             # Get or create chunk aggregation state
-            if chunk_key not in self.chunk_states:
-                self.chunk_states[chunk_key] = ChunkAggregationState(
+            chunk_state = self.chunk_states.get(chunk_key)
+            if chunk_state is None:
+                chunk_state = ChunkAggregationState(
                     session_id=session_id,
                     chunk_id=chunk_id,
                     created_at=time.time(),
                     timeout_seconds=self.aggregation_timeout
                 )
+                self.chunk_states[chunk_key] = chunk_state
                 self.stats["chunks_processed"] += 1
             
-            chunk_state = self.chunk_states[chunk_key]
-            
             # Add component result
             chunk_state.add_result(component, data)
             
@@ -233,7 +236,7 @@ class ResultAggregator(EventSubscriberMixin, EventPublisherMixin):
     
     async def _publish_chunk_complete(
         self,
-        chunk_key: str,
+        chunk_key: Tuple[str, int],
         chunk_state: ChunkAggregationState,
         is_timeout: bool = False
     ) -> None:
@@ -350,6 +353,16 @@ class ResultAggregator(EventSubscriberMixin, EventPublisherMixin):
             
             await self._publish_chunk_complete(chunk_key, chunk_state, is_timeout=False)
     
+    async def clear_session(self, session_id: str) -> None:
+        """
+        Drop a session's pending chunks without publishing them.
+        
+        Args:
+            session_id: Session identifier to clear
+        """
+        for chunk_key in [key for key in self.chunk_states if key[0] == session_id]:
+            del self.chunk_states[chunk_key]
+    
     def get_stats(self) -> Dict[str, Any]:
         """
         Get aggregator statistics.
@@ -370,10 +383,10 @@ class ResultAggregator(EventSubscriberMixin, EventPublisherMixin):
         Get information about currently active chunk aggregations.
         
         Returns:
-            Dictionary mapping chunk keys to their state info
+            Dictionary mapping "<session_id>_<chunk_id>" keys to their state info
         """
         return {
-            chunk_key: {
+            f"{session_id}_{chunk_id}": {
                 "session_id": state.session_id,
                 "chunk_id": state.chunk_id,
                 "age_seconds": time.time() - state.created_at,
@@ -382,5 +395,5 @@ class ResultAggregator(EventSubscriberMixin, EventPublisherMixin):
                 "missing_components": list(state.get_missing_components()),
                 "is_expired": state.is_expired()
             }
-            for chunk_key, state in self.chunk_states.items()
+            for (session_id, chunk_id), state in self.chunk_states.items()
         }
\ No newline at end of file
@@ -7,7 +7,8 @@ component health checks, and readiness probes.
 
 from datetime import datetime, timezone
 from typing import Dict, Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 try:
@@ -125,6 +126,11 @@ async def check_component_health(component_name: str, component: Any) -> Compone
             # Add component-specific details
             if hasattr(component, 'processing_tasks') and component.processing_tasks:
                 details["active_tasks"] = len(component.processing_tasks)
+            elif hasattr(component, 'get_status'):
+                # Queue-based workers report in-flight chunks in their status
+                active_tasks = component.get_status().get("processing_tasks")
+                if isinstance(active_tasks, int) and active_tasks:
+                    details["active_tasks"] = active_tasks
             
             if hasattr(component, 'get_stats'):
                 try:
@@ -235,15 +241,22 @@ async def detailed_health_check(
 
 
 @router.get("/ready")
-async def readiness_probe():
+async def readiness_probe(request: Request):
     """
     Kubernetes readiness probe endpoint.
     
+    Ready once the application lifespan has finished loading all models
+    and starting the workers.
+    
     Returns:
         200 if service is ready to accept traffic, 503 otherwise
     """
-    # In a real implementation, check if all critical components are ready
-    # For now, always return ready
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse(
+            status_code=503,
+            content={"status": "not_ready", "timestamp": datetime.now(timezone.utc).isoformat()}
+        )
+    
     return {"status": "ready", "timestamp": datetime.now(timezone.utc)}
 
 
@@ -56,7 +56,47 @@ class VADSettings(BaseSettings):
         description="Expected audio sample rate in Hz"
     )
     
+    device: str = Field(
+        default="auto",
+        description="Device for the VAD model (auto, cpu, cuda)",
+        pattern=r"^(auto|cpu|cuda)$"
+    )
+    
+    onnx: bool = Field(
+        default=True,
+        description="Run the ONNX Runtime build of the model when on CPU"
+    )
+    
+    result_cache_size: int = Field(
+        default=256,
+        description="Number of recent chunk results to reuse for repeated audio (0 disables)",
+        ge=0
+    )
+    
+    max_workers: int = Field(
+        default=1,
+        description="Threads in the dedicated VAD inference pool; they share one stateful model, so its stepping is serialized",
+        ge=1
+    )
+    
+    batch_window_ms: float = Field(
+        default=0.0,
+        description="Window for micro-batching chunks into one forward pass per frame (0 disables)",
+        ge=0.0
+    )
+    
+    max_batch_size: int = Field(
+        default=16,
+        description="Maximum chunks per VAD micro-batch",
+        ge=1
+    )
+    
     model_config = ConfigDict(env_prefix="VAD_")
+    
+    @property
+    def window_samples(self) -> int:
+        """Samples per Silero model window: 256 at 8 kHz, 512 otherwise."""
+        return 256 if self.sample_rate == 8000 else 512
 
 
 class ASRSettings(BaseSettings):
@@ -98,9 +138,39 @@ class ASRSettings(BaseSettings):
         le=1.0
     )
     
-    compute_type: str = Field(
-        default="int8",
-        description="Compute type for inference (float16, int8, float32)"
+    compute_type: Optional[str] = Field(
+        default=None,
+        description="Compute type for inference (float16, int8, int8_float16, float32); "
+                    "unset picks one from the device and the quantize flag"
+    )
+    
+    quantize: bool = Field(
+        default=True,
+        description="Use int8 weights (int8 on CPU, int8_float16 on CUDA) when compute_type is unset"
+    )
+    
+    max_workers: int = Field(
+        default=2,
+        description="Threads in the dedicated Whisper inference pool, each with its own CTranslate2 model worker",
+        ge=1
+    )
+    
+    batch_window_ms: float = Field(
+        default=0.0,
+        description="Window for micro-batching transcriptions into one executor job (0 disables); not applied to streamed chunks",
+        ge=0.0
+    )
+    
+    max_batch_size: int = Field(
+        default=8,
+        description="Maximum transcriptions per micro-batch",
+        ge=1
+    )
+    
+    result_cache_size: int = Field(
+        default=256,
+        description="Number of recent transcriptions to reuse for repeated audio (0 disables)",
+        ge=0
     )
     
     @field_validator('model_name')
@@ -116,8 +186,8 @@ class ASRSettings(BaseSettings):
     @classmethod
     def validate_compute_type(cls, v):
         """Validate compute type."""
-        valid_types = ["float16", "int8", "float32"]
-        if v not in valid_types:
+        valid_types = ["float16", "int8", "int8_float16", "float32"]
+        if v is not None and v not in valid_types:
             raise ValueError(f"Compute type must be one of {valid_types}")
         return v
     
@@ -154,6 +224,60 @@ class DiarizationSettings(BaseSettings):
         description="Clustering method for speaker separation"
     )
     
+    device: str = Field(
+        default="auto",
+        description="Device for the diarization pipeline (auto, cpu, cuda)",
+        pattern=r"^(auto|cpu|cuda)$"
+    )
+    
+    half_precision: bool = Field(
+        default=False,
+        description="Run pipeline inference under float16 autocast on CUDA"
+    )
+    
+    embedding_batch_size: Optional[int] = Field(
+        default=None,
+        description="(chunk, speaker) masks embedded per forward pass (pipeline default if unset)",
+        ge=1
+    )
+    
+    segmentation_batch_size: Optional[int] = Field(
+        default=None,
+        description="Sliding windows segmented per forward pass (pipeline default if unset)",
+        ge=1
+    )
+    
+    max_workers: int = Field(
+        default=1,
+        description="Threads in the dedicated diarization inference pool",
+        ge=1
+    )
+    
+    speaker_match_threshold: float = Field(
+        default=0.5,
+        description="Cosine similarity needed to match a chunk speaker to a known session speaker",
+        ge=-1.0,
+        le=1.0
+    )
+    
+    max_tracked_sessions: int = Field(
+        default=256,
+        description="Sessions whose speaker centroids are kept across chunks (0 disables)",
+        ge=0
+    )
+    
+    batch_window_ms: float = Field(
+        default=0.0,
+        description="Window for micro-batching diarizations into one executor job (0 disables)",
+        ge=0.0
+    )
+    
+    max_batch_size: int = Field(
+        default=8,
+        description="Maximum diarizations per micro-batch",
+        ge=1
+    )
+    
     model_config = ConfigDict(env_prefix="DIARIZATION_")
 
 
@@ -172,12 +296,14 @@ class WebSocketSettings(BaseSettings):
     
     ping_interval: int = Field(
         default=20,
-        description="WebSocket ping interval in seconds"
+        description="WebSocket ping interval in seconds (0 disables)",
+        ge=0
     )
     
     ping_timeout: int = Field(
         default=20,
-        description="WebSocket ping timeout in seconds"
+        description="WebSocket ping timeout in seconds (0 disables)",
+        ge=0
     )
     
     close_timeout: int = Field(
@@ -185,6 +311,22 @@ class WebSocketSettings(BaseSettings):
         description="WebSocket close timeout in seconds"
     )
     
+    coalesce_frames: bool = Field(
+        default=False,
+        description="Coalesce small audio frames into one VAD model window (vad.window_samples of 16-bit PCM) before publishing"
+    )
+    
+    max_pending_events: int = Field(
+        default=0,
+        description="Send backpressure frames instead of publishing audio while this many events are in flight (0 disables)",
+        ge=0
+    )
+    
+    inline_vad: bool = Field(
+        default=False,
+        description="Run VAD inline in the WebSocket handler and drop non-speech chunks before publishing"
+    )
+    
     model_config = ConfigDict(env_prefix="WS_")
 
 
@@ -255,6 +397,24 @@ class ProcessingSettings(BaseSettings):
         description="Timeout for processing a single chunk"
     )
     
+    vad_concurrency: Optional[int] = Field(
+        default=None,
+        description="Max concurrent VAD model calls (defaults to max_concurrent_workers)",
+        ge=1
+    )
+    
+    asr_concurrency: Optional[int] = Field(
+        default=None,
+        description="Max concurrent ASR model calls; set to 1 for a single GPU (defaults to max_concurrent_workers)",
+        ge=1
+    )
+    
+    diarization_concurrency: Optional[int] = Field(
+        default=None,
+        description="Max concurrent diarization model calls (defaults to max_concurrent_workers)",
+        ge=1
+    )
+    
     max_chunk_size_bytes: int = Field(
         default=512 * 1024,  # 512KB
         description="Maximum audio chunk size in bytes"
@@ -280,6 +440,23 @@ class ProcessingSettings(BaseSettings):
         description="Enable Speaker Diarization"
     )
     
+    stream_asr_segments: bool = Field(
+        default=False,
+        description="Forward ASR segments to clients as they are decoded; streamed chunks bypass ASR micro-batching"
+    )
+    
+    publish_batch_window_ms: float = Field(
+        default=0.0,
+        description="Window for batching asr_completed publishes into one event bus dispatch (0 publishes each directly)",
+        ge=0.0
+    )
+    
+    publish_batch_size: int = Field(
+        default=32,
+        description="Maximum results per batched publish",
+        ge=1
+    )
+    
     model_config = ConfigDict(env_prefix="PROCESSING_")
 
 
@@ -320,6 +497,12 @@ class Settings(BaseSettings):
         le=65535
     )
     
+    workers: int = Field(
+        default=1,
+        description="Number of uvicorn worker processes, each loading its own models",
+        ge=1
+    )
+    
     # CORS settings
     cors_origins: List[str] = Field(
         default=["*"],
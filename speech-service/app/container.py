@@ -14,6 +14,16 @@ from .events import AsyncEventBus
 from .interfaces.events import IEventBus
 
 
+def _enabled_or_none(enabled: bool, service):
+    """Return the service when the feature flag is on, otherwise None."""
+    return service if enabled else None
+
+
+def _coalesce_window_bytes(enabled: bool, vad_settings) -> int:
+    """Bytes of 16-bit PCM in one VAD model window when coalescing is on, otherwise 0."""
+    return vad_settings.window_samples * 2 if enabled else 0
+
+
 class Container(containers.DeclarativeContainer):
     """
     Main dependency injection container.
@@ -81,11 +91,24 @@ class Container(containers.DeclarativeContainer):
     )
     
     # WebSocket components - real-time communication
-    websocket_handler = providers.Factory(
+    # Singleton: the handler started in initialize_services() (which also
+    # initializes its inline VAD service) is the one bound to the app
+    websocket_handler = providers.Singleton(
         "app.handlers.websocket_handler.WebSocketHandler",
         event_bus=event_bus,
         max_audio_chunk_size=config.provided.websocket.max_message_size,
-        session_timeout_minutes=30
+        session_timeout_minutes=30,
+        coalesce_window_bytes=providers.Callable(
+            _coalesce_window_bytes,
+            config.provided.websocket.coalesce_frames,
+            config.provided.vad
+        ),
+        max_pending_events=config.provided.websocket.max_pending_events,
+        vad_service=providers.Callable(
+            _enabled_or_none,
+            config.provided.websocket.inline_vad,
+            vad_service
+        )
     )
 
 
@@ -7,7 +7,7 @@ following Clean Architecture principles with async/await support.
 
 import asyncio
 import uuid
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Set
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 import structlog
 from collections import defaultdict
@@ -39,6 +39,7 @@ class AsyncEventBus(IEventBus):
         self._event_history: List[Event] = []
         self._max_history_size: int = 1000
         self._lock = asyncio.Lock()
+        self._pending_events: int = 0
         
         logger.info("EventBus initialized")
     
@@ -52,6 +53,7 @@ class AsyncEventBus(IEventBus):
         Raises:
             EventPublishError: If publishing fails
         """
+        self._pending_events += 1
         try:
             async with self._lock:
                 # Add to event history
@@ -124,6 +126,74 @@ class AsyncEventBus(IEventBus):
                 correlation_id=getattr(event, 'correlation_id', None)
             )
             raise EventPublishError(f"Failed to publish event {event.name}: {e}")
+        finally:
+            self._pending_events -= 1
+    
+    async def publish_batch(self, events: List[Event]) -> None:
+        """
+        Publish several events with one lock acquisition and one gather.
+        
+        Handlers for every event in the batch run concurrently, so a batch
+        costs one dispatch round instead of one per event.
+        
+        Args:
+            events: Event instances to publish, in order
+            
+        Raises:
+            EventPublishError: If publishing fails
+        """
+        if not events:
+            return
+        
+        self._pending_events += len(events)
+        try:
+            async with self._lock:
+                self._event_history.extend(events)
+                overflow = len(self._event_history) - self._max_history_size
+                if overflow > 0:
+                    del self._event_history[:overflow]
+                
+                subscribers = {
+                    name: self._subscribers.get(name, set()).copy()
+                    for name in {event.name for event in events}
+                }
+            
+            logger.info(
+                "Publishing event batch",
+                event_names=list(subscribers),
+                batch_size=len(events)
+            )
+            
+            # _safe_handler_call logs and swallows handler errors itself
+            tasks = [
+                asyncio.create_task(self._safe_handler_call(handler, event))
+                for event in events
+                for handler in subscribers[event.name]
+            ]
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            
+        except Exception as e:
+            logger.error(
+                "Failed to publish event batch",
+                batch_size=len(events),
+                error=str(e)
+            )
+            raise EventPublishError(f"Failed to publish event batch: {e}")
+        finally:
+            self._pending_events -= len(events)
+    
+    def depth(self) -> int:
+        """
+        Get the number of events currently being dispatched.
+        
+        Publishing awaits every handler, so this grows when subscribers
+        fall behind the rate at which events are published.
+        
+        Returns:
+            Count of in-flight publish() calls
+        """
+        return self._pending_events
     
     async def _safe_handler_call(
         self, 
@@ -191,6 +261,38 @@ class AsyncEventBus(IEventBus):
                 f"Failed to subscribe to {event_name}: {e}"
             )
     
+    async def subscribe_many(
+        self,
+        subscriptions: List[Tuple[str, Callable[[Event], Coroutine[Any, Any, None]]]]
+    ) -> None:
+        """
+        Subscribe several handlers under a single lock acquisition.
+        
+        Args:
+            subscriptions: List of (event_name, handler) pairs
+            
+        Raises:
+            EventSubscriptionError: If subscription fails
+        """
+        try:
+            async with self._lock:
+                for event_name, handler in subscriptions:
+                    self._subscribers[event_name].add(handler)
+            
+            logger.info(
+                "Handlers subscribed to events",
+                event_names=[event_name for event_name, _ in subscriptions],
+                subscription_count=len(subscriptions)
+            )
+            
+        except Exception as e:
+            logger.error(
+                "Failed to subscribe handlers",
+                subscription_count=len(subscriptions),
+                error=str(e)
+            )
+            raise EventSubscriptionError(f"Failed to subscribe handlers: {e}")
+    
     async def unsubscribe(
         self, 
         event_name: str, 
@@ -304,6 +406,7 @@ class AsyncEventBus(IEventBus):
                 "total_event_types": len(self._subscribers),
                 "total_subscribers": total_subscribers,
                 "event_history_size": len(self._event_history),
+                "pending_events": self._pending_events,
                 "event_counts": dict(event_counts),
                 "subscriber_breakdown": {
                     name: len(handlers) 
@@ -363,6 +466,18 @@ class EventPublisherMixin(IEventPublisher):
         )
         
         await self._event_bus.publish(event)
+    
+    async def publish_event_obj(self, event: Event) -> None:
+        """
+        Publish a pre-built event as-is.
+        
+        Fast path for hot callers that construct the Event themselves,
+        skipping the extra wrapping done by publish_event.
+        
+        Args:
+            event: Event instance to publish
+        """
+        await self._event_bus.publish(event)
 
 
 class EventSubscriberMixin(IEventSubscriber):
@@ -435,6 +550,25 @@ class EventSubscriberMixin(IEventSubscriber):
             event_name=event_name
         )
     
+    async def subscribe_many(
+        self,
+        subscriptions: List[Tuple[str, Callable]]
+    ) -> None:
+        """
+        Subscribe to several event types in one event bus call.
+        
+        Args:
+            subscriptions: List of (event_name, handler) pairs
+        """
+        await self._event_bus.subscribe_many(subscriptions)
+        for event_name, handler in subscriptions:
+            self._subscriptions[event_name] = handler
+        
+        self._logger.info(
+            "Subscribed to events",
+            event_names=[event_name for event_name, _ in subscriptions]
+        )
+    
     async def unsubscribe_from_event(self, event_name: str) -> None:
         """
         Unsubscribe from a specific event type.
@@ -4,10 +4,11 @@ Handlers package for the speech-to-text service.
 This package contains handlers for WebSocket connections and other input/output operations.
 """
 
-from .websocket_handler import WebSocketHandler, WebSocketManager, SessionManager
+from .websocket_handler import WebSocketHandler, WebSocketManager, SessionManager, CoalescingBuffer
 
 __all__ = [
     "WebSocketHandler",
     "WebSocketManager", 
-    "SessionManager"
+    "SessionManager",
+    "CoalescingBuffer"
 ]
\ No newline at end of file
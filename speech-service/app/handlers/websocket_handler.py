@@ -7,7 +7,7 @@ managing connections, audio data intake, and result delivery.
 
 import asyncio
 import json
-import uuid
+import secrets
 import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
@@ -15,7 +15,6 @@ import structlog
 from fastapi import WebSocket, WebSocketDisconnect
 
 from ..interfaces.websocket import (
-    IWebSocketHandler, 
     IWebSocketManager, 
     ISessionManager,
     WebSocketHandlerError,
@@ -23,11 +22,23 @@ from ..interfaces.websocket import (
     SessionManagerError
 )
 from ..interfaces.events import IEventBus, Event
+from ..interfaces.services import IVADService
 from ..events import EventPublisherMixin, EventSubscriberMixin
 from ..models.audio import AudioChunkModel
+from ..models.transcript import TranscriptSegment, TranscriptWord
+from ..utils.audio_pool import AudioBufferPool, audio_buffer_pool
 
 
-class SessionManager(ISessionManager):
+def _json_default(value: Any) -> Any:
+    """Convert datetimes and transcript objects only when a message is serialized."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (TranscriptSegment, TranscriptWord)):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class SessionManager:
     """
     Session Manager implementation.
     
@@ -42,7 +53,11 @@ class SessionManager(ISessionManager):
     
     async def create_session(self) -> str:
         """Create a new processing session."""
-        session_id = f"ws_session_{uuid.uuid4().hex[:8]}"
+        # Short random suffix: session IDs are dict keys on every chunk lookup,
+        # and token_hex avoids building a full UUID just to keep 8 hex chars
+        session_id = f"ws_session_{secrets.token_hex(4)}"
+        while session_id in self.sessions:
+            session_id = f"ws_session_{secrets.token_hex(4)}"
         
         self.sessions[session_id] = {
             "session_id": session_id,
@@ -137,7 +152,84 @@ class SessionManager(ISessionManager):
         self.logger.info("All cleanup tasks cancelled")
 
 
-class WebSocketManager(IWebSocketManager):
+class CoalescingBuffer:
+    """
+    Per-session buffer that coalesces small audio frames.
+    
+    Frames are copied into a preallocated bytearray until at least
+    window_bytes have accumulated; the accumulated audio is then emitted
+    as a single chunk so downstream workers see one event per window
+    instead of one per network frame. The backing storage comes from an
+    AudioBufferPool and is returned to it on release().
+    """
+    
+    def __init__(
+        self,
+        window_bytes: int,
+        max_frame_bytes: int,
+        pool: AudioBufferPool = audio_buffer_pool
+    ):
+        """
+        Initialize coalescing buffer.
+        
+        Args:
+            window_bytes: Minimum number of bytes to accumulate before emitting
+            max_frame_bytes: Largest single frame that can be appended
+            pool: Pool to take the backing bytearray from
+        """
+        self.window_bytes = window_bytes
+        self._pool = pool
+        self._buffer = pool.acquire(window_bytes + max_frame_bytes)
+        self._view = memoryview(self._buffer)
+        self._offset = 0
+    
+    def append(self, data: bytes) -> Optional[bytes]:
+        """
+        Append a frame and return the coalesced chunk once the window is full.
+        
+        Args:
+            data: Raw audio frame
+            
+        Returns:
+            Coalesced audio bytes, or None while the window is still filling
+        """
+        end = self._offset + len(data)
+        self._view[self._offset:end] = data
+        self._offset = end
+        
+        if end < self.window_bytes:
+            return None
+        
+        chunk = self._view[:end].tobytes()
+        self._offset = 0
+        return chunk
+    
+    def drain(self) -> Optional[bytes]:
+        """
+        Take whatever is buffered, even if the window is not full.
+        
+        Returns:
+            Buffered audio bytes, or None if the buffer is empty
+        """
+        if not self._offset:
+            return None
+        
+        chunk = self._view[:self._offset].tobytes()
+        self._offset = 0
+        return chunk
+    
+    def __len__(self) -> int:
+        """Number of bytes currently buffered."""
+        return self._offset
+    
+    def release(self) -> None:
+        """Return the backing storage to the pool."""
+        self._view.release()
+        self._pool.release(self._buffer)
+        self._offset = 0
+
+
+class WebSocketManager:
     """
     WebSocket Manager implementation.
     
@@ -174,16 +266,24 @@ class WebSocketManager(IWebSocketManager):
     
     async def broadcast_to_session(self, session_id: str, message: Dict[str, Any]) -> None:
         """Send message to specific session."""
+        await self.send_encoded(session_id, self.encode_message(message))
+    
+    def encode_message(self, message: Dict[str, Any]) -> str:
+        """Encode message once so it can be fanned out to many sessions."""
+        return json.dumps(message, default=_json_default)
+    
+    async def send_encoded(self, session_id: str, payload: str) -> None:
+        """Send pre-encoded payload to specific session."""
         websocket = self.connections.get(session_id)
         if not websocket:
             raise WebSocketManagerError(f"No connection found for session {session_id}")
         
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(payload)
             self.logger.debug(
                 "Message sent to session",
                 session_id=session_id,
-                message_type=message.get("type", "unknown")
+                payload_size=len(payload)
             )
         except Exception as e:
             self.logger.error(
@@ -198,7 +298,7 @@ class WebSocketManager(IWebSocketManager):
         return list(self.connections.keys())
 
 
-class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMixin):
+class WebSocketHandler(EventPublisherMixin, EventSubscriberMixin):
     """
     WebSocket Handler implementation.
     
@@ -212,7 +312,11 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
         websocket_manager: Optional[IWebSocketManager] = None,
         session_manager: Optional[ISessionManager] = None,
         max_audio_chunk_size: int = 1024 * 64,  # 64KB chunks
-        session_timeout_minutes: int = 30
+        session_timeout_minutes: int = 30,
+        shutdown_concurrency: int = 64,
+        coalesce_window_bytes: int = 0,
+        max_pending_events: int = 0,
+        vad_service: Optional[IVADService] = None
     ):
         """
         Initialize WebSocket handler.
@@ -223,6 +327,13 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
             session_manager: Session state manager
             max_audio_chunk_size: Maximum size for audio chunks
             session_timeout_minutes: Session timeout in minutes
+            shutdown_concurrency: Max parallel disconnects during stop()
+            coalesce_window_bytes: Coalesce small frames until this many bytes
+                are buffered before publishing (0 disables coalescing)
+            max_pending_events: Reject audio with a backpressure frame while the
+                event bus has this many events in flight (0 disables the check)
+            vad_service: Optional VAD service for inline speech gating; when set,
+                non-speech chunks are acknowledged but never published
         """
         # Initialize mixins
         EventSubscriberMixin.__init__(self, event_bus)
@@ -232,6 +343,14 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
         self.session_manager = session_manager or SessionManager()
         self.max_audio_chunk_size = max_audio_chunk_size
         self.session_timeout = timedelta(minutes=session_timeout_minutes)
+        self.shutdown_concurrency = shutdown_concurrency
+        self.coalesce_window_bytes = coalesce_window_bytes
+        self.max_pending_events = max_pending_events
+        self.vad_service = vad_service
+        self._coalescing_buffers: Dict[str, CoalescingBuffer] = {}
+        
+        # Per-session processing_complete response, updated in place per chunk
+        self._response_templates: Dict[str, Dict[str, Any]] = {}
         
         self.logger = structlog.get_logger(self.__class__.__name__)
         self.is_running = False
@@ -249,8 +368,15 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
         
         self.logger.info("Starting WebSocket handler")
         
+        # Inline VAD gating uses its own service instance
+        if self.vad_service is not None:
+            await self.vad_service.initialize()
+        
         # Subscribe to chunk completion events
-        await self.subscribe_to_event("chunk_complete", self._handle_chunk_complete)
+        await self.subscribe_many([
+            ("chunk_complete", self._handle_chunk_complete),
+            ("asr_segment", self._handle_asr_segment),
+        ])
         
         self.is_running = True
         self.logger.info("WebSocket handler started successfully")
@@ -264,10 +390,16 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
         
         self.is_running = False
         
-        # Disconnect all active connections
+        # Disconnect all active connections concurrently (bounded)
         active_sessions = await self.websocket_manager.get_active_sessions()
-        for session_id in active_sessions:
-            await self.handle_disconnect(session_id)
+        if active_sessions:
+            semaphore = asyncio.Semaphore(self.shutdown_concurrency)
+            
+            async def _disconnect(session_id: str) -> None:
+                async with semaphore:
+                    await self.handle_disconnect(session_id)
+            
+            await asyncio.gather(*(_disconnect(sid) for sid in active_sessions))
         
         # Cancel all session cleanup tasks
         await self.session_manager.cancel_all_cleanup_tasks()
@@ -275,6 +407,12 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
         # Clean up subscriptions
         await self.cleanup_subscriptions()
         
+        if self.vad_service is not None:
+            try:
+                await self.vad_service.cleanup()
+            except Exception as e:
+                self.logger.warning("Error cleaning up inline VAD service", error=str(e))
+        
         self.logger.info("WebSocket handler stopped successfully")
     
     async def handle_connection(self, websocket: WebSocket) -> None:
@@ -400,36 +538,57 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
                 })
                 return
             
-            # Get next chunk ID
-            chunk_id = await self.session_manager.get_next_chunk_id(session_id)
+            # Coalesce small frames into VAD-sized windows
+            if self.coalesce_window_bytes > 0:
+                buffer = self._coalescing_buffers.get(session_id)
+                if buffer is None:
+                    buffer = CoalescingBuffer(self.coalesce_window_bytes, self.max_audio_chunk_size)
+                    self._coalescing_buffers[session_id] = buffer
+                
+                data = buffer.append(data)
+                if data is None:
+                    return
             
-            # Update session stats
-            await self.session_manager.update_session(session_id, {
-                "total_audio_bytes": (await self.session_manager.get_session_info(session_id))["total_audio_bytes"] + len(data)
-            })
+            # Shed load instead of piling up dispatches when workers fall behind
+            if self.max_pending_events > 0:
+                pending_events = self._event_bus.depth()
+                if pending_events >= self.max_pending_events:
+                    self.logger.warning(
+                        "Event bus saturated, dropping audio chunk",
+                        session_id=session_id,
+                        pending_events=pending_events,
+                        data_size=len(data)
+                    )
+                    await self.send_response(websocket, {
+                        "type": "backpressure",
+                        "size": len(data),
+                        "pending_events": pending_events,
+                        "timestamp": datetime.utcnow().isoformat()
+                    })
+                    return
             
-            # Create audio chunk model
-            audio_chunk = AudioChunkModel(
-                session_id=session_id,
-                chunk_id=chunk_id,
-                data=data,
-                sample_rate=16000,  # Default, could be configurable
-                channels=1          # Default mono
-            )
+            chunk_data = await self._build_chunk_data(session_id, data)
+            chunk_id = chunk_data["chunk_id"]
+            chunk_timestamp = chunk_data["timestamp"]
+            data = chunk_data["data"]
             
-            # Publish audio_chunk_received event
-            await self.publish_event(
-                "audio_chunk_received",
-                {
-                    "session_id": session_id,
-                    "chunk_id": chunk_id,
-                    "data": data,
-                    "sample_rate": audio_chunk.sample_rate,
-                    "channels": audio_chunk.channels,
-                    "timestamp": datetime.utcnow().isoformat()
-                },
-                correlation_id=f"{session_id}_{chunk_id}"
-            )
+            # Inline VAD gate: silence never reaches the event bus or workers
+            if self.vad_service is not None:
+                vad_result = await self.vad_service.detect_speech(data, chunk_data["sample_rate"])
+                if not vad_result.get("is_speech", False):
+                    await self.send_response(websocket, {
+                        "type": "chunk_received",
+                        "chunk_id": chunk_id,
+                        "size": len(data),
+                        "is_speech": False,
+                        "timestamp": chunk_timestamp
+                    })
+                    return
+                
+                # VAD worker reuses this result instead of detecting again
+                chunk_data["vad_result"] = vad_result
+            
+            await self._publish_audio_chunk(chunk_data)
             
             self.logger.debug(
                 "Audio chunk received and published",
@@ -443,7 +602,7 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
                 "type": "chunk_received",
                 "chunk_id": chunk_id,
                 "size": len(data),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": chunk_timestamp
             })
             
         except Exception as e:
@@ -457,6 +616,56 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
                 "message": f"Failed to process audio data: {str(e)}"
             })
     
+    async def _build_chunk_data(self, session_id: str, data: bytes) -> Dict[str, Any]:
+        """
+        Number a chunk, count it in the session stats and build its event payload.
+        
+        Args:
+            session_id: Session the audio belongs to
+            data: Raw audio bytes
+            
+        Returns:
+            audio_chunk_received payload
+        """
+        # Get next chunk ID
+        chunk_id = await self.session_manager.get_next_chunk_id(session_id)
+        
+        # Update session stats
+        await self.session_manager.update_session(session_id, {
+            "total_audio_bytes": (await self.session_manager.get_session_info(session_id))["total_audio_bytes"] + len(data)
+        })
+        
+        # Hand audio downstream by reference; workers read it via np.frombuffer
+        data = memoryview(data)
+        
+        # Create audio chunk model
+        audio_chunk = AudioChunkModel(
+            session_id=session_id,
+            chunk_id=chunk_id,
+            data=data,
+            sample_rate=16000,  # Default, could be configurable
+            channels=1          # Default mono
+        )
+        
+        # One timestamp per chunk, formatted once for the event and the ack
+        return {
+            "session_id": session_id,
+            "chunk_id": chunk_id,
+            "data": data,
+            "sample_rate": audio_chunk.sample_rate,
+            "channels": audio_chunk.channels,
+            "timestamp": audio_chunk.timestamp.isoformat()
+        }
+    
+    async def _publish_audio_chunk(self, chunk_data: Dict[str, Any]) -> None:
+        """Publish audio_chunk_received (pre-built Event, no re-wrapping)."""
+        await self.publish_event_obj(Event(
+            name="audio_chunk_received",
+            data=chunk_data,
+            source=self._source_name,
+            correlation_id=f"{chunk_data['session_id']}_{chunk_data['chunk_id']}"
+        ))
+    
     async def send_response(self, websocket: WebSocket, response: Dict[str, Any]) -> None:
         """
         Send response to WebSocket client.
@@ -466,7 +675,7 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
             response: Response data
         """
         try:
-            await websocket.send_text(json.dumps(response))
+            await websocket.send_text(json.dumps(response, default=_json_default))
         except Exception as e:
             self.logger.error("Failed to send WebSocket response", error=str(e))
             raise WebSocketHandlerError(f"Failed to send response: {e}")
@@ -482,6 +691,27 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
             # Remove from connection manager
             await self.websocket_manager.remove_connection(session_id)
             
+            # Publish the partially filled coalescing window so the tail of
+            # the session is still processed; the client is gone, so no ack
+            buffer = self._coalescing_buffers.pop(session_id, None)
+            if buffer is not None:
+                remainder = buffer.drain()
+                buffer.release()
+                if remainder is not None:
+                    try:
+                        await self._publish_audio_chunk(
+                            await self._build_chunk_data(session_id, remainder)
+                        )
+                    except Exception as e:
+                        # The session must still be ended below
+                        self.logger.error(
+                            "Failed to publish final audio window",
+                            session_id=session_id,
+                            error=str(e)
+                        )
+            
+            self._response_templates.pop(session_id, None)
+            
             # End session
             await self.session_manager.end_session(session_id)
             
@@ -520,29 +750,32 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
                 )
                 return
             
-            # Prepare response message
-            response = {
-                "type": "processing_complete",
-                "session_id": session_id,
-                "chunk_id": chunk_id,
-                "is_complete": data.get("is_complete", False),
-                "is_timeout": data.get("is_timeout", False),
-                "completed_components": data.get("completed_components", []),
-                "missing_components": data.get("missing_components", []),
-                "aggregation_time_ms": data.get("aggregation_time_ms", 0),
-                "results": data.get("results", {}),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            # Send result to client
-            await self.websocket_manager.broadcast_to_session(session_id, response)
+            # Prepare response message: reuse the session's template and
+            # encode before the next await so concurrent chunks can't interleave
+            response = self._response_templates.get(session_id)
+            if response is None:
+                response = {"type": "processing_complete", "session_id": session_id}
+                self._response_templates[session_id] = response
+            
+            response["chunk_id"] = chunk_id
+            response["is_complete"] = data.get("is_complete", False)
+            response["is_timeout"] = data.get("is_timeout", False)
+            response["completed_components"] = data.get("completed_components", [])
+            response["missing_components"] = data.get("missing_components", [])
+            response["aggregation_time_ms"] = data.get("aggregation_time_ms", 0)
+            response["results"] = data.get("results", {})
+            response["timestamp"] = datetime.utcnow().isoformat()
+            
+            # Encode once, then send to client
+            payload = self.websocket_manager.encode_message(response)
+            await self.websocket_manager.send_encoded(session_id, payload)
             
             self.logger.info(
                 "Processing result sent to client",
                 session_id=session_id,
                 chunk_id=chunk_id,
-                is_complete=response["is_complete"],
-                components_count=len(response["completed_components"])
+                is_complete=data.get("is_complete", False),
+                components_count=len(data.get("completed_components", []))
             )
             
         except Exception as e:
@@ -552,6 +785,36 @@ class WebSocketHandler(IWebSocketHandler, EventPublisherMixin, EventSubscriberMi
                 correlation_id=event.correlation_id
             )
     
+    async def _handle_asr_segment(self, event: Event) -> None:
+        """
+        Forward a transcript segment to the client as soon as ASR decodes it.
+        
+        The full result still arrives later in processing_complete.
+        
+        Args:
+            event: ASR segment event
+        """
+        try:
+            data = event.data
+            session_id = data.get("session_id")
+            if not session_id or await self.websocket_manager.get_connection(session_id) is None:
+                return
+            
+            payload = self.websocket_manager.encode_message({
+                "type": "transcript_segment",
+                "session_id": session_id,
+                "chunk_id": data.get("chunk_id"),
+                "segment": data.get("segment", {})
+            })
+            await self.websocket_manager.send_encoded(session_id, payload)
+            
+        except Exception as e:
+            self.logger.error(
+                "Error handling ASR segment event",
+                error=str(e),
+                correlation_id=event.correlation_id
+            )
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get WebSocket handler statistics."""
         return {
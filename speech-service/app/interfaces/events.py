@@ -6,7 +6,7 @@ following Clean Architecture principles with dependency inversion.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Coroutine, Dict, List, Optional
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -49,6 +49,19 @@ class IEventBus(ABC):
         """
         pass
     
+    @abstractmethod
+    async def publish_batch(self, events: List[Event]) -> None:
+        """
+        Publish several events in a single dispatch step.
+        
+        Args:
+            events: Event instances to publish, in order
+            
+        Raises:
+            EventBusError: If publishing fails
+        """
+        pass
+    
     @abstractmethod
     async def subscribe(
         self, 
@@ -67,6 +80,22 @@ class IEventBus(ABC):
         """
         pass
     
+    @abstractmethod
+    async def subscribe_many(
+        self,
+        subscriptions: List[Tuple[str, Callable[[Event], Coroutine[Any, Any, None]]]]
+    ) -> None:
+        """
+        Subscribe several handlers in a single registration step.
+        
+        Args:
+            subscriptions: List of (event_name, handler) pairs
+            
+        Raises:
+            EventBusError: If subscription fails
+        """
+        pass
+    
     @abstractmethod
     async def unsubscribe(
         self, 
@@ -107,6 +136,18 @@ class IEventBus(ABC):
             event_name: Event type to clear, or None for all events
         """
         pass
+    
+    @abstractmethod
+    def depth(self) -> int:
+        """
+        Get the number of events currently being dispatched.
+        
+        Publishers on the ingress path use this as a backpressure signal.
+        
+        Returns:
+            Count of in-flight publish() calls
+        """
+        pass
 
 
 class IEventSubscriber(ABC):
@@ -166,14 +207,14 @@ class IEventPublisher(ABC):
 
 class EventBusError(Exception):
     """Base exception for event bus operations."""
-    pass
+    __slots__ = ()
 
 
 class EventPublishError(EventBusError):
     """Exception raised when event publishing fails."""
-    pass
+    __slots__ = ()
 
 
 class EventSubscriptionError(EventBusError):
     """Exception raised when event subscription fails."""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
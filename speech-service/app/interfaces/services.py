@@ -1,25 +1,25 @@
 """
 Service interfaces for audio processing components.
 
-This module defines abstract interfaces for VAD, ASR, and Diarization services,
+This module defines structural (typing.Protocol) interfaces for VAD, ASR, and Diarization services,
 following Clean Architecture and SOLID principles.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Awaitable, Callable, Dict, Any, List, Tuple, Optional, Protocol, Union
 # import numpy as np  # TODO: Uncomment when numpy is installed
 from ..models.audio import AudioChunkModel, ProcessingResultModel
+from ..models.transcript import TranscriptSegment
+from ..utils.pcm import AudioBuffer
 
 
-class IVADService(ABC):
+class IVADService(Protocol):
     """
-    Abstract interface for Voice Activity Detection service.
+    Protocol for Voice Activity Detection service.
     
     Defines the contract for detecting speech segments in audio data.
     Implementations should handle different VAD algorithms (Silero, WebRTC, etc.).
     """
     
-    @abstractmethod
     async def detect_speech(
         self, 
         audio_data: bytes, 
@@ -41,9 +41,8 @@ class IVADService(ABC):
         Raises:
             VADServiceError: If detection fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def initialize(self) -> None:
         """
         Initialize the VAD service and load models.
@@ -51,50 +50,57 @@ class IVADService(ABC):
         Raises:
             VADServiceError: If initialization fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def cleanup(self) -> None:
         """Clean up resources and models."""
-        pass
+        ...
 
 
-class IASRService(ABC):
+class IASRService(Protocol):
     """
-    Abstract interface for Automatic Speech Recognition service.
+    Protocol for Automatic Speech Recognition service.
     
     Defines the contract for transcribing speech to text.
     Implementations should handle different ASR models (Whisper, etc.).
     """
     
-    @abstractmethod
+    is_initialized: bool
+    
     async def transcribe(
         self, 
-        audio_data: bytes, 
+        audio_data: Union[bytes, memoryview, AudioBuffer], 
         sample_rate: int = 16000,
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        on_segment: Optional[Callable[[TranscriptSegment], Awaitable[None]]] = None,
+        include_all_language_probs: bool = False
     ) -> Dict[str, Any]:
         """
         Transcribe speech audio to text.
         
         Args:
-            audio_data: Raw audio bytes containing speech
+            audio_data: Raw PCM containing speech, as bytes, a memoryview
+                (used without copying) or a shared AudioBuffer
             sample_rate: Audio sample rate in Hz
             language: Optional language hint for transcription
+            on_segment: Optional coroutine awaited with each segment, in order,
+                as soon as it is decoded
+            include_all_language_probs: Also return the per-language
+                probabilities (~100 entries); off by default to keep replies small
             
         Returns:
             Dictionary containing:
                 - text: str transcribed text
                 - confidence: float confidence score (0-1)
-                - segments: List of word-level segments with timing
+                - segments: List of TranscriptSegment with timing
                 - language: str detected/used language
+                - all_language_probs: only if include_all_language_probs
                 
         Raises:
             ASRServiceError: If transcription fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def initialize(self) -> None:
         """
         Initialize the ASR service and load models.
@@ -102,28 +108,27 @@ class IASRService(ABC):
         Raises:
             ASRServiceError: If initialization fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def cleanup(self) -> None:
         """Clean up resources and models."""
-        pass
+        ...
 
 
-class IDiarizationService(ABC):
+class IDiarizationService(Protocol):
     """
-    Abstract interface for Speaker Diarization service.
+    Protocol for Speaker Diarization service.
     
     Defines the contract for identifying and separating different speakers
     in audio. Implementations should handle different diarization models.
     """
     
-    @abstractmethod
     async def diarize(
         self, 
         audio_data: bytes, 
         sample_rate: int = 16000,
-        num_speakers: Optional[int] = None
+        num_speakers: Optional[int] = None,
+        session_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Perform speaker diarization on audio data.
@@ -132,6 +137,8 @@ class IDiarizationService(ABC):
             audio_data: Raw audio bytes
             sample_rate: Audio sample rate in Hz  
             num_speakers: Optional hint for number of speakers
+            session_id: Optional session the chunk belongs to; when given,
+                speaker labels stay consistent across that session's chunks
             
         Returns:
             Dictionary containing:
@@ -142,9 +149,8 @@ class IDiarizationService(ABC):
         Raises:
             DiarizationServiceError: If diarization fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def initialize(self) -> None:
         """
         Initialize the diarization service and load models.
@@ -152,23 +158,21 @@ class IDiarizationService(ABC):
         Raises:
             DiarizationServiceError: If initialization fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def cleanup(self) -> None:
         """Clean up resources and models."""
-        pass
+        ...
 
 
-class IWorker(ABC):
+class IWorker(Protocol):
     """
-    Abstract interface for processing workers.
+    Protocol for processing workers.
     
     Defines the contract for workers that process audio chunks
     and publish results via the event system.
     """
     
-    @abstractmethod
     async def start(self) -> None:
         """
         Start the worker and set up event subscriptions.
@@ -176,9 +180,8 @@ class IWorker(ABC):
         Raises:
             WorkerError: If worker startup fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def stop(self) -> None:
         """
         Stop the worker and clean up resources.
@@ -186,9 +189,8 @@ class IWorker(ABC):
         Raises:
             WorkerError: If worker shutdown fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def process_chunk(self, chunk: AudioChunkModel) -> ProcessingResultModel:
         """
         Process an audio chunk and return the result.
@@ -202,18 +204,17 @@ class IWorker(ABC):
         Raises:
             WorkerError: If processing fails
         """
-        pass
+        ...
 
 
-class IAggregator(ABC):
+class IAggregator(Protocol):
     """
-    Abstract interface for result aggregation service.
+    Protocol for result aggregation service.
     
     Defines the contract for combining results from different
     processing components into final responses.
     """
     
-    @abstractmethod
     async def add_result(self, result: ProcessingResultModel) -> None:
         """
         Add a processing result for aggregation.
@@ -224,9 +225,8 @@ class IAggregator(ABC):
         Raises:
             AggregatorError: If result addition fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_aggregated_result(
         self, 
         session_id: str, 
@@ -245,9 +245,8 @@ class IAggregator(ABC):
         Raises:
             AggregatorError: If retrieval fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def clear_session(self, session_id: str) -> None:
         """
         Clear all results for a specific session.
@@ -255,18 +254,17 @@ class IAggregator(ABC):
         Args:
             session_id: Session identifier to clear
         """
-        pass
+        ...
 
 
-class IRepository(ABC):
+class IRepository(Protocol):
     """
-    Abstract interface for data storage repositories.
+    Protocol for data storage repositories.
     
     Defines the contract for storing and retrieving processing
     results and session state.
     """
     
-    @abstractmethod
     async def store_result(
         self, 
         session_id: str, 
@@ -283,9 +281,8 @@ class IRepository(ABC):
             component: Component name that generated the result
             result: Result data to store
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_result(
         self, 
         session_id: str, 
@@ -303,9 +300,8 @@ class IRepository(ABC):
         Returns:
             Result data or None if not found
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_all_results(
         self, 
         session_id: str, 
@@ -321,9 +317,8 @@ class IRepository(ABC):
         Returns:
             Dictionary mapping component names to their results
         """
-        pass
+        ...
     
-    @abstractmethod
     async def clear_session(self, session_id: str) -> None:
         """
         Clear all data for a specific session.
@@ -331,35 +326,35 @@ class IRepository(ABC):
         Args:
             session_id: Session identifier to clear
         """
-        pass
+        ...
 
 
 # Exception classes for service interfaces
 class ServiceError(Exception):
     """Base exception for service operations."""
-    pass
+    __slots__ = ()
 
 
 class VADServiceError(ServiceError):
     """Exception raised by VAD service operations."""
-    pass
+    __slots__ = ()
 
 
 class ASRServiceError(ServiceError):
     """Exception raised by ASR service operations."""
-    pass
+    __slots__ = ()
 
 
 class DiarizationServiceError(ServiceError):
     """Exception raised by diarization service operations."""
-    pass
+    __slots__ = ()
 
 
 class WorkerError(Exception):
     """Base exception for worker operations."""
-    pass
+    __slots__ = ()
 
 
 class AggregatorError(Exception):
     """Exception raised by aggregator operations."""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -1,24 +1,22 @@
 """
 WebSocket interface definitions for the speech-to-text service.
 
-This module defines abstract interfaces for WebSocket handling,
+This module defines structural (typing.Protocol) interfaces for WebSocket handling,
 following Clean Architecture principles.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Protocol
 from fastapi import WebSocket
 
 
-class IWebSocketHandler(ABC):
+class IWebSocketHandler(Protocol):
     """
-    Abstract interface for WebSocket connection handling.
+    Protocol for WebSocket connection handling.
     
     Defines the contract for managing WebSocket connections,
     handling incoming audio data, and sending responses.
     """
     
-    @abstractmethod
     async def handle_connection(self, websocket: WebSocket) -> None:
         """
         Handle a new WebSocket connection.
@@ -29,9 +27,8 @@ class IWebSocketHandler(ABC):
         Raises:
             WebSocketHandlerError: If connection handling fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def handle_audio_data(
         self, 
         websocket: WebSocket, 
@@ -49,9 +46,8 @@ class IWebSocketHandler(ABC):
         Raises:
             WebSocketHandlerError: If data handling fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def send_response(
         self, 
         websocket: WebSocket, 
@@ -67,9 +63,8 @@ class IWebSocketHandler(ABC):
         Raises:
             WebSocketHandlerError: If sending fails
         """
-        pass
+        ...
     
-    @abstractmethod
     async def handle_disconnect(self, session_id: str) -> None:
         """
         Handle WebSocket disconnection cleanup.
@@ -77,18 +72,17 @@ class IWebSocketHandler(ABC):
         Args:
             session_id: Session identifier to clean up
         """
-        pass
+        ...
 
 
-class IWebSocketManager(ABC):
+class IWebSocketManager(Protocol):
     """
-    Abstract interface for managing multiple WebSocket connections.
+    Protocol for managing multiple WebSocket connections.
     
     Provides methods for tracking active connections and
     broadcasting messages to multiple clients.
     """
     
-    @abstractmethod
     async def add_connection(self, session_id: str, websocket: WebSocket) -> None:
         """
         Add a new WebSocket connection.
@@ -97,9 +91,8 @@ class IWebSocketManager(ABC):
             session_id: Unique session identifier
             websocket: WebSocket connection instance
         """
-        pass
+        ...
     
-    @abstractmethod
     async def remove_connection(self, session_id: str) -> None:
         """
         Remove a WebSocket connection.
@@ -107,9 +100,8 @@ class IWebSocketManager(ABC):
         Args:
             session_id: Session identifier to remove
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_connection(self, session_id: str) -> Optional[WebSocket]:
         """
         Get WebSocket connection by session ID.
@@ -120,9 +112,8 @@ class IWebSocketManager(ABC):
         Returns:
             WebSocket instance or None if not found
         """
-        pass
+        ...
     
-    @abstractmethod
     async def broadcast_to_session(
         self, 
         session_id: str, 
@@ -138,9 +129,33 @@ class IWebSocketManager(ABC):
         Raises:
             WebSocketManagerError: If broadcasting fails
         """
-        pass
+        ...
+    
+    def encode_message(self, message: Dict[str, Any]) -> str:
+        """
+        Encode a message once for sending to one or more sessions.
+        
+        Args:
+            message: Message data to encode
+            
+        Returns:
+            Wire-ready encoded payload
+        """
+        ...
+    
+    async def send_encoded(self, session_id: str, payload: str) -> None:
+        """
+        Send an already encoded payload to a specific session.
+        
+        Args:
+            session_id: Target session identifier
+            payload: Payload produced by encode_message
+            
+        Raises:
+            WebSocketManagerError: If sending fails
+        """
+        ...
     
-    @abstractmethod
     async def get_active_sessions(self) -> List[str]:
         """
         Get list of all active session IDs.
@@ -148,17 +163,16 @@ class IWebSocketManager(ABC):
         Returns:
             List of active session identifiers
         """
-        pass
+        ...
 
 
-class ISessionManager(ABC):
+class ISessionManager(Protocol):
     """
-    Abstract interface for managing session state.
+    Protocol for managing session state.
     
     Handles creation, tracking, and cleanup of processing sessions.
     """
     
-    @abstractmethod
     async def create_session(self) -> str:
         """
         Create a new processing session.
@@ -166,9 +180,8 @@ class ISessionManager(ABC):
         Returns:
             Unique session identifier
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
         Get information about a session.
@@ -179,9 +192,8 @@ class ISessionManager(ABC):
         Returns:
             Session information dictionary or None if not found
         """
-        pass
+        ...
     
-    @abstractmethod
     async def update_session(
         self, 
         session_id: str, 
@@ -194,9 +206,8 @@ class ISessionManager(ABC):
             session_id: Session identifier
             data: Data to update in session
         """
-        pass
+        ...
     
-    @abstractmethod
     async def end_session(self, session_id: str) -> None:
         """
         End a processing session and clean up resources.
@@ -204,9 +215,8 @@ class ISessionManager(ABC):
         Args:
             session_id: Session identifier to end
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_next_chunk_id(self, session_id: str) -> int:
         """
         Get the next chunk ID for a session.
@@ -217,25 +227,25 @@ class ISessionManager(ABC):
         Returns:
             Next chunk ID number
         """
-        pass
+        ...
 
 
 # Exception classes for WebSocket interfaces
 class WebSocketError(Exception):
     """Base exception for WebSocket operations."""
-    pass
+    __slots__ = ()
 
 
 class WebSocketHandlerError(WebSocketError):
     """Exception raised by WebSocket handler operations."""
-    pass
+    __slots__ = ()
 
 
 class WebSocketManagerError(WebSocketError):
     """Exception raised by WebSocket manager operations."""
-    pass
+    __slots__ = ()
 
 
 class SessionManagerError(Exception):
     """Exception raised by session manager operations."""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
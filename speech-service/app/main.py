@@ -5,24 +5,59 @@ This module creates and configures the FastAPI application with all
 API routers, middleware, and WebSocket endpoints.
 """
 
+import contextvars
+import json
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from app.config import get_settings
 from app.api import health, sessions, stats
-from app.handlers.websocket_handler import WebSocketHandler
-from app.events import AsyncEventBus
-from app.container import ServiceLifecycleManager
 
 
 # Global components managed by DI container
 lifecycle_manager = None
-websocket_handler = None
+
+# Session of the WebSocket connection handled by the current task
+_session_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("session_id", default="-")
+
+
+class SessionLoggerAdapter(logging.LoggerAdapter):
+    """
+    Logger adapter that tags records with the current WebSocket session.
+    
+    The session ID is read from a context variable and only applied when the
+    record is actually emitted, so filtered-out calls do no string work.
+    """
+    
+    def process(self, msg, kwargs):
+        session_id = _session_id_var.get()
+        kwargs.setdefault("extra", {})["session_id"] = session_id
+        return f"[session={session_id}] {msg}", kwargs
+
 
 logger = logging.getLogger(__name__)
+session_logger = SessionLoggerAdapter(logger, {})
+
+# Settings are fixed for the process lifetime
+SETTINGS = get_settings()
+
+# Static reply to text frames, encoded once at import time
+_TEXT_COMMAND_REPLY = json.dumps({
+    "type": "info",
+    "message": "Text commands not yet implemented"
+})
+
+# Welcome message pre-encoded around the session ID, which is spliced in
+# per connection as a JSON string
+_WELCOME_PREFIX = '{"type": "session_created", "session_id": '
+_WELCOME_SUFFIX = ', "message": "Session created successfully"}'
+
+# Generic 500 body pre-encoded around the exception type name
+_ERROR_PREFIX = '{"error": "Internal server error", "message": "An unexpected error occurred", "type": '
+_ERROR_SUFFIX = '}'
 
 
 @asynccontextmanager
@@ -31,29 +66,37 @@ async def lifespan(app: FastAPI):
     Application lifespan manager with ServiceLifecycleManager.
     
     Senior approach: Use DI container для управления всеми сервисами.
+    The container is imported lazily: it pulls in the ML service modules,
+    which should not be loaded until the application actually starts.
     """
+    from app.container import ServiceLifecycleManager, container
+    
     # Startup
     logger.info("Starting Speech-to-Text service with DI container...")
     
-    global lifecycle_manager, websocket_handler
+    global lifecycle_manager
     
     try:
         # Initialize all services via ServiceLifecycleManager
         lifecycle_manager = ServiceLifecycleManager()
         async with lifecycle_manager:
-            # Get WebSocket handler from container
-            from app.container import container
-            websocket_handler = container.websocket_handler()
+            # Bind WebSocket handler from container to the app
+            app.state.websocket_handler = container.websocket_handler()
             
+            # Models are loaded eagerly above, so traffic can be accepted now
+            app.state.ready = True
             logger.info("All services started via DI container")
             
             yield
             
+            app.state.ready = False
+            app.state.websocket_handler = None
+            
         # ServiceLifecycleManager handles cleanup automatically via __aexit__
         logger.info("All services stopped via DI container")
         
     except Exception as e:
-        logger.error(f"Service lifecycle error: {e}", exc_info=True)
+        logger.error("Service lifecycle error: %s", e, exc_info=True)
         raise
 
 
@@ -76,7 +119,12 @@ def create_app() -> FastAPI:
         redoc_url="/redoc"
     )
     
-    # Add CORS middleware
+    # WebSocket handler is bound by lifespan once services are started
+    app.state.websocket_handler = None
+    app.state.ready = False
+    
+    # Add CORS middleware (HTTP only: Starlette's CORSMiddleware hands
+    # websocket scopes straight to the app, so /ws upgrades skip CORS work)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_origins,
@@ -96,6 +144,16 @@ def create_app() -> FastAPI:
 # Create the FastAPI app
 app = create_app()
 
+# Static service information served by the root endpoint
+_SERVICE_INFO = {
+    "service": SETTINGS.app_name,
+    "version": SETTINGS.app_version,
+    "description": "Real-time Speech-to-Text service",
+    "docs_url": "/docs",
+    "health_check": "/health",
+    "websocket_endpoint": "/ws"
+}
+
 
 @app.get("/")
 async def root():
@@ -105,16 +163,7 @@ async def root():
     Returns:
         Basic service information
     """
-    settings = get_settings()
-    
-    return {
-        "service": settings.app_name,
-        "version": settings.app_version,
-        "description": "Real-time Speech-to-Text service",
-        "docs_url": "/docs",
-        "health_check": "/health",
-        "websocket_endpoint": "/ws"
-    }
+    return _SERVICE_INFO
 
 
 @app.websocket("/ws")
@@ -125,12 +174,16 @@ async def websocket_endpoint(websocket: WebSocket):
     Args:
         websocket: WebSocket connection
     """
-    global websocket_handler
+    websocket_handler = websocket.app.state.websocket_handler
     
     if not websocket_handler:
         await websocket.close(code=1003, reason="Service not ready")
         return
     
+    # Resolve handler components once per connection
+    session_manager = websocket_handler.session_manager
+    websocket_manager = websocket_handler.websocket_manager
+    
     session_id = None
     
     try:
@@ -139,55 +192,49 @@ async def websocket_endpoint(websocket: WebSocket):
         logger.info("WebSocket connection accepted")
         
         # Create session
-        session_id = await websocket_handler.session_manager.create_session()
-        await websocket_handler.websocket_manager.add_connection(session_id, websocket)
+        session_id = await session_manager.create_session()
+        await websocket_manager.add_connection(session_id, websocket)
         
-        logger.info(f"Session created: {session_id}")
+        _session_id_var.set(session_id)
+        session_logger.info("Session created")
         
         # Send welcome message
-        await websocket.send_json({
-            "type": "session_created",
-            "session_id": session_id,
-            "message": "Session created successfully"
-        })
+        await websocket.send_text(_WELCOME_PREFIX + json.dumps(session_id) + _WELCOME_SUFFIX)
+        
+        # Handle WebSocket messages.
+        # Audio frames are the hot path: check for bytes first so each
+        # frame costs a single dict lookup before being dispatched.
+        receive = websocket.receive
+        handle_audio_data = websocket_handler.handle_audio_data
         
-        # Handle WebSocket messages
         while True:
-            # Receive message
-            message = await websocket.receive()
+            message = await receive()
             
-            if message["type"] == "websocket.receive":
-                if "bytes" in message:
-                    # Handle audio data
-                    audio_data = message["bytes"]
-                    await websocket_handler.handle_audio_data(websocket, audio_data, session_id)
-                    
-                elif "text" in message:
-                    # Handle text commands (future extensibility)
-                    await websocket.send_json({
-                        "type": "info",
-                        "message": "Text commands not yet implemented"
-                    })
+            audio_data = message.get("bytes")
+            if audio_data is not None:
+                await handle_audio_data(websocket, audio_data, session_id)
+                continue
             
-            elif message["type"] == "websocket.disconnect":
+            if message["type"] == "websocket.disconnect":
                 break
+            
+            if message.get("text") is not None:
+                # Handle text commands (future extensibility)
+                await websocket.send_text(_TEXT_COMMAND_REPLY)
                 
     except WebSocketDisconnect:
-        logger.info(f"WebSocket disconnected for session: {session_id}")
+        session_logger.info("WebSocket disconnected")
         
     except Exception as e:
-        logger.error(f"WebSocket error for session {session_id}: {e}")
+        session_logger.error("WebSocket error: %s", e)
         await websocket.close(code=1011, reason=f"Internal error: {str(e)}")
         
     finally:
         # Clean up session
-        if session_id and websocket_handler:
-            try:
-                await websocket_handler.websocket_manager.remove_connection(session_id)
-                await websocket_handler.session_manager.end_session(session_id)
-                logger.info(f"Session cleaned up: {session_id}")
-            except Exception as e:
-                logger.error(f"Error cleaning up session {session_id}: {e}")
+        if session_id:
+            # Also drops the handler's per-session buffers and templates
+            await websocket_handler.handle_disconnect(session_id)
+            session_logger.info("Session cleaned up")
 
 
 @app.exception_handler(Exception)
@@ -202,22 +249,19 @@ async def global_exception_handler(request, exc):
     Returns:
         JSON error response
     """
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     
-    return JSONResponse(
+    return Response(
+        content=_ERROR_PREFIX + json.dumps(type(exc).__name__) + _ERROR_SUFFIX,
         status_code=500,
-        content={
-            "error": "Internal server error",
-            "message": "An unexpected error occurred",
-            "type": type(exc).__name__
-        }
+        media_type="application/json"
     )
 
 
 if __name__ == "__main__":
     import uvicorn
     
-    settings = get_settings()
+    settings = SETTINGS
     
     # Configure logging
     logging.basicConfig(
@@ -225,11 +269,32 @@ if __name__ == "__main__":
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     
+    # Prefer uvloop/httptools event loop and HTTP parser when available
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+    
     # Run the application
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        log_level=settings.logging.level.lower()
+        workers=settings.workers,
+        log_level=settings.logging.level.lower(),
+        loop=loop,
+        http=http,
+        ws="websockets",
+        ws_max_size=settings.websocket.max_message_size,
+        ws_ping_interval=settings.websocket.ping_interval or None,
+        ws_ping_timeout=settings.websocket.ping_timeout or None,
+        backlog=2048
     )
\ No newline at end of file
@@ -8,11 +8,18 @@ for data validation, serialization, and type safety.
 from .audio import (
     AudioChunkModel,
     ProcessingResultModel,
-    WebSocketResponseModel
+    WebSocketResponseModel,
+    processing_result_payload
 )
+from .speech import SpeechDetectedPayload
+from .transcript import TranscriptSegment, TranscriptWord
 
 __all__ = [
     "AudioChunkModel",
     "ProcessingResultModel", 
-    "WebSocketResponseModel"
+    "WebSocketResponseModel",
+    "processing_result_payload",
+    "SpeechDetectedPayload",
+    "TranscriptSegment",
+    "TranscriptWord"
 ]
\ No newline at end of file
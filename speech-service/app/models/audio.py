@@ -5,7 +5,8 @@ This module contains data models for audio processing pipeline,
 following Clean Architecture principles with strict type validation.
 """
 
-from typing import Dict, Any, Optional
+from typing import Any, ClassVar, Dict, FrozenSet, Literal, Optional, Tuple, Union
+from typing_extensions import Annotated
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 import uuid
 from datetime import datetime
@@ -22,7 +23,7 @@ class AudioChunkModel(BaseModel):
     Attributes:
         session_id: Unique identifier for the WebSocket session
         chunk_id: Sequential identifier for the chunk within session
-        data: Raw audio bytes data
+        data: Raw audio bytes, or a zero-copy memoryview over them
         timestamp: When the chunk was received
         sample_rate: Audio sample rate in Hz (optional)
         channels: Number of audio channels (optional)
@@ -32,7 +33,8 @@ class AudioChunkModel(BaseModel):
         ..., 
         description="Unique session identifier",
         min_length=1,
-        max_length=64
+        max_length=64,
+        strict=True  # str only, no coercion from bytes
     )
     
     chunk_id: int = Field(
@@ -41,10 +43,15 @@ class AudioChunkModel(BaseModel):
         ge=0
     )
     
-    data: bytes = Field(
+    # Audio is held by reference and never serialized: it travels as the
+    # binary WebSocket frame itself, not inside JSON payloads
+    data: Union[
+        Annotated[bytes, Field(min_length=1)],
+        Annotated[memoryview, Field(min_length=1)]
+    ] = Field(
         ..., 
         description="Raw audio data bytes",
-        min_length=1
+        exclude=True
     )
     
     timestamp: datetime = Field(
@@ -66,40 +73,37 @@ class AudioChunkModel(BaseModel):
         le=2
     )
     
-    @field_validator('session_id')
-    @classmethod
-    def validate_session_id(cls, v):
-        """Validate session_id format."""
-        if not v or not isinstance(v, str):
-            raise ValueError("session_id must be a non-empty string")
-        return v
-    
-    @field_validator('data')
-    @classmethod
-    def validate_audio_data(cls, v):
-        """Validate audio data is not empty."""
-        if not v or len(v) == 0:
-            raise ValueError("Audio data cannot be empty")
-        return v
+    # session_id/data non-emptiness and the session_id type are enforced by the
+    # min_length/strict constraints above, which pydantic-core checks natively
+    # without a Python validator
+    
+    # Documentation example, kept out of model_config so it is not
+    # carried in the core schema
+    EXAMPLE: ClassVar[Dict[str, Any]] = {
+        "session_id": "ws_session_12345",
+        "chunk_id": 0,
+        "data": b"audio_bytes_here",
+        "timestamp": "2023-12-01T12:00:00Z",
+        "sample_rate": 16000,
+        "channels": 1
+    }
     
     model_config = ConfigDict(
+        arbitrary_types_allowed=True,
         json_encoders={
-            bytes: lambda v: len(v),  # Don't serialize raw bytes in JSON
             datetime: lambda v: v.isoformat()
-        },
-        json_schema_extra={
-            "example": {
-                "session_id": "ws_session_12345",
-                "chunk_id": 0,
-                "data": b"audio_bytes_here",
-                "timestamp": "2023-12-01T12:00:00Z",
-                "sample_rate": 16000,
-                "channels": 1
-            }
         }
     )
 
 
+# Required result keys per component, with the label used in error messages
+_RESULT_REQUIRED_FIELDS: Dict[str, Tuple[str, FrozenSet[str]]] = {
+    "vad": ("VAD", frozenset({"is_speech", "confidence"})),
+    "asr": ("ASR", frozenset({"text", "confidence"})),
+    "diarization": ("Diarization", frozenset({"speakers", "segments"})),
+}
+
+
 class ProcessingResultModel(BaseModel):
     """
     Represents the result from any processing component.
@@ -132,10 +136,9 @@ class ProcessingResultModel(BaseModel):
         ge=0
     )
     
-    component: str = Field(
+    component: Literal["vad", "asr", "diarization"] = Field(
         ...,
-        description="Name of the processing component",
-        pattern=r"^(vad|asr|diarization)$"
+        description="Name of the processing component"
     )
     
     result: Dict[str, Any] = Field(
@@ -170,48 +173,74 @@ class ProcessingResultModel(BaseModel):
         """Validate result structure based on component type."""
         if info.data is None:
             return v
-        component = info.data.get('component')
         
-        if component == 'vad':
-            required_fields = {'is_speech', 'confidence'}
-            if not all(field in v for field in required_fields):
-                raise ValueError(f"VAD result must contain: {required_fields}")
-                
-        elif component == 'asr':
-            required_fields = {'text', 'confidence'}
-            if not all(field in v for field in required_fields):
-                raise ValueError(f"ASR result must contain: {required_fields}")
-                
-        elif component == 'diarization':
-            required_fields = {'speakers', 'segments'}
-            if not all(field in v for field in required_fields):
-                raise ValueError(f"Diarization result must contain: {required_fields}")
+        required = _RESULT_REQUIRED_FIELDS.get(info.data.get('component'))
+        if required is not None and not required[1].issubset(v.keys()):
+            raise ValueError(f"{required[0]} result must contain: {set(required[1])}")
         
         return v
     
+    EXAMPLE: ClassVar[Dict[str, Any]] = {
+        "session_id": "ws_session_12345",
+        "chunk_id": 0,
+        "component": "vad",
+        "result": {
+            "is_speech": True,
+            "confidence": 0.95,
+            "speech_segments": [[0.1, 2.3]]
+        },
+        "processing_time_ms": 15.2,
+        "timestamp": "2023-12-01T12:00:00Z",
+        "success": True,
+        "error": None
+    }
+    
     model_config = ConfigDict(
         json_encoders={
             datetime: lambda v: v.isoformat()
-        },
-        json_schema_extra={
-            "example": {
-                "session_id": "ws_session_12345",
-                "chunk_id": 0,
-                "component": "vad",
-                "result": {
-                    "is_speech": True,
-                    "confidence": 0.95,
-                    "speech_segments": [[0.1, 2.3]]
-                },
-                "processing_time_ms": 15.2,
-                "timestamp": "2023-12-01T12:00:00Z",
-                "success": True,
-                "error": None
-            }
         }
     )
 
 
+def processing_result_payload(
+    session_id: str,
+    chunk_id: int,
+    component: str,
+    result: Dict[str, Any],
+    processing_time_ms: float,
+    success: bool = True
+) -> Dict[str, Any]:
+    """
+    Build the event payload of a ProcessingResultModel directly.
+    
+    For results produced in-process by a service, whose shape is already
+    known, this skips model validation and the model_dump() deep copy
+    while producing the same keys.
+    
+    Args:
+        session_id: Session identifier from original audio chunk
+        chunk_id: Chunk identifier from original audio chunk
+        component: Name of the processing component
+        result: Component-specific result data (kept by reference)
+        processing_time_ms: Time taken to process in milliseconds
+        success: Whether processing succeeded; failures carry their
+            error details inside result
+        
+    Returns:
+        Dict equivalent to ProcessingResultModel(...).model_dump()
+    """
+    return {
+        "session_id": session_id,
+        "chunk_id": chunk_id,
+        "component": component,
+        "result": result,
+        "processing_time_ms": processing_time_ms,
+        "timestamp": datetime.utcnow(),
+        "success": success,
+        "error": None
+    }
+
+
 class WebSocketResponseModel(BaseModel):
     """
     Final response model sent back to WebSocket client.
@@ -270,33 +299,32 @@ class WebSocketResponseModel(BaseModel):
         description="UTC timestamp when response was created"
     )
     
+    EXAMPLE: ClassVar[Dict[str, Any]] = {
+        "session_id": "ws_session_12345",
+        "chunk_id": 0,
+        "vad": {
+            "is_speech": True,
+            "confidence": 0.95
+        },
+        "transcript": "Hello world this is a test",
+        "speakers": {
+            "speaker_count": 1,
+            "segments": [
+                {
+                    "speaker": "SPEAKER_00",
+                    "start": 0.1,
+                    "end": 2.3,
+                    "text": "Hello world this is a test"
+                }
+            ]
+        },
+        "processing_complete": True,
+        "total_processing_time_ms": 245.7,
+        "timestamp": "2023-12-01T12:00:01Z"
+    }
+    
     model_config = ConfigDict(
         json_encoders={
             datetime: lambda v: v.isoformat()
-        },
-        json_schema_extra={
-            "example": {
-                "session_id": "ws_session_12345",
-                "chunk_id": 0,
-                "vad": {
-                    "is_speech": True,
-                    "confidence": 0.95
-                },
-                "transcript": "Hello world this is a test",
-                "speakers": {
-                    "speaker_count": 1,
-                    "segments": [
-                        {
-                            "speaker": "SPEAKER_00",
-                            "start": 0.1,
-                            "end": 2.3,
-                            "text": "Hello world this is a test"
-                        }
-                    ]
-                },
-                "processing_complete": True,
-                "total_processing_time_ms": 245.7,
-                "timestamp": "2023-12-01T12:00:01Z"
-            }
         }
     )
\ No newline at end of file
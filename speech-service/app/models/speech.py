@@ -0,0 +1,54 @@
+"""
+Payload of speech_detected events.
+
+ASR and diarization workers both consume every speech_detected event. The
+VAD worker builds one frozen payload per event and attaches it as
+data["meta"], so consumers read attributes instead of repeating dict
+lookups and fallbacks; events without it are unpacked from the dict.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..interfaces.events import Event
+
+
+@dataclass(frozen=True)
+class SpeechDetectedPayload:
+    """
+    Audio and identifiers carried by a speech_detected event.
+    
+    audio_data is raw PCM bytes, a memoryview or a shared AudioBuffer, and
+    is None when the event carried no audio. One instance is shared by all
+    consumers of the event, hence frozen.
+    """
+    __slots__ = ("session_id", "chunk_id", "audio_data", "sample_rate")
+    
+    session_id: str
+    chunk_id: int
+    audio_data: Any
+    sample_rate: int
+
+    @classmethod
+    def from_event(cls, event: "Event") -> "SpeechDetectedPayload":
+        """Return the attached payload, or unpack the legacy dict formats."""
+        data = event.data
+        meta = data.get("meta")
+        if meta is not None:
+            return meta
+        
+        audio_data = data.get("data")
+        sample_rate = data.get("sample_rate", 16000)
+        
+        if not audio_data:
+            result_data = data.get("result", {})
+            audio_data = result_data.get("audio_data")
+            sample_rate = result_data.get("sample_rate", 16000)
+        
+        return cls(
+            session_id=data.get("session_id", "unknown"),
+            chunk_id=data.get("chunk_id", -1),
+            audio_data=audio_data or None,
+            sample_rate=sample_rate
+        )
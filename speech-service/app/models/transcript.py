@@ -0,0 +1,54 @@
+"""
+Transcript data structures produced by the ASR service.
+
+Segments and words are created in bulk for every transcribed chunk, so they
+are dataclasses rather than dicts or Pydantic models: no validation, and
+words (the most numerous) declare __slots__ so they carry no per-object
+__dict__. They are converted to plain dicts only when a message is
+serialized.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class TranscriptWord:
+    """A single recognized word with timing."""
+    __slots__ = ("word", "start", "end", "confidence")
+    
+    word: str
+    start: float
+    end: float
+    confidence: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the JSON wire format."""
+        return {
+            "word": self.word,
+            "start": self.start,
+            "end": self.end,
+            "confidence": self.confidence
+        }
+
+
+@dataclass
+class TranscriptSegment:
+    """A transcribed segment; words are only present with word timestamps."""
+    start: float
+    end: float
+    text: str
+    confidence: float
+    words: Optional[List[TranscriptWord]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the JSON wire format (words omitted when absent)."""
+        data = {
+            "start": self.start,
+            "end": self.end,
+            "text": self.text,
+            "confidence": self.confidence
+        }
+        if self.words:
+            data["words"] = [word.to_dict() for word in self.words]
+        return data
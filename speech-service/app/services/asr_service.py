@@ -6,19 +6,83 @@ following Clean Architecture principles with dependency injection.
 """
 
 import asyncio
+import hashlib
 import time
 import numpy as np
 import tempfile
 import os
-from typing import Dict, Any, Optional, List
+import threading
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Any, Optional, List, Tuple, Union
 import structlog
 from pathlib import Path
 
-from ..interfaces.services import IASRService, ASRServiceError
+from ..interfaces.services import ASRServiceError
 from ..config import ASRSettings
+from ..models.transcript import TranscriptSegment, TranscriptWord
+from ..utils.pcm import AudioBuffer, as_float32
 
 
-class FasterWhisperASRService(IASRService):
+# Scratch buffers are sized in multiples of this many samples (0.25 s at
+# 16 kHz) so chunks of slightly different lengths reuse the same buffer
+_SCRATCH_GRANULE_SAMPLES = 4096
+
+_whisper_load_lock = threading.Lock()
+
+# Whisper's feature extractor assumes 16 kHz input
+_WHISPER_SAMPLE_RATE = 16000
+
+
+@lru_cache(maxsize=8)
+def _resampler(orig_sr: int):
+    """Build (once per input rate) a windowed-sinc resampler to 16 kHz."""
+    import torchaudio
+    
+    return torchaudio.transforms.Resample(orig_freq=orig_sr, new_freq=_WHISPER_SAMPLE_RATE)
+
+
+def _to_whisper_rate(audio_np: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Resample audio to 16 kHz; 16 kHz input is returned unchanged."""
+    if sample_rate == _WHISPER_SAMPLE_RATE:
+        return audio_np
+    
+    import torch
+    
+    with torch.inference_mode():
+        return _resampler(sample_rate)(torch.from_numpy(audio_np)).numpy()
+
+
+@lru_cache(maxsize=4)
+def _cached_whisper_model(
+    model_size: str,
+    compute_type: str,
+    model_path: Optional[str],
+    device: str,
+    num_workers: int = 1
+):
+    """
+    Load a WhisperModel once per process for a given configuration.
+    
+    Service instances (the container builds one per consumer) and restarts
+    within the process share the same weights instead of reloading them.
+    num_workers model replicas let that many executor threads decode in
+    parallel; CTranslate2 releases the GIL while decoding.
+    """
+    from faster_whisper import WhisperModel
+    
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        download_root=model_path,
+        num_workers=num_workers
+    )
+
+
+class FasterWhisperASRService:
     """
     Faster-Whisper ASR service implementation.
     
@@ -44,6 +108,37 @@ class FasterWhisperASRService(IASRService):
         self.best_of = config.best_of
         self.temperature = config.temperature
         self.compute_type = config.compute_type
+        self.quantize = config.quantize
+        
+        # Dedicated pool so inference never queues behind unrelated blocking
+        # work in the loop's default executor; created in initialize() and
+        # shut down in cleanup(), so the service can be restarted
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Decoding options are fixed per service; only the language varies,
+        # so one kwargs dict per language is built once and reused
+        self._base_transcribe_kwargs: Dict[str, Any] = {
+            "beam_size": self.beam_size,
+            "best_of": self.best_of,
+            "temperature": self.temperature
+        }
+        self._transcribe_kwargs_by_lang: Dict[Optional[str], Dict[str, Any]] = {}
+        
+        # Reusable float32 scratch buffers, one per in-flight transcription
+        self._scratch_buffers: List[np.ndarray] = []
+        self._max_idle_scratch = config.max_workers * 2
+        
+        # Recent transcriptions keyed by (audio digest, sample rate, language);
+        # only touched on the event loop, so no lock is needed
+        self._result_cache: "OrderedDict[Tuple[bytes, int, Optional[str]], Dict[str, Any]]" = OrderedDict()
+        self._result_cache_size = config.result_cache_size
+        
+        # Optional micro-batching: chunks arriving within batch_window share
+        # one executor job instead of paying a thread handoff each
+        self.batch_window = config.batch_window_ms / 1000.0
+        self.max_batch_size = config.max_batch_size
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
         
         self.logger.info(
             "ASR service configured",
@@ -63,13 +158,23 @@ class FasterWhisperASRService(IASRService):
         try:
             self.logger.info("Initializing Faster-Whisper ASR model")
             
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    thread_name_prefix="asr"
+                )
+            
             # Load Faster-Whisper model in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             self.model = await loop.run_in_executor(
-                None, 
+                self._executor, 
                 self._load_whisper_model
             )
             
+            if self.batch_window > 0:
+                self._batch_queue = asyncio.Queue()
+                self._batch_task = asyncio.create_task(self._batch_loop())
+            
             self.logger.info("Faster-Whisper ASR model loaded successfully")
             
         except Exception as e:
@@ -79,41 +184,71 @@ class FasterWhisperASRService(IASRService):
     def _load_whisper_model(self):
         """Load Faster-Whisper model (sync operation)."""
         try:
-            from faster_whisper import WhisperModel
-            
-            # Load the model
-            model = WhisperModel(
-                self.model_size,
-                device="auto",  # Use CUDA if available, otherwise CPU
-                compute_type=self.compute_type,
-                download_root=self.config.model_path
-            )
+            if self.compute_type is None:
+                self.compute_type = self._default_compute_type()
             
-            return model
+            # Serialized so concurrent first loads don't build the model twice
+            with _whisper_load_lock:
+                return _cached_whisper_model(
+                    self.model_size,
+                    self.compute_type,
+                    self.config.model_path,
+                    "auto",  # Use CUDA if available, otherwise CPU
+                    self.config.max_workers
+                )
             
         except Exception as e:
             raise ASRServiceError(f"Failed to load Faster-Whisper model: {e}")
     
+    @property
+    def is_initialized(self) -> bool:
+        """Whether the model is loaded and transcribe() can be called."""
+        return self.model is not None
+    
+    def _default_compute_type(self) -> str:
+        """
+        Pick a compute type for the device the model will load on.
+        
+        int8 weights halve memory traffic and use int8 GEMM kernels; upstream
+        benchmarks put the WER cost on Whisper small/medium under 1%.
+        """
+        if not self.quantize:
+            return "default"  # Keep the precision the model was converted with
+        
+        import ctranslate2
+        
+        return "int8_float16" if ctranslate2.get_cuda_device_count() > 0 else "int8"
+    
     async def transcribe(
         self, 
-        audio_data: bytes, 
+        audio_data: Union[bytes, memoryview, AudioBuffer], 
         sample_rate: int = 16000,
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        on_segment: Optional[Callable[[TranscriptSegment], Awaitable[None]]] = None,
+        include_all_language_probs: bool = False
     ) -> Dict[str, Any]:
         """
         Transcribe speech audio to text.
         
         Args:
-            audio_data: Raw audio bytes containing speech
+            audio_data: Raw PCM containing speech, as bytes, a memoryview
+                (used without copying) or an AudioBuffer shared with other
+                services
             sample_rate: Audio sample rate in Hz
             language: Optional language hint for transcription
+            on_segment: Optional coroutine awaited with each segment, in order,
+                as soon as Faster-Whisper yields it. Streamed chunks run in
+                their own executor job and bypass micro-batching
+            include_all_language_probs: Also return the per-language
+                probabilities (~100 entries); off by default to keep replies small
             
         Returns:
             Dictionary containing:
                 - text: str transcribed text
                 - confidence: float confidence score (0-1)
-                - segments: List of word-level segments with timing
+                - segments: List of TranscriptSegment with timing
                 - language: str detected/used language
+                - all_language_probs: only if include_all_language_probs
                 
         Raises:
             ASRServiceError: If transcription fails
@@ -123,46 +258,235 @@ class FasterWhisperASRService(IASRService):
         
         start_time = time.time()
         
+        # Use provided language or config default
+        target_language = language or self.language
+        
+        cache_key = None
+        if self._result_cache_size:
+            # Silence, wake phrases and repeated commands recur across sessions
+            raw = audio_data.data if isinstance(audio_data, AudioBuffer) else audio_data
+            cache_key = (hashlib.blake2b(raw, digest_size=16).digest(), sample_rate, target_language)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                transcription_result = self._copy_result(cached)
+                if on_segment is not None:
+                    for segment in transcription_result["segments"]:
+                        await on_segment(segment)
+                if not include_all_language_probs:
+                    transcription_result.pop("all_language_probs", None)
+                return transcription_result
+        
+        # A shared AudioBuffer carries its own conversion; plain bytes are
+        # converted into a pooled scratch buffer
+        scratch = None
+        if not isinstance(audio_data, AudioBuffer):
+            scratch = self._acquire_scratch(len(audio_data) // 2)
+        
         try:
-            # Convert bytes to numpy array
-            audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
-            audio_np = audio_np / 32768.0  # Normalize to [-1, 1]
-            
-            # Use provided language or config default
-            target_language = language or self.language
-            
-            # Run transcription in executor
-            loop = asyncio.get_event_loop()
-            transcription_result = await loop.run_in_executor(
-                None,
-                self._run_transcription,
-                audio_np,
-                sample_rate,
-                target_language
-            )
-            
-            processing_time = (time.time() - start_time) * 1000
-            
-            self.logger.debug(
-                "ASR transcription completed",
-                text_length=len(transcription_result["text"]),
-                language=transcription_result["language"],
-                confidence=transcription_result["confidence"],
-                processing_time_ms=processing_time,
-                audio_duration_ms=len(audio_np) / sample_rate * 1000
-            )
-            
-            return transcription_result
+            audio_np = as_float32(audio_data, out=scratch)
             
+            # Run transcription in executor, batched with concurrent chunks if
+            # enabled. A batch job returns whole results, so streaming callers
+            # cannot share one and always get their own job.
+            loop = asyncio.get_running_loop()
+            if on_segment is not None:
+                transcription_result = await self._transcribe_streaming(
+                    loop, audio_np, sample_rate, target_language, on_segment
+                )
+            elif self._batch_queue is not None:
+                # The batch loop recycles the scratch buffer once its job is
+                # done with it; if the service stops mid-job it is dropped
+                future = loop.create_future()
+                self._batch_queue.put_nowait((audio_np, sample_rate, target_language, future, scratch))
+                scratch = None
+                transcription_result = await future
+            else:
+                transcription_result = await loop.run_in_executor(
+                    self._executor,
+                    self._run_transcription,
+                    audio_np,
+                    sample_rate,
+                    target_language
+                )
         except Exception as e:
+            # Still set only if the job never started or has already raised
+            if scratch is not None:
+                self._release_scratch(scratch)
             self.logger.error("ASR transcription failed", error=str(e))
             raise ASRServiceError(f"ASR transcription failed: {e}")
+        
+        # Segments are fully consumed in the executor, so the buffer is free
+        # again. On cancellation the executor may still be reading it, so it
+        # is dropped rather than returned.
+        if scratch is not None:
+            self._release_scratch(scratch)
+        
+        processing_time = (time.time() - start_time) * 1000
+        
+        self.logger.debug(
+            "ASR transcription completed",
+            text_length=len(transcription_result["text"]),
+            language=transcription_result["language"],
+            confidence=transcription_result["confidence"],
+            processing_time_ms=processing_time,
+            audio_duration_ms=len(audio_np) / sample_rate * 1000
+        )
+        
+        if cache_key is not None:
+            self._result_cache[cache_key] = self._copy_result(transcription_result)
+            if len(self._result_cache) > self._result_cache_size:
+                self._result_cache.popitem(last=False)
+        
+        if not include_all_language_probs:
+            transcription_result.pop("all_language_probs", None)
+        
+        return transcription_result
+    
+    @staticmethod
+    def _copy_result(transcription_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a transcription so cached entries are never mutated by callers."""
+        result = dict(transcription_result)
+        result["segments"] = list(transcription_result["segments"])
+        return result
+    
+    def _acquire_scratch(self, num_samples: int) -> np.ndarray:
+        """Take a scratch buffer holding at least num_samples floats."""
+        buffers = self._scratch_buffers
+        # Most recently released first; undersized buffers stay for smaller chunks
+        for index in range(len(buffers) - 1, -1, -1):
+            if len(buffers[index]) >= num_samples:
+                return buffers.pop(index)
+        
+        size = -(-num_samples // _SCRATCH_GRANULE_SAMPLES) * _SCRATCH_GRANULE_SAMPLES
+        return np.empty(max(size, _SCRATCH_GRANULE_SAMPLES), dtype=np.float32)
+    
+    def _release_scratch(self, scratch: np.ndarray) -> None:
+        """Return a scratch buffer, keeping at most a few idle ones."""
+        buffers = self._scratch_buffers
+        if len(buffers) < self._max_idle_scratch:
+            buffers.append(scratch)
+        else:
+            # Full: keep the larger buffer so big chunks stay allocation-free
+            smallest = min(range(len(buffers)), key=lambda i: len(buffers[i]))
+            if len(buffers[smallest]) < len(scratch):
+                buffers[smallest] = scratch
+    
+    async def _transcribe_streaming(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        audio_np: np.ndarray,
+        sample_rate: int,
+        language: Optional[str],
+        on_segment: Callable[[TranscriptSegment], Awaitable[None]]
+    ) -> Dict[str, Any]:
+        """Run one transcription, forwarding segments while decoding continues."""
+        segments: asyncio.Queue = asyncio.Queue()
+        
+        def push_segment(segment: TranscriptSegment) -> None:
+            loop.call_soon_threadsafe(segments.put_nowait, segment)
+        
+        future = loop.run_in_executor(
+            self._executor,
+            self._run_transcription,
+            audio_np,
+            sample_rate,
+            language,
+            push_segment
+        )
+        # Scheduled after every pushed segment, so it always arrives last
+        future.add_done_callback(lambda _: segments.put_nowait(None))
+        
+        while (segment := await segments.get()) is not None:
+            try:
+                await on_segment(segment)
+            except Exception as e:
+                # Streaming is best-effort; keep draining so the final result
+                # (and the scratch buffer) is only released after decoding ends
+                self.logger.warning("ASR segment callback failed", error=str(e))
+        
+        return await future
+    
+    async def _batch_loop(self) -> None:
+        """Collect queued transcriptions and run each batch as one executor job."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + self.batch_window
+            
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Callers that gave up (timeout/cancel) are not transcribed
+            batch = [item for item in batch if not item[3].done()]
+            if not batch:
+                continue
+            
+            try:
+                outcomes = await loop.run_in_executor(
+                    self._executor,
+                    self._run_transcription_batch,
+                    [item[:3] for item in batch]
+                )
+            except asyncio.CancelledError:
+                # The job may still be reading the audio, so the scratch
+                # buffers are dropped rather than recycled
+                for _, _, _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(ASRServiceError("ASR service stopped"))
+                raise
+            except Exception as e:
+                outcomes = [(None, e)] * len(batch)
+            
+            for *_, scratch in batch:
+                if scratch is not None:
+                    self._release_scratch(scratch)
+            
+            for (_, _, _, future, _), (result, error) in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+    
+    def _run_transcription_batch(
+        self,
+        batch: List[Tuple[np.ndarray, int, Optional[str]]]
+    ) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        Transcribe a micro-batch of chunks in one executor job (sync operation).
+        
+        Whisper decodes each chunk independently, so chunks from different
+        sessions are never mixed; only the dispatch is shared.
+        
+        Args:
+            batch: (audio_np, sample_rate, language) per chunk
+            
+        Returns:
+            (result, error) per chunk, in batch order
+        """
+        outcomes = []
+        for audio_np, sample_rate, language in batch:
+            try:
+                outcomes.append((self._run_transcription(audio_np, sample_rate, language), None))
+            except Exception as e:
+                outcomes.append((None, e))
+        return outcomes
     
     def _run_transcription(
         self, 
         audio_np: np.ndarray, 
         sample_rate: int,
-        language: Optional[str]
+        language: Optional[str],
+        on_segment: Optional[Callable[[TranscriptSegment], None]] = None
     ) -> Dict[str, Any]:
         """
         Run transcription on audio array (sync operation).
@@ -171,54 +495,61 @@ class FasterWhisperASRService(IASRService):
             audio_np: Audio data as numpy array
             sample_rate: Audio sample rate
             language: Target language for transcription
+            on_segment: Optional callback invoked (on this thread) with each
+                segment as it is decoded
             
         Returns:
             Transcription results
         """
         try:
+            # Other rates would be decoded as if they were 16 kHz
+            audio_np = _to_whisper_rate(audio_np, sample_rate)
+            
+            kwargs = self._transcribe_kwargs_by_lang.get(language)
+            if kwargs is None:
+                kwargs = {**self._base_transcribe_kwargs, "language": language}
+                self._transcribe_kwargs_by_lang[language] = kwargs
+            
             # Transcribe with Faster-Whisper
-            segments, info = self.model.transcribe(
-                audio_np,
-                beam_size=self.beam_size,
-                best_of=self.best_of,
-                temperature=self.temperature,
-                language=language
-            )
+            segments, info = self.model.transcribe(audio_np, **kwargs)
             
-            # Extract text and segment information
-            full_text = ""
+            # Extract text and segment information; text is joined once at the end.
+            # Faster-Whisper's Segment/Word always define avg_logprob, words and
+            # probability, so fields are read directly rather than via getattr.
+            text_parts: List[str] = []
             segment_list = []
+            append_text = text_parts.append
+            append_segment = segment_list.append
             total_confidence = 0.0
-            segment_count = 0
             
             for segment in segments:
                 segment_text = segment.text.strip()
-                if segment_text:
-                    full_text += segment_text + " "
-                    
-                    segment_data = {
-                        "start": segment.start,
-                        "end": segment.end,
-                        "text": segment_text,
-                        "confidence": getattr(segment, 'avg_logprob', 0.0)
-                    }
-                    
-                    # Add word-level information if available
-                    if hasattr(segment, 'words') and segment.words:
-                        word_list = []
-                        for word in segment.words:
-                            word_data = {
-                                "word": word.word,
-                                "start": word.start,
-                                "end": word.end,
-                                "confidence": getattr(word, 'probability', 0.0)
-                            }
-                            word_list.append(word_data)
-                        segment_data["words"] = word_list
-                    
-                    segment_list.append(segment_data)
-                    total_confidence += segment_data["confidence"]
-                    segment_count += 1
+                if not segment_text:
+                    continue
+                
+                append_text(segment_text)
+                confidence = segment.avg_logprob
+                
+                # Word-level information is only present with word_timestamps
+                words = segment.words
+                segment_data = TranscriptSegment(
+                    segment.start,
+                    segment.end,
+                    segment_text,
+                    confidence,
+                    [
+                        TranscriptWord(word.word, word.start, word.end, word.probability)
+                        for word in words
+                    ] if words else None
+                )
+                
+                append_segment(segment_data)
+                total_confidence += confidence
+                
+                if on_segment is not None:
+                    on_segment(segment_data)
+            
+            segment_count = len(segment_list)
             
             # Calculate average confidence
             avg_confidence = total_confidence / segment_count if segment_count > 0 else 0.0
@@ -226,7 +557,7 @@ class FasterWhisperASRService(IASRService):
             # Convert log probabilities to confidence scores (0-1)
             confidence_score = max(0.0, min(1.0, (avg_confidence + 5.0) / 5.0))
             
-            full_text = full_text.strip()
+            full_text = " ".join(text_parts)
             
             return {
                 "text": full_text,
@@ -245,10 +576,27 @@ class FasterWhisperASRService(IASRService):
         """Clean up resources and models."""
         try:
             if self.model:
-                # Clear model from memory
-                del self.model
+                # Drop our reference only; the weights stay in the shared
+                # model cache for other instances
                 self.model = None
             
+            if self._batch_task is not None:
+                self._batch_task.cancel()
+                await asyncio.gather(self._batch_task, return_exceptions=True)
+                self._batch_task = None
+            
+            if self._batch_queue is not None:
+                while not self._batch_queue.empty():
+                    future = self._batch_queue.get_nowait()[3]
+                    if not future.done():
+                        future.set_exception(ASRServiceError("ASR service stopped"))
+                self._batch_queue = None
+            
+            self._result_cache.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            
             self.logger.info("ASR service cleaned up")
             
         except Exception as e:
@@ -272,7 +620,7 @@ class FasterWhisperASRService(IASRService):
         }
 
 
-class MockASRService(IASRService):
+class MockASRService:
     """
     Mock ASR service for testing and development.
     
@@ -302,16 +650,20 @@ class MockASRService(IASRService):
     
     async def transcribe(
         self, 
-        audio_data: bytes, 
+        audio_data: Union[bytes, memoryview, AudioBuffer], 
         sample_rate: int = 16000,
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        on_segment: Optional[Callable[[TranscriptSegment], Awaitable[None]]] = None,
+        include_all_language_probs: bool = False
     ) -> Dict[str, Any]:
         """Mock transcription."""
         if not self.is_initialized:
             raise ASRServiceError("Mock ASR service not initialized")
         
         # Mock logic: select text based on audio data hash
-        audio_hash = hash(audio_data) % len(self.mock_texts)
+        # crc32 is C-speed and, unlike hash(), stable across processes
+        raw = audio_data.data if isinstance(audio_data, AudioBuffer) else audio_data
+        audio_hash = zlib.crc32(raw) % len(self.mock_texts)
         mock_text = self.mock_texts[audio_hash]
         
         # Mock confidence based on audio length
@@ -330,15 +682,19 @@ class MockASRService(IASRService):
             word_start = current_time
             word_end = current_time + word_duration
             
-            segments.append({
-                "start": word_start,
-                "end": word_end,
-                "text": word,
-                "confidence": confidence + (i * 0.01)  # Slight variation
-            })
+            segments.append(TranscriptSegment(
+                start=word_start,
+                end=word_end,
+                text=word,
+                confidence=confidence + (i * 0.01)  # Slight variation
+            ))
             
             current_time = word_end
         
+        if on_segment is not None:
+            for segment in segments:
+                await on_segment(segment)
+        
         target_language = language or self.config.language or "en"
         
         self.logger.debug(
@@ -349,15 +705,18 @@ class MockASRService(IASRService):
             audio_length=audio_length
         )
         
-        return {
+        result = {
             "text": mock_text,
             "confidence": confidence,
             "segments": segments,
             "language": target_language,
             "language_probability": 0.99,
-            "duration": duration,
-            "all_language_probs": {target_language: 0.99}
+            "duration": duration
         }
+        if include_all_language_probs:
+            result["all_language_probs"] = {target_language: 0.99}
+        
+        return result
     
     async def cleanup(self) -> None:
         """Clean up mock service."""
@@ -6,20 +6,31 @@ following Clean Architecture principles with dependency injection.
 """
 
 import asyncio
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 import numpy as np
-import tempfile
-import os
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import structlog
-from pathlib import Path
-import io
+import torch
 
-from ..interfaces.services import IDiarizationService, DiarizationServiceError
+from ..interfaces.services import DiarizationServiceError
 from ..config import DiarizationSettings
+from ..utils.audio_pool import float32_buffer_pool
+from ..utils.pcm import AudioBuffer, as_float32, as_int16
 
 
-class PyAnnoteDiarizationService(IDiarizationService):
+@dataclass
+class _SessionSpeakers:
+    """Speakers seen so far in one session: global labels and unit centroids."""
+    labels: List[str] = field(default_factory=list)
+    centroids: List[np.ndarray] = field(default_factory=list)
+    counts: List[int] = field(default_factory=list)
+
+
+class PyAnnoteDiarizationService:
     """
     PyAnnote.audio diarization service implementation.
     
@@ -39,12 +50,33 @@ class PyAnnoteDiarizationService(IDiarizationService):
         
         # Model and state
         self.pipeline = None
+        self.device = torch.device("cpu")
         self.model_name = config.model_name
         self.auth_token = config.auth_token
         self.min_speakers = config.min_speakers
         self.max_speakers = config.max_speakers
         self.clustering_method = config.clustering_method
         
+        # Dedicated pool so inference never queues behind unrelated blocking
+        # work in the loop's default executor; created in initialize() and
+        # shut down in cleanup(), so the service can be restarted
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Per-session speaker centroids, so a speaker keeps one label across
+        # chunks instead of being re-clustered from scratch every call.
+        # LRU-bounded; updated from executor threads under the lock.
+        self._session_speakers: "OrderedDict[str, _SessionSpeakers]" = OrderedDict()
+        self._session_speakers_lock = threading.Lock()
+        self._speaker_match_threshold = config.speaker_match_threshold
+        self._max_tracked_sessions = config.max_tracked_sessions
+        
+        # Optional micro-batching: chunks arriving within batch_window share
+        # one executor job instead of paying a thread handoff each
+        self.batch_window = config.batch_window_ms / 1000.0
+        self.max_batch_size = config.max_batch_size
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        
         self.logger.info(
             "Diarization service configured",
             model_name=self.model_name,
@@ -63,13 +95,23 @@ class PyAnnoteDiarizationService(IDiarizationService):
         try:
             self.logger.info("Initializing PyAnnote diarization pipeline")
             
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    thread_name_prefix="diarization"
+                )
+            
             # Load PyAnnote pipeline in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             self.pipeline = await loop.run_in_executor(
-                None, 
+                self._executor, 
                 self._load_pyannote_pipeline
             )
             
+            if self.batch_window > 0:
+                self._batch_queue = asyncio.Queue()
+                self._batch_task = asyncio.create_task(self._batch_loop())
+            
             self.logger.info("PyAnnote diarization pipeline loaded successfully")
             
         except Exception as e:
@@ -87,6 +129,21 @@ class PyAnnoteDiarizationService(IDiarizationService):
                 use_auth_token=self.auth_token
             )
             
+            # Segmentation and embedding models follow the pipeline's device
+            device = self.config.device
+            if device == "auto":
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.device = torch.device(device)
+            if self.device.type == "cuda":
+                pipeline.to(self.device)
+            
+            # The embedding model runs once per (window, local speaker) mask;
+            # larger batches put more of those masks through each forward pass
+            for attribute in ("embedding_batch_size", "segmentation_batch_size"):
+                value = getattr(self.config, attribute)
+                if value is not None and hasattr(pipeline, attribute):
+                    setattr(pipeline, attribute, value)
+            
             return pipeline
             
         except Exception as e:
@@ -96,15 +153,18 @@ class PyAnnoteDiarizationService(IDiarizationService):
         self, 
         audio_data: bytes, 
         sample_rate: int = 16000,
-        num_speakers: Optional[int] = None
+        num_speakers: Optional[int] = None,
+        session_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Perform speaker diarization on audio data.
         
         Args:
-            audio_data: Raw audio bytes
+            audio_data: Raw audio bytes, or an AudioBuffer shared with other services
             sample_rate: Audio sample rate in Hz  
             num_speakers: Optional hint for number of speakers
+            session_id: Optional session the chunk belongs to; when given,
+                speakers are matched against the session's earlier chunks
             
         Returns:
             Dictionary containing:
@@ -119,26 +179,55 @@ class PyAnnoteDiarizationService(IDiarizationService):
             raise DiarizationServiceError("Diarization pipeline not initialized")
         
         start_time = time.time()
+        pooled = None
         
         try:
-            # Create temporary audio file for pyannote processing
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                temp_path = temp_file.name
-                
-                # Convert bytes to audio file
-                await self._write_audio_file(audio_data, sample_rate, temp_path)
-                
-                # Run diarization in executor
-                loop = asyncio.get_event_loop()
+            # Digital silence has no speakers; skip the segmentation and
+            # embedding passes entirely
+            if not as_int16(audio_data).any():
+                return {
+                    "speakers": [],
+                    "segments": [],
+                    "speaker_count": 0,
+                    "total_speech_time": 0.0,
+                    "speaker_stats": {}
+                }
+            
+            # Hand pyannote an in-memory (channel, time) waveform instead of
+            # writing a temporary WAV file for it to read back and decode
+            # An AudioBuffer's conversion is shared with ASR; raw bytes are
+            # decoded into a pooled array instead of a fresh allocation
+            if isinstance(audio_data, AudioBuffer):
+                samples = audio_data.float32()
+            else:
+                pooled = float32_buffer_pool.acquire(len(audio_data) // 2)
+                samples = as_float32(audio_data, out=pooled)
+            waveform = torch.from_numpy(samples).unsqueeze(0)
+            
+            # Run diarization in executor, batched with concurrent chunks if enabled
+            audio = {"waveform": waveform, "sample_rate": sample_rate}
+            loop = asyncio.get_running_loop()
+            if self._batch_queue is not None:
+                # The batch loop recycles the array once its job is done with
+                # the waveform; if the service stops mid-job it is dropped
+                future = loop.create_future()
+                self._batch_queue.put_nowait((audio, num_speakers, session_id, future, pooled))
+                pooled = None
+                diarization_result = await future
+            else:
                 diarization_result = await loop.run_in_executor(
-                    None,
+                    self._executor,
                     self._run_diarization,
-                    temp_path,
-                    num_speakers
+                    audio,
+                    num_speakers,
+                    session_id
                 )
-                
-                # Clean up temporary file
-                os.unlink(temp_path)
+            
+            # Only recycle once the pipeline is done with the waveform; on
+            # cancellation the job may still be running, so the array is dropped
+            if pooled is not None:
+                float32_buffer_pool.release(pooled)
+                pooled = None
             
             processing_time = (time.time() - start_time) * 1000
             
@@ -153,55 +242,110 @@ class PyAnnoteDiarizationService(IDiarizationService):
             return diarization_result
             
         except Exception as e:
+            # Still set only if the job never started or has already raised
+            if pooled is not None:
+                float32_buffer_pool.release(pooled)
             self.logger.error("Diarization failed", error=str(e))
             raise DiarizationServiceError(f"Diarization failed: {e}")
     
-    async def _write_audio_file(
-        self, 
-        audio_data: bytes, 
-        sample_rate: int, 
-        file_path: str
-    ) -> None:
+    async def _batch_loop(self) -> None:
+        """Collect queued diarizations and run each batch as one executor job."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + self.batch_window
+            
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Callers that gave up (timeout/cancel) are not diarized
+            batch = [item for item in batch if not item[3].done()]
+            if not batch:
+                continue
+            
+            try:
+                outcomes = await loop.run_in_executor(
+                    self._executor,
+                    self._run_diarization_batch,
+                    [item[:3] for item in batch]
+                )
+            except asyncio.CancelledError:
+                # The job may still be reading the waveforms, so their pooled
+                # arrays are dropped rather than recycled
+                for _, _, _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(DiarizationServiceError("Diarization service stopped"))
+                raise
+            except Exception as e:
+                outcomes = [(None, e)] * len(batch)
+            
+            for *_, pooled in batch:
+                if pooled is not None:
+                    float32_buffer_pool.release(pooled)
+            
+            for (_, _, _, future, _), (result, error) in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+    
+    def _run_diarization_batch(
+        self,
+        batch: List[Tuple[Dict[str, Any], Optional[int], Optional[str]]]
+    ) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
         """
-        Write audio bytes to WAV file.
+        Diarize a micro-batch of chunks in one executor job (sync operation).
+        
+        pyannote clusters speakers per input, so chunks are still diarized
+        one by one and sessions are never mixed; only the dispatch is shared.
+        Within each chunk, embedding_batch_size controls GPU batching.
         
         Args:
-            audio_data: Raw audio bytes
-            sample_rate: Audio sample rate
-            file_path: Output file path
-        """
-        try:
-            import wave
+            batch: (audio, num_speakers, session_id) per chunk
             
-            # Convert bytes to numpy array
-            audio_np = np.frombuffer(audio_data, dtype=np.int16)
-            
-            # Write WAV file
-            with wave.open(file_path, 'wb') as wav_file:
-                wav_file.setnchannels(1)  # Mono
-                wav_file.setsampwidth(2)  # 16-bit
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(audio_np.tobytes())
-                
-        except Exception as e:
-            raise DiarizationServiceError(f"Failed to write audio file: {e}")
+        Returns:
+            (result, error) per chunk, in batch order
+        """
+        outcomes = []
+        for audio, num_speakers, session_id in batch:
+            try:
+                outcomes.append((self._run_diarization(audio, num_speakers, session_id), None))
+            except Exception as e:
+                outcomes.append((None, e))
+        return outcomes
     
     def _run_diarization(
         self, 
-        audio_file_path: str, 
-        num_speakers: Optional[int]
+        audio: Dict[str, Any], 
+        num_speakers: Optional[int],
+        session_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Run diarization on audio file (sync operation).
+        Run diarization on an in-memory waveform (sync operation).
         
         Args:
-            audio_file_path: Path to audio file
+            audio: pyannote audio dict with "waveform" (1, N) and "sample_rate"
             num_speakers: Optional number of speakers hint
+            session_id: Optional session whose known speakers labels are mapped to
             
         Returns:
             Diarization results
         """
         try:
+            # Bound once: cleanup() may drop self.pipeline while this job runs
+            pipeline = self.pipeline
+            if pipeline is None:
+                raise DiarizationServiceError("Diarization pipeline not initialized")
+            
             # Set up diarization parameters
             params = {}
             
@@ -211,90 +355,228 @@ class PyAnnoteDiarizationService(IDiarizationService):
                 params["min_speakers"] = self.min_speakers
                 params["max_speakers"] = self.max_speakers
             
+            track_speakers = session_id is not None and self._max_tracked_sessions > 0
+            
+            # Autocast casts per op, so inputs and weights need no manual .half()
+            autocast = torch.autocast(
+                "cuda",
+                dtype=torch.float16,
+                enabled=self.config.half_precision and self.device.type == "cuda"
+            )
+            
             # Run diarization
-            diarization = self.pipeline(audio_file_path, **params)
+            if track_speakers:
+                # Centroids come back ordered like diarization.labels()
+                with autocast:
+                    diarization, embeddings = pipeline(
+                        audio, return_embeddings=True, **params
+                    )
+                label_map = self._match_session_speakers(
+                    session_id, diarization.labels(), embeddings
+                )
+            else:
+                with autocast:
+                    diarization = pipeline(audio, **params)
+                label_map = None
             
-            # Extract results
-            speakers = set()
-            segments = []
+            # Collect tracks into parallel columns
+            starts = []
+            ends = []
+            labels = []
             
             for turn, _, speaker in diarization.itertracks(yield_label=True):
-                speakers.add(speaker)
-                
-                segment_data = {
-                    "speaker": speaker,
-                    "start": turn.start,
-                    "end": turn.end,
-                    "duration": turn.end - turn.start,
-                    "confidence": 1.0  # PyAnnote doesn't provide per-segment confidence
-                }
-                
-                segments.append(segment_data)
+                starts.append(turn.start)
+                ends.append(turn.end)
+                labels.append(label_map[speaker] if label_map else speaker)
+            
+            # One pass dedupes and sorts the labels and indexes every track
+            unique_labels, label_idx = np.unique(np.asarray(labels), return_inverse=True)
+            speakers_list = unique_labels.tolist()
             
-            # Sort segments by start time
-            segments.sort(key=lambda x: x["start"])
+            # Sort segments by start time (stable, like list.sort)
+            start_arr = np.asarray(starts, dtype=np.float64)
+            order = np.argsort(start_arr, kind="stable")
+            start_arr = start_arr[order]
+            end_arr = np.asarray(ends, dtype=np.float64)[order]
+            duration_arr = end_arr - start_arr
+            speaker_idx = label_idx[order]
             
-            speakers_list = sorted(list(speakers))
+            segments = [
+                {
+                    "speaker": speakers_list[idx],
+                    "start": start,
+                    "end": end,
+                    "duration": duration,
+                    "confidence": 1.0  # PyAnnote doesn't provide per-segment confidence
+                }
+                for idx, start, end, duration in zip(
+                    speaker_idx.tolist(),
+                    start_arr.tolist(),
+                    end_arr.tolist(),
+                    duration_arr.tolist()
+                )
+            ]
             
             return {
                 "speakers": speakers_list,
                 "segments": segments,
                 "speaker_count": len(speakers_list),
-                "total_speech_time": sum(s["duration"] for s in segments),
-                "speaker_stats": self._calculate_speaker_stats(segments, speakers_list)
+                "total_speech_time": float(duration_arr.sum()),
+                "speaker_stats": self._calculate_speaker_stats(
+                    duration_arr, speaker_idx, speakers_list
+                )
             }
             
         except Exception as e:
             raise DiarizationServiceError(f"PyAnnote diarization failed: {e}")
     
+    def _match_session_speakers(
+        self, 
+        session_id: str, 
+        local_labels: List[str], 
+        embeddings: np.ndarray
+    ) -> Dict[str, str]:
+        """
+        Map this chunk's speaker labels to the session's stable labels.
+        
+        Pairs are matched greedily by cosine similarity to the stored
+        centroids; matches update the centroid as a running mean, and
+        unmatched speakers are enrolled under a new label.
+        
+        Args:
+            session_id: Session the chunk belongs to
+            local_labels: Speaker labels as returned for this chunk
+            embeddings: One centroid embedding per local label, same order
+            
+        Returns:
+            Mapping from local label to session label
+        """
+        if not local_labels:
+            return {}
+        
+        # Pipelines may pad centroids beyond the detected speakers
+        vectors = np.asarray(embeddings, dtype=np.float64)[:len(local_labels)]
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        valid = (np.isfinite(norms) & (norms > 0)).ravel()
+        vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        
+        with self._session_speakers_lock:
+            known = self._session_speakers.get(session_id)
+            if known is None:
+                known = self._session_speakers[session_id] = _SessionSpeakers()
+                if len(self._session_speakers) > self._max_tracked_sessions:
+                    self._session_speakers.popitem(last=False)
+            else:
+                self._session_speakers.move_to_end(session_id)
+            
+            label_map: Dict[str, str] = {}
+            if known.centroids:
+                similarity = vectors @ np.stack(known.centroids).T
+                taken = set()
+                for flat in np.argsort(similarity, axis=None)[::-1]:
+                    local, index = divmod(int(flat), similarity.shape[1])
+                    if similarity[local, index] < self._speaker_match_threshold:
+                        break
+                    label = local_labels[local]
+                    if not valid[local] or label in label_map or index in taken:
+                        continue
+                    
+                    label_map[label] = known.labels[index]
+                    taken.add(index)
+                    
+                    count = known.counts[index]
+                    centroid = known.centroids[index] * count + vectors[local]
+                    known.centroids[index] = centroid / np.linalg.norm(centroid)
+                    known.counts[index] = count + 1
+            
+            for local, label in enumerate(local_labels):
+                if label in label_map:
+                    continue
+                
+                session_label = f"SPEAKER_{len(known.labels):02d}"
+                label_map[label] = session_label
+                known.labels.append(session_label)
+                known.centroids.append(vectors[local])
+                known.counts.append(1 if valid[local] else 0)
+        
+        return label_map
+    
     def _calculate_speaker_stats(
         self, 
-        segments: List[Dict[str, Any]], 
+        durations: np.ndarray, 
+        speaker_idx: np.ndarray, 
         speakers: List[str]
     ) -> Dict[str, Dict[str, float]]:
         """
         Calculate speaking time statistics for each speaker.
         
         Args:
-            segments: List of segment dictionaries
-            speakers: List of speaker identifiers
+            durations: Segment durations in seconds
+            speaker_idx: Index into speakers for each segment
+            speakers: Sorted list of speaker identifiers
             
         Returns:
             Dictionary with speaker statistics
         """
-        stats = {}
-        
-        for speaker in speakers:
-            speaker_segments = [s for s in segments if s["speaker"] == speaker]
-            total_time = sum(s["duration"] for s in speaker_segments)
-            segment_count = len(speaker_segments)
-            avg_segment_duration = total_time / segment_count if segment_count > 0 else 0
-            
-            stats[speaker] = {
-                "total_speaking_time": total_time,
-                "segment_count": segment_count,
-                "average_segment_duration": avg_segment_duration,
-                "speaking_percentage": 0.0  # Will be calculated later if needed
-            }
+        num_speakers = len(speakers)
+        totals = np.bincount(speaker_idx, weights=durations, minlength=num_speakers)
+        counts = np.bincount(speaker_idx, minlength=num_speakers)
+        averages = np.divide(
+            totals, counts, out=np.zeros(num_speakers), where=counts > 0
+        )
         
         # Calculate speaking percentages
-        total_speaking_time = sum(stats[s]["total_speaking_time"] for s in speakers)
+        total_speaking_time = totals.sum()
         if total_speaking_time > 0:
-            for speaker in speakers:
-                stats[speaker]["speaking_percentage"] = (
-                    stats[speaker]["total_speaking_time"] / total_speaking_time * 100
-                )
+            percentages = totals / total_speaking_time * 100
+        else:
+            percentages = np.zeros(num_speakers)
         
-        return stats
+        return {
+            speaker: {
+                "total_speaking_time": total,
+                "segment_count": count,
+                "average_segment_duration": average,
+                "speaking_percentage": percentage
+            }
+            for speaker, total, count, average, percentage in zip(
+                speakers,
+                totals.tolist(),
+                counts.tolist(),
+                averages.tolist(),
+                percentages.tolist()
+            )
+        }
     
     async def cleanup(self) -> None:
         """Clean up resources and models."""
         try:
+            # Stop batching before the pipeline goes away, so no new batch
+            # job picks it up; running jobs hold their own reference
+            if self._batch_task is not None:
+                self._batch_task.cancel()
+                await asyncio.gather(self._batch_task, return_exceptions=True)
+                self._batch_task = None
+            
+            if self._batch_queue is not None:
+                while not self._batch_queue.empty():
+                    future = self._batch_queue.get_nowait()[3]
+                    if not future.done():
+                        future.set_exception(DiarizationServiceError("Diarization service stopped"))
+                self._batch_queue = None
+            
             if self.pipeline:
                 # Clear pipeline from memory
                 del self.pipeline
                 self.pipeline = None
             
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            
+            with self._session_speakers_lock:
+                self._session_speakers.clear()
+            
             self.logger.info("Diarization service cleaned up")
             
         except Exception as e:
@@ -313,11 +595,13 @@ class PyAnnoteDiarizationService(IDiarizationService):
             "max_speakers": self.max_speakers,
             "clustering_method": self.clustering_method,
             "is_initialized": self.pipeline is not None,
-            "auth_token_provided": self.auth_token is not None
+            "auth_token_provided": self.auth_token is not None,
+            "device": str(self.device),
+            "half_precision": self.config.half_precision and self.device.type == "cuda"
         }
 
 
-class MockDiarizationService(IDiarizationService):
+class MockDiarizationService:
     """
     Mock diarization service for testing and development.
     
@@ -340,7 +624,8 @@ class MockDiarizationService(IDiarizationService):
         self, 
         audio_data: bytes, 
         sample_rate: int = 16000,
-        num_speakers: Optional[int] = None
+        num_speakers: Optional[int] = None,
+        session_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Mock diarization."""
         if not self.is_initialized:
@@ -361,38 +646,44 @@ class MockDiarizationService(IDiarizationService):
         # Create mock speakers
         speakers = [f"SPEAKER_{i:02d}" for i in range(speaker_count)]
         
-        # Create mock segments
-        segments = []
-        segment_duration = duration / (speaker_count * 2)  # Each speaker gets multiple segments
-        current_time = 0.0
+        # Create mock segments: 2 per speaker, back to back. Starts and ends
+        # are cut from one edges array so consecutive segments meet exactly.
+        segment_count = speaker_count * 2
+        edges = np.arange(segment_count + 1) * (duration / segment_count)
+        durations = np.diff(edges)
+        confidences = 0.95 - np.arange(segment_count) * 0.02  # Slight confidence variation
         
-        for i in range(speaker_count * 2):  # 2 segments per speaker
-            speaker = speakers[i % speaker_count]
-            start_time = current_time
-            end_time = current_time + segment_duration
-            
-            segments.append({
-                "speaker": speaker,
-                "start": start_time,
-                "end": end_time,
+        segments = [
+            {
+                "speaker": speakers[i % speaker_count],
+                "start": start,
+                "end": end,
                 "duration": segment_duration,
-                "confidence": 0.95 - (i * 0.02)  # Slight confidence variation
-            })
-            
-            current_time = end_time
+                "confidence": confidence
+            }
+            for i, (start, end, segment_duration, confidence) in enumerate(zip(
+                edges[:-1].tolist(),
+                edges[1:].tolist(),
+                durations.tolist(),
+                confidences.tolist()
+            ))
+        ]
         
-        # Calculate speaker stats
-        speaker_stats = {}
-        for speaker in speakers:
-            speaker_segments = [s for s in segments if s["speaker"] == speaker]
-            total_time = sum(s["duration"] for s in speaker_segments)
-            
-            speaker_stats[speaker] = {
+        # Calculate speaker stats: speaker k owns segments k and k + speaker_count
+        totals = durations.reshape(2, speaker_count).sum(axis=0)
+        percentages = totals / duration * 100 if duration > 0 else np.zeros(speaker_count)
+        
+        speaker_stats = {
+            speaker: {
                 "total_speaking_time": total_time,
-                "segment_count": len(speaker_segments),
-                "average_segment_duration": total_time / len(speaker_segments),
-                "speaking_percentage": (total_time / duration) * 100 if duration > 0 else 0.0
+                "segment_count": 2,
+                "average_segment_duration": total_time / 2,
+                "speaking_percentage": percentage
             }
+            for speaker, total_time, percentage in zip(
+                speakers, totals.tolist(), percentages.tolist()
+            )
+        }
         
         self.logger.debug(
             "Mock diarization",
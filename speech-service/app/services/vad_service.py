@@ -6,18 +6,31 @@ following Clean Architecture principles with dependency injection.
 """
 
 import asyncio
+import hashlib
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from functools import lru_cache
 import numpy as np
 import torch
-from typing import Dict, Any, Optional
+import torchaudio
+from typing import Dict, Any, List, Optional, Tuple, Union
 import structlog
 from pathlib import Path
 
-from ..interfaces.services import IVADService, VADServiceError
+from ..interfaces.services import VADServiceError
 from ..config import VADSettings
+from ..utils.pcm import BufferLike, as_float32
 
 
-class SileroVADService(IVADService):
+@lru_cache(maxsize=8)
+def _resampler(orig_sr: int, target_sr: int) -> torchaudio.transforms.Resample:
+    """Build (once per rate pair) a windowed-sinc resampler with cached taps."""
+    return torchaudio.transforms.Resample(orig_freq=orig_sr, new_freq=target_sr)
+
+
+class SileroVADService:
     """
     Silero VAD service implementation.
     
@@ -37,6 +50,8 @@ class SileroVADService(IVADService):
         
         # Model and state
         self.model = None
+        self.device = torch.device("cpu")
+        self.use_onnx = False
         self.sample_rate = config.sample_rate
         self.confidence_threshold = config.confidence_threshold
         self.frame_duration_ms = config.frame_duration_ms
@@ -46,6 +61,35 @@ class SileroVADService(IVADService):
             self.sample_rate * self.frame_duration_ms / 1000
         )
         
+        # Silero consumes fixed windows: 512 samples at 16 kHz, 256 at 8 kHz
+        self._window_samples = config.window_samples
+        
+        # Dedicated pool so inference never queues behind unrelated blocking
+        # work in the loop's default executor; created in initialize() and
+        # shut down in cleanup(), so the service can be restarted
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Per-thread scratch: float32 samples and pinned host staging buffers
+        self._thread_buffers = threading.local()
+        
+        # Silero is stateful (reset_states() then one call per window), so
+        # executor threads take turns stepping the shared model; conversion,
+        # padding and device copies still run in parallel
+        self._model_lock = threading.Lock()
+        
+        # Recent results keyed by (audio digest, sample rate); only touched
+        # on the event loop, so no lock is needed
+        self._result_cache: "OrderedDict[Tuple[bytes, int], Dict[str, Any]]" = OrderedDict()
+        self._result_cache_size = config.result_cache_size
+        
+        # Optional micro-batching: chunks arriving within batch_window are
+        # stacked and stepped through the model together, one forward pass
+        # per window position instead of one per chunk
+        self.batch_window = config.batch_window_ms / 1000.0
+        self.max_batch_size = config.max_batch_size
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        
         self.logger.info(
             "VAD service configured",
             model_name=config.model_name,
@@ -64,13 +108,23 @@ class SileroVADService(IVADService):
         try:
             self.logger.info("Initializing Silero VAD model")
             
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    thread_name_prefix="vad"
+                )
+            
             # Load Silero VAD model in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             self.model = await loop.run_in_executor(
-                None, 
+                self._executor, 
                 self._load_silero_model
             )
             
+            if self.batch_window > 0:
+                self._batch_queue = asyncio.Queue()
+                self._batch_task = asyncio.create_task(self._batch_loop())
+            
             self.logger.info("Silero VAD model loaded successfully")
             
         except Exception as e:
@@ -80,16 +134,31 @@ class SileroVADService(IVADService):
     def _load_silero_model(self):
         """Load Silero VAD model (sync operation)."""
         try:
+            # Resolve the device first; it decides which backend to load
+            device = self.config.device
+            if device == "auto":
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.device = torch.device(device)
+            
+            # On CPU the ONNX Runtime build is markedly faster; its wrapper
+            # keeps the recurrent state and runs single-threaded per call
+            self.use_onnx = self.config.onnx and self.device.type == "cpu"
+            
             # Load the model from torch hub
             model, utils = torch.hub.load(
                 repo_or_dir='snakers4/silero-vad',
                 model='silero_vad',
                 force_reload=False,
-                onnx=False
+                onnx=self.use_onnx
             )
             
+            if self.use_onnx:
+                return model
+            
             model.eval()
-            return model
+            
+            # Move the model once; chunks are then copied to the same device
+            return model.to(self.device)
             
         except Exception as e:
             raise VADServiceError(f"Failed to load Silero model: {e}")
@@ -120,22 +189,30 @@ class SileroVADService(IVADService):
         
         start_time = time.time()
         
+        cache_key = None
+        if self._result_cache_size:
+            # Overlapping streaming windows resubmit identical chunks
+            cache_key = (hashlib.blake2b(audio_data, digest_size=16).digest(), sample_rate)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return self._copy_result(cached)
+        
         try:
-            # Convert bytes to numpy array
-            audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
-            audio_np = audio_np / 32768.0  # Normalize to [-1, 1]
-            
-            # Resample if necessary
-            if sample_rate != self.sample_rate:
-                audio_np = await self._resample_audio(audio_np, sample_rate, self.sample_rate)
-            
-            # Run VAD detection in executor
-            loop = asyncio.get_event_loop()
-            vad_result = await loop.run_in_executor(
-                None,
-                self._run_vad_detection,
-                audio_np
-            )
+            loop = asyncio.get_running_loop()
+            
+            # Conversion and any resampling run inside the executor job
+            if self._batch_queue is not None:
+                future = loop.create_future()
+                self._batch_queue.put_nowait((audio_data, sample_rate, future))
+                vad_result = await future
+            else:
+                vad_result = await loop.run_in_executor(
+                    self._executor,
+                    self._run_vad_detection_pcm,
+                    audio_data,
+                    sample_rate
+                )
             
             processing_time = (time.time() - start_time) * 1000
             
@@ -144,15 +221,102 @@ class SileroVADService(IVADService):
                 is_speech=vad_result["is_speech"],
                 confidence=vad_result["confidence"],
                 processing_time_ms=processing_time,
-                audio_duration_ms=len(audio_np) / self.sample_rate * 1000
+                audio_duration_ms=vad_result["audio_duration"] * 1000
             )
             
+            if cache_key is not None:
+                self._result_cache[cache_key] = self._copy_result(vad_result)
+                if len(self._result_cache) > self._result_cache_size:
+                    self._result_cache.popitem(last=False)
+            
             return vad_result
             
         except Exception as e:
             self.logger.error("VAD detection failed", error=str(e))
             raise VADServiceError(f"VAD detection failed: {e}")
     
+    async def _batch_loop(self) -> None:
+        """Collect queued chunks and run each batch as one executor job."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + self.batch_window
+            
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Callers that gave up (timeout/cancel) are not processed
+            batch = [item for item in batch if not item[2].done()]
+            if not batch:
+                continue
+            
+            try:
+                results = await loop.run_in_executor(
+                    self._executor,
+                    self._run_vad_detection_batch,
+                    [audio for audio, _, _ in batch],
+                    [rate for _, rate, _ in batch]
+                )
+            except asyncio.CancelledError:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(VADServiceError("VAD service stopped"))
+                raise
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+    
+    @staticmethod
+    def _copy_result(vad_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a VAD result so cached entries are never mutated by callers."""
+        result = dict(vad_result)
+        result["speech_segments"] = [list(seg) for seg in vad_result["speech_segments"]]
+        return result
+    
+    def _run_vad_detection_pcm(
+        self, 
+        audio_data: bytes, 
+        sample_rate: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Convert PCM bytes into this thread's float32 buffer and run VAD on it.
+        
+        The buffer is per executor thread, so concurrent detections never
+        share it, and the model is done with it before this returns. Audio
+        at another rate is resampled here, off the event loop.
+        
+        Args:
+            audio_data: Raw 16-bit PCM audio
+            sample_rate: Sample rate of audio_data (default: model rate)
+            
+        Returns:
+            VAD detection results
+        """
+        num_samples = len(audio_data) // 2
+        scratch = getattr(self._thread_buffers, "samples", None)
+        if scratch is None or len(scratch) < num_samples:
+            scratch = np.empty(num_samples, dtype=np.float32)
+            self._thread_buffers.samples = scratch
+        
+        audio_np = as_float32(audio_data, out=scratch)
+        if sample_rate is not None and sample_rate != self.sample_rate:
+            audio_np = self._resample_audio(audio_np, sample_rate, self.sample_rate)
+        
+        return self._run_vad_detection(audio_np)
+    
     def _run_vad_detection(self, audio_np: np.ndarray) -> Dict[str, Any]:
         """
         Run VAD detection on audio array (sync operation).
@@ -164,53 +328,185 @@ class SileroVADService(IVADService):
             VAD detection results
         """
         try:
-            # Convert to torch tensor
-            audio_tensor = torch.from_numpy(audio_np)
-            
-            # Ensure we have minimum length for the model
-            min_samples = 512  # Minimum samples for Silero VAD
-            if len(audio_tensor) < min_samples:
-                # Pad with zeros if too short
-                padding = min_samples - len(audio_tensor)
-                audio_tensor = torch.cat([
-                    audio_tensor, 
-                    torch.zeros(padding)
-                ])
-            
-            # Run the model
-            with torch.no_grad():
-                confidence = self.model(audio_tensor, self.sample_rate).item()
-            
-            is_speech = confidence > self.confidence_threshold
-            
-            # Calculate speech segments
-            speech_segments = []
-            if is_speech:
-                # For simplicity, treat the entire chunk as one segment
-                # In a more sophisticated implementation, you could use
-                # frame-by-frame analysis to find exact speech boundaries
-                duration_seconds = len(audio_np) / self.sample_rate
-                speech_segments = [[0.0, duration_seconds]]
-            
-            return {
-                "is_speech": is_speech,
-                "confidence": float(confidence),
-                "speech_segments": speech_segments,
-                "frame_count": 1,
-                "audio_duration": len(audio_np) / self.sample_rate
-            }
+            model = self.model
+            if model is None:
+                raise VADServiceError("VAD model not initialized")
+            
+            window = self._window_samples
+            num_samples = len(audio_np)
+            full_frames = num_samples // window
+            
+            # Silero takes fixed-size windows; only the trailing partial
+            # window (or an empty chunk) needs zero padding
+            frames = [torch.from_numpy(audio_np[:full_frames * window])]
+            remainder = num_samples - full_frames * window
+            if remainder or not full_frames:
+                tail = np.zeros(window, dtype=np.float32)
+                tail[:remainder] = audio_np[full_frames * window:]
+                frames.append(torch.from_numpy(tail))
+            audio_tensor = torch.cat(frames) if len(frames) > 1 else frames[0]
+            
+            if self.device.type == "cuda":
+                audio_tensor = self._to_device(audio_tensor)
+            
+            # Step the recurrent model window by window within the chunk. The
+            # service is shared by all sessions and detect_speech has no
+            # session identity, so state starts fresh for every chunk.
+            # Probabilities stay on the device until one host copy at the end
+            with self._model_lock, torch.inference_mode():
+                model.reset_states()
+                probs = torch.cat([
+                    model(frame, self.sample_rate).view(-1)
+                    for frame in audio_tensor.view(-1, window)
+                ]).tolist()
+            
+            return self._build_result(probs, num_samples)
+            
+        except Exception as e:
+            raise VADServiceError(f"VAD model inference failed: {e}")
+    
+    def _run_vad_detection_batch(
+        self, 
+        audios: List[Union[BufferLike, np.ndarray]],
+        sample_rates: Optional[List[int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run VAD detection on a micro-batch of chunks (sync operation).
+        
+        Chunks are zero-padded to a common window count and stacked, so each
+        window position is one (batch, window) forward pass. Probabilities
+        past a chunk's own windows are discarded.
+        
+        Args:
+            audios: PCM bytes, or float32 arrays at the model sample rate
+            sample_rates: Per-chunk sample rates; chunks at another rate are
+                resampled first (default: all at the model rate)
+            
+        Returns:
+            VAD detection results, in input order
+        """
+        try:
+            model = self.model
+            if model is None:
+                raise VADServiceError("VAD model not initialized")
+            
+            if sample_rates is not None:
+                audios = [
+                    self._resample_audio(as_float32(audio), rate, self.sample_rate)
+                    if rate != self.sample_rate else audio
+                    for audio, rate in zip(audios, sample_rates)
+                ]
+            
+            window = self._window_samples
+            lengths = [
+                len(audio) if isinstance(audio, np.ndarray) else len(audio) // 2
+                for audio in audios
+            ]
+            frame_counts = [max(1, -(-length // window)) for length in lengths]
+            
+            # PCM is converted straight into its padded batch row
+            batch = np.zeros((len(audios), max(frame_counts) * window), dtype=np.float32)
+            for row, audio, length in zip(batch, audios, lengths):
+                if isinstance(audio, np.ndarray):
+                    row[:length] = audio
+                else:
+                    as_float32(audio, out=row)
+            
+            batch_tensor = torch.from_numpy(batch)
+            if self.device.type == "cuda":
+                batch_tensor = self._to_device(batch_tensor.view(-1)).view(len(audios), -1)
+            
+            # (windows, batch) probabilities, copied to the host in one sync
+            with self._model_lock, torch.inference_mode():
+                model.reset_states()
+                probs_by_chunk = torch.stack([
+                    model(batch_tensor[:, start:start + window], self.sample_rate).view(-1)
+                    for start in range(0, batch_tensor.shape[1], window)
+                ]).T.tolist()
+            
+            return [
+                self._build_result(probs[:count], length)
+                for probs, count, length in zip(probs_by_chunk, frame_counts, lengths)
+            ]
             
         except Exception as e:
             raise VADServiceError(f"VAD model inference failed: {e}")
     
-    async def _resample_audio(
+    def _build_result(self, probs: List[float], num_samples: int) -> Dict[str, Any]:
+        """Assemble a VAD result from per-window speech probabilities."""
+        speech_segments = self._speech_segments(probs, num_samples)
+        
+        return {
+            "is_speech": bool(speech_segments),
+            "confidence": float(max(probs)),
+            "speech_segments": speech_segments,
+            "frame_count": len(probs),
+            "audio_duration": num_samples / self.sample_rate
+        }
+    
+    def _speech_segments(self, probs: List[float], num_samples: int) -> List[List[float]]:
+        """
+        Turn per-window speech probabilities into [start, end] segments.
+        
+        Uses Silero's hysteresis: speech starts at the threshold and only
+        ends once the probability drops 0.15 below it.
+        
+        Args:
+            probs: Speech probability for each window
+            num_samples: Unpadded chunk length in samples
+            
+        Returns:
+            List of [start, end] times in seconds
+        """
+        window = self._window_samples
+        start_threshold = self.confidence_threshold
+        end_threshold = max(start_threshold - 0.15, 0.01)
+        
+        segments = []
+        start = None
+        for index, prob in enumerate(probs):
+            if start is None:
+                if prob >= start_threshold:
+                    start = index * window
+            elif prob < end_threshold:
+                segments.append([start / self.sample_rate, index * window / self.sample_rate])
+                start = None
+        
+        if start is not None:
+            segments.append([start / self.sample_rate, num_samples / self.sample_rate])
+        
+        return segments
+    
+    def _to_device(self, audio_tensor: torch.Tensor) -> torch.Tensor:
+        """
+        Copy a CPU tensor to the model device through a pinned staging buffer.
+        
+        Pinned memory lets the copy run asynchronously instead of stalling on
+        pageable memory. The buffer is per executor thread and safe to reuse:
+        each chunk ends with a host copy of its probabilities, which
+        synchronizes before the thread's next copy.
+        """
+        num_samples = audio_tensor.numel()
+        staging = getattr(self._thread_buffers, "pinned", None)
+        if staging is None or staging.numel() < num_samples:
+            staging = torch.empty(num_samples, dtype=torch.float32, pin_memory=True)
+            self._thread_buffers.pinned = staging
+        
+        host = staging[:num_samples]
+        host.copy_(audio_tensor)
+        return host.to(self.device, non_blocking=True)
+    
+    def _resample_audio(
         self, 
         audio: np.ndarray, 
         orig_sr: int, 
         target_sr: int
     ) -> np.ndarray:
         """
-        Resample audio to target sample rate.
+        Resample audio to target sample rate (sync operation).
+        
+        Called from executor jobs only; the sinc filter is too heavy to run
+        on the event loop.
         
         Args:
             audio: Input audio array
@@ -224,17 +520,12 @@ class SileroVADService(IVADService):
             return audio
         
         try:
-            # Simple linear interpolation resampling
-            # For production, consider using scipy.signal.resample or librosa
-            ratio = target_sr / orig_sr
-            new_length = int(len(audio) * ratio)
-            
-            # Create new time indices
-            old_indices = np.linspace(0, len(audio) - 1, len(audio))
-            new_indices = np.linspace(0, len(audio) - 1, new_length)
-            
-            # Interpolate
-            resampled = np.interp(new_indices, old_indices, audio)
+            # Band-limited sinc resampling; the filter taps are built once
+            # per rate pair and reused for every chunk
+            with torch.inference_mode():
+                resampled = _resampler(orig_sr, target_sr)(
+                    torch.from_numpy(audio)
+                ).numpy()
             
             self.logger.debug(
                 "Audio resampled",
@@ -244,7 +535,7 @@ class SileroVADService(IVADService):
                 new_length=len(resampled)
             )
             
-            return resampled.astype(np.float32)
+            return resampled.astype(np.float32, copy=False)
             
         except Exception as e:
             raise VADServiceError(f"Audio resampling failed: {e}")
@@ -252,6 +543,20 @@ class SileroVADService(IVADService):
     async def cleanup(self) -> None:
         """Clean up resources and models."""
         try:
+            # Stop batching before the model goes away, so no new batch job
+            # picks it up
+            if self._batch_task is not None:
+                self._batch_task.cancel()
+                await asyncio.gather(self._batch_task, return_exceptions=True)
+                self._batch_task = None
+            
+            if self._batch_queue is not None:
+                while not self._batch_queue.empty():
+                    future = self._batch_queue.get_nowait()[1]
+                    if not future.done():
+                        future.set_exception(VADServiceError("VAD service stopped"))
+                self._batch_queue = None
+            
             if self.model:
                 # Clear model from memory
                 del self.model
@@ -261,6 +566,11 @@ class SileroVADService(IVADService):
                 if torch.cuda.is_available():
                     torch.cuda.empty_cache()
             
+            self._result_cache.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            
             self.logger.info("VAD service cleaned up")
             
         except Exception as e:
@@ -281,11 +591,13 @@ class SileroVADService(IVADService):
             "frame_size": self.frame_size,
             "is_initialized": self.model is not None,
             "torch_version": torch.__version__,
-            "cuda_available": torch.cuda.is_available()
+            "cuda_available": torch.cuda.is_available(),
+            "device": str(self.device),
+            "backend": "onnx" if self.use_onnx else "torch"
         }
 
 
-class MockVADService(IVADService):
+class MockVADService:
     """
     Mock VAD service for testing and development.
     
@@ -0,0 +1,16 @@
+"""
+Utilities package for speech-to-text service.
+
+This package contains low-level helpers shared by handlers, workers and services.
+"""
+
+from .audio_pool import AudioBufferPool, Float32BufferPool
+from .pcm import AudioBuffer, as_int16, as_float32
+
+__all__ = [
+    "AudioBufferPool",
+    "Float32BufferPool",
+    "AudioBuffer",
+    "as_int16",
+    "as_float32"
+]
@@ -0,0 +1,155 @@
+"""
+Audio buffer pool implementation.
+
+This module provides a reusable pool of fixed-size bytearrays for audio
+buffering, so long-lived per-session buffers are recycled across sessions
+instead of being allocated and freed on every connect/disconnect, and a
+matching pool of float32 sample arrays for PCM decoding.
+"""
+
+from collections import deque
+from typing import Deque, Dict
+
+import numpy as np
+
+
+class AudioBufferPool:
+    """
+    Pool of bytearrays bucketed by size class.
+    
+    Requested sizes are rounded up to the next multiple of size_class_bytes,
+    so buffers of similar size share one free list and are reused.
+    """
+    
+    def __init__(self, size_class_bytes: int = 4096, max_buffers_per_class: int = 64):
+        """
+        Initialize the pool.
+        
+        Args:
+            size_class_bytes: Granularity that requested sizes are rounded up to
+            max_buffers_per_class: Maximum idle buffers retained per size class
+        """
+        if size_class_bytes <= 0:
+            raise ValueError("size_class_bytes must be positive")
+        
+        self.size_class_bytes = size_class_bytes
+        self.max_buffers_per_class = max_buffers_per_class
+        self._free: Dict[int, Deque[bytearray]] = {}
+    
+    def size_class(self, size: int) -> int:
+        """Round a requested size up to its size class."""
+        granularity = self.size_class_bytes
+        return max(granularity, -(-size // granularity) * granularity)
+    
+    def acquire(self, size: int) -> bytearray:
+        """
+        Get a buffer of at least the requested size.
+        
+        Args:
+            size: Minimum buffer size in bytes
+            
+        Returns:
+            Pooled bytearray whose length is the size class of `size`
+        """
+        size_class = self.size_class(size)
+        free_list = self._free.get(size_class)
+        if free_list:
+            return free_list.pop()
+        return bytearray(size_class)
+    
+    def release(self, buffer: bytearray) -> None:
+        """
+        Return a buffer to the pool.
+        
+        Buffers whose length is not a size class, or that would exceed the
+        per-class retention limit, are simply dropped.
+        
+        Args:
+            buffer: Buffer previously obtained from acquire()
+        """
+        size_class = len(buffer)
+        if size_class % self.size_class_bytes:
+            return
+        
+        free_list = self._free.setdefault(size_class, deque())
+        if len(free_list) < self.max_buffers_per_class:
+            free_list.append(buffer)
+    
+    def idle_count(self) -> int:
+        """Number of idle buffers currently held by the pool."""
+        return sum(len(free_list) for free_list in self._free.values())
+
+
+class Float32BufferPool:
+    """
+    Pool of float32 sample arrays bucketed by size class.
+    
+    Used to decode PCM chunks (see as_float32's `out`) without allocating a
+    fresh array per chunk. acquire() returns the whole pooled array; callers
+    work on a prefix of it and must release it only once nothing reads it.
+    """
+    
+    def __init__(self, size_class_samples: int = 16000, max_buffers_per_class: int = 8):
+        """
+        Initialize the pool.
+        
+        Args:
+            size_class_samples: Granularity that requested lengths are rounded up to
+            max_buffers_per_class: Maximum idle arrays retained per size class
+        """
+        if size_class_samples <= 0:
+            raise ValueError("size_class_samples must be positive")
+        
+        self.size_class_samples = size_class_samples
+        self.max_buffers_per_class = max_buffers_per_class
+        self._free: Dict[int, Deque[np.ndarray]] = {}
+    
+    def size_class(self, n_samples: int) -> int:
+        """Round a requested length up to its size class."""
+        granularity = self.size_class_samples
+        return max(granularity, -(-n_samples // granularity) * granularity)
+    
+    def acquire(self, n_samples: int) -> np.ndarray:
+        """
+        Get a float32 array with at least the requested length.
+        
+        Args:
+            n_samples: Minimum number of samples
+            
+        Returns:
+            Pooled float32 array whose length is the size class of `n_samples`
+        """
+        size_class = self.size_class(n_samples)
+        free_list = self._free.get(size_class)
+        if free_list:
+            return free_list.pop()
+        return np.empty(size_class, dtype=np.float32)
+    
+    def release(self, buffer: np.ndarray) -> None:
+        """
+        Return an array to the pool.
+        
+        Arrays that are not float32, whose length is not a size class, or
+        that would exceed the per-class retention limit are simply dropped.
+        
+        Args:
+            buffer: Array previously obtained from acquire()
+        """
+        size_class = len(buffer)
+        if buffer.dtype != np.float32 or size_class % self.size_class_samples:
+            return
+        
+        free_list = self._free.setdefault(size_class, deque())
+        if len(free_list) < self.max_buffers_per_class:
+            free_list.append(buffer)
+    
+    def idle_count(self) -> int:
+        """Number of idle arrays currently held by the pool."""
+        return sum(len(free_list) for free_list in self._free.values())
+
+
+# Shared pool for per-session audio buffers
+audio_buffer_pool = AudioBufferPool()
+
+# Shared pool for decoded float32 chunks
+float32_buffer_pool = Float32BufferPool()
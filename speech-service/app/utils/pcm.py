@@ -0,0 +1,88 @@
+"""
+PCM conversion helpers.
+
+Audio arrives from clients as raw 16-bit little-endian mono PCM bytes.
+Services should convert it through these helpers, which wrap the buffer
+with np.frombuffer instead of copying it element by element.
+"""
+
+from typing import Optional, Union
+
+import numpy as np
+
+# Scale factor mapping int16 samples to [-1, 1)
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+BufferLike = Union[bytes, bytearray, memoryview]
+
+
+class AudioBuffer:
+    """
+    A PCM chunk shared by several services.
+    
+    ASR and diarization both handle every speech_detected chunk; wrapping it
+    once lets them share a single float32 conversion. The converted array
+    is shared, so consumers must not modify it.
+    """
+    __slots__ = ("data", "_float32")
+    
+    def __init__(self, data: BufferLike) -> None:
+        self.data = data
+        self._float32: Optional[np.ndarray] = None
+    
+    def __repr__(self) -> str:
+        return f"AudioBuffer(data=<{len(self.data)} bytes>)"
+    
+    def __len__(self) -> int:
+        """Size of the raw PCM in bytes."""
+        return len(self.data)
+    
+    def float32(self) -> np.ndarray:
+        """Normalized float32 samples, converted on first use."""
+        if self._float32 is None:
+            self._float32 = as_float32(self.data)
+        return self._float32
+
+
+def as_int16(buffer: Union[BufferLike, AudioBuffer]) -> np.ndarray:
+    """
+    View PCM bytes as int16 samples without copying.
+    
+    Args:
+        buffer: Raw 16-bit PCM audio
+        
+    Returns:
+        Read-only int16 array sharing memory with `buffer`
+    """
+    if isinstance(buffer, AudioBuffer):
+        buffer = buffer.data
+    return np.frombuffer(buffer, dtype=np.int16)
+
+
+def as_float32(
+    buffer: Union[BufferLike, AudioBuffer],
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Convert PCM bytes to normalized float32 samples.
+    
+    Scaling is done in a single pass straight into a float32 array, so only
+    one output array is allocated - or none, when `out` is given.
+    
+    Args:
+        buffer: Raw 16-bit PCM audio; an AudioBuffer without `out` returns
+            its shared, memoized conversion
+        out: Optional preallocated float32 array with at least as many
+            elements as `buffer` has samples
+        
+    Returns:
+        float32 array with samples in [-1, 1); a view into `out` if given
+    """
+    if out is None and isinstance(buffer, AudioBuffer):
+        return buffer.float32()
+    
+    samples = as_int16(buffer)
+    if out is None:
+        return np.multiply(samples, _INT16_SCALE, dtype=np.float32)
+    
+    return np.multiply(samples, _INT16_SCALE, out=out[:len(samples)])
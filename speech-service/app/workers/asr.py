@@ -7,17 +7,36 @@ and publishes transcription results.
 """
 
 import asyncio
-import time
-from typing import Dict, Any, Optional, Set
+import logging
+from typing import Awaitable, Dict, Any, List, Optional
 import structlog
 
-from ..interfaces.services import IASRService, IWorker, WorkerError
+from ..interfaces.services import IASRService, WorkerError
 from ..interfaces.events import IEventBus, Event
-from ..models.audio import ProcessingResultModel
+from ..models.audio import ProcessingResultModel, processing_result_payload
+from ..models.speech import SpeechDetectedPayload
+from ..models.transcript import TranscriptSegment
 from ..config import ProcessingSettings
+from ..utils.pcm import AudioBuffer
 
 
-class ASRWorker(IWorker):
+def _truncate_text(text: str, limit: int = 100) -> str:
+    """Shorten a transcript for log output; only call when the log is emitted."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def _error_result(error_message: str) -> Dict[str, Any]:
+    """Build the fixed-shape ASR result reported for a failed chunk."""
+    return {
+        "text": "",
+        "confidence": 0.0,
+        "segments": [],
+        "language": "unknown",
+        "error": error_message
+    }
+
+
+class ASRWorker:
     """
     ASR Worker implementation with Clean DI approach.
     
@@ -45,16 +64,38 @@ class ASRWorker(IWorker):
         
         # Internal state management
         self.is_running = False
-        self.processing_tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self.max_concurrent_tasks = config.max_concurrent_workers
         self.chunk_timeout = config.chunk_timeout_seconds
         
+        # Bursts queue up here for max_concurrent_tasks persistent consumers
+        # instead of being dropped as soon as every consumer is busy
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent_tasks * 4)
+        self._consumers: List[asyncio.Task] = []
+        self._active_chunks = 0
+        
+        # Bound concurrent model calls for this stage; queued chunks wait here
+        # instead of contending for the model (e.g. a single GPU)
+        self.stage_concurrency = config.asr_concurrency or self.max_concurrent_tasks
+        self.stage_semaphore = asyncio.Semaphore(self.stage_concurrency)
+        self.stream_segments = config.stream_asr_segments
+        
+        # Finished results are published in batches by one flusher task
+        # when a publish window is configured
+        self.publish_window = config.publish_batch_window_ms / 1000
+        self.publish_batch_size = config.publish_batch_size
+        self._publish_queue: asyncio.Queue = asyncio.Queue()
+        self._flusher: Optional[asyncio.Task] = None
+        
         # Event bus will be set via set_event_bus() 
         # Senior pattern: separate object creation from configuration
         self._event_bus: Optional[IEventBus] = None
         
-        # Logging
+        # Logging. structlog is not level-filtered here, so per-chunk debug
+        # calls are gated on the configured stdlib level to skip building
+        # their arguments when debug is off
         self.logger = structlog.get_logger(self.__class__.__name__)
+        self._level_logger = logging.getLogger(__name__)
         
         self.logger.info(
             "ASR worker initialized",
@@ -97,8 +138,15 @@ class ASRWorker(IWorker):
             await self.event_bus.subscribe("speech_detected", self._handle_speech_detected)
             self.logger.info("Subscribed to speech_detected events")
             
-            # Phase 3: Mark as running
+            # Phase 3: Mark as running and start consuming
+            self._loop = asyncio.get_running_loop()
             self.is_running = True
+            if self.publish_window > 0:
+                self._flusher = asyncio.create_task(self._flush_loop())
+            self._consumers = [
+                asyncio.create_task(self._consumer_loop())
+                for _ in range(self.max_concurrent_tasks)
+            ]
             self.logger.info("ASR worker started successfully")
             
         except Exception as e:
@@ -117,25 +165,36 @@ class ASRWorker(IWorker):
         # Phase 1: Mark as not running (stop accepting new work)
         self.is_running = False
         
-        # Phase 2: Wait for current tasks to complete
-        if self.processing_tasks:
-            self.logger.info(f"Waiting for {len(self.processing_tasks)} tasks to complete")
-            
-            # Wait with timeout
-            done, pending = await asyncio.wait(
-                self.processing_tasks, 
-                timeout=self.chunk_timeout * 2,
-                return_when=asyncio.ALL_COMPLETED
-            )
+        # Phase 2: Drain queued and in-flight chunks, then stop consumers
+        pending_chunks = self._queue.qsize() + self._active_chunks
+        if pending_chunks:
+            self.logger.info(f"Waiting for {pending_chunks} chunks to complete")
             
-            # Force cancel pending tasks
-            if pending:
-                self.logger.warning(f"Force cancelling {len(pending)} pending tasks")
-                for task in pending:
-                    task.cancel()
-                
-                # Wait for cancellation to complete
-                await asyncio.gather(*pending, return_exceptions=True)
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=self.chunk_timeout * 2)
+            except asyncio.TimeoutError:
+                self.logger.warning(
+                    "Force cancelling unfinished chunks",
+                    queued=self._queue.qsize(),
+                    active=self._active_chunks
+                )
+        
+        for consumer in self._consumers:
+            consumer.cancel()
+        if self._consumers:
+            await asyncio.wait(self._consumers)
+        self._consumers = []
+        
+        # Chunks left after a forced stop are abandoned, not replayed on restart
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+        
+        # Flush results still waiting for a batch; None tells the flusher to exit
+        if self._flusher:
+            self._publish_queue.put_nowait(None)
+            await self._flusher
+            self._flusher = None
         
         # Phase 3: Unsubscribe from events
         try:
@@ -163,21 +222,30 @@ class ASRWorker(IWorker):
             self.logger.debug("Ignoring event - worker not running")
             return
         
-        # Check concurrency limits
-        if len(self.processing_tasks) >= self.max_concurrent_tasks:
+        # Hand off to the consumers; only drop once the backlog is full
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
             self.logger.warning(
-                "Max concurrent tasks reached, dropping speech chunk",
-                active_tasks=len(self.processing_tasks),
+                "ASR queue full, dropping speech chunk",
+                queued=self._queue.qsize(),
                 max_tasks=self.max_concurrent_tasks
             )
-            return
-        
-        # Create processing task
-        task = asyncio.create_task(self._process_speech_chunk(event))
-        self.processing_tasks.add(task)
-        
-        # Clean up completed tasks
-        task.add_done_callback(self.processing_tasks.discard)
+    
+    async def _consumer_loop(self) -> None:
+        """Process queued speech chunks one at a time until cancelled."""
+        while True:
+            event = await self._queue.get()
+            self._active_chunks += 1
+            try:
+                await self._process_speech_chunk(event)
+            except Exception as e:
+                # A consumer that dies leaves the queue to fill up and drop
+                # chunks silently, so nothing may escape this loop
+                self.logger.error("Unhandled error processing speech chunk", error=str(e), exc_info=True)
+            finally:
+                self._active_chunks -= 1
+                self._queue.task_done()
     
     async def _process_speech_chunk(self, event: Event) -> None:
         """
@@ -185,79 +253,125 @@ class ASRWorker(IWorker):
         
         Senior approach: Comprehensive error handling and performance tracking
         """
-        start_time = time.time()
+        start_time = self._loop.time()
         chunk_data = event.data
         
+        # Unpack the event once, including the legacy nested-result format
         try:
-            # Extract audio data from the event (following old format)
-            audio_data = chunk_data.get("data")  # Primary format from old ASRWorker
-            sample_rate = chunk_data.get("sample_rate", 16000)
-            
-            if not audio_data:
-                # Fallback: try to get from result (new format)
-                result_data = chunk_data.get("result", {})
-                audio_data = result_data.get("audio_data")
-                sample_rate = result_data.get("sample_rate", 16000)
-            
-            if not audio_data:
-                raise ValueError("No audio data found in speech_detected event")
-            
-            session_id = chunk_data.get("session_id", "unknown")
-            chunk_id = chunk_data.get("chunk_id", -1)
-            
-            self.logger.debug(
-                "Processing speech chunk",
-                session_id=session_id,
-                chunk_id=chunk_id,
-                data_size=len(audio_data) if isinstance(audio_data, (bytes, list)) else "unknown"
-            )
-            
-            # Process through ASR service with timeout
-            result = await asyncio.wait_for(
-                self.asr_service.transcribe(audio_data, sample_rate),
-                timeout=self.chunk_timeout
-            )
-            
-            processing_time = (time.time() - start_time) * 1000  # Convert to ms
-            
-            # Create result model
-            processing_result = ProcessingResultModel(
-                session_id=session_id,
-                chunk_id=chunk_id,
-                component="asr",
-                result=result if isinstance(result, dict) else result.model_dump(),
-                processing_time_ms=processing_time,
-                success=True
-            )
-            
-            # Publish results
-            from ..interfaces.events import Event
-            result_event = Event(
-                name="asr_completed",
-                data=processing_result.model_dump(),
-                source="asr_worker",
-                correlation_id=event.correlation_id
-            )
-            await self.event_bus.publish(result_event)
-            
-            self.logger.debug(
-                "Speech chunk processed successfully",
-                session_id=session_id,
-                chunk_id=chunk_id,
-                processing_time_ms=processing_time,
-                transcription=result.get("text", "")[:100] + "..." if len(result.get("text", "")) > 100 else result.get("text", "")
-            )
-            
-        except asyncio.TimeoutError:
-            processing_time = (time.time() - start_time) * 1000
-            await self._handle_processing_error(
-                chunk_data, "Processing timeout", processing_time
-            )
+            payload = SpeechDetectedPayload.from_event(event)
         except Exception as e:
-            processing_time = (time.time() - start_time) * 1000
             await self._handle_processing_error(
-                chunk_data, str(e), processing_time
+                chunk_data,
+                f"Malformed speech_detected event: {e}",
+                (self._loop.time() - start_time) * 1000.0
             )
+            return
+        session_id = payload.session_id
+        chunk_id = payload.chunk_id
+        
+        # Every log line for this chunk carries its IDs; consumers run as
+        # separate tasks, so the binding is local to this chunk
+        with structlog.contextvars.bound_contextvars(
+            session_id=session_id,
+            chunk_id=chunk_id,
+            correlation_id=event.correlation_id
+        ):
+            try:
+                audio_data = payload.audio_data
+                sample_rate = payload.sample_rate
+                
+                if audio_data is None:
+                    raise ValueError("No audio data found in speech_detected event")
+                if not isinstance(audio_data, (bytes, bytearray, memoryview, AudioBuffer)):
+                    raise ValueError(f"Unsupported audio data type: {type(audio_data).__name__}")
+                
+                if self._level_logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Processing speech chunk", data_size=len(audio_data))
+                
+                # Forward segments as they are decoded instead of after the whole chunk
+                on_segment = None
+                if self.stream_segments:
+                    async def on_segment(segment: TranscriptSegment) -> None:
+                        await self.event_bus.publish(Event(
+                            name="asr_segment",
+                            data={"session_id": session_id, "chunk_id": chunk_id, "segment": segment},
+                            source="asr_worker",
+                            correlation_id=event.correlation_id
+                        ))
+                
+                # Process through ASR service with timeout
+                async with self.stage_semaphore:
+                    result = await self._with_chunk_timeout(
+                        self.asr_service.transcribe(
+                            audio_data, sample_rate, on_segment=on_segment
+                        )
+                    )
+                
+                processing_time = (self._loop.time() - start_time) * 1000.0  # Convert to ms
+                
+                # Transcripts come from our own service with a known shape, so the
+                # payload is built directly instead of validating and dumping a model
+                if not isinstance(result, dict):
+                    result = result.model_dump()
+                
+                # Publish results
+                result_event = Event(
+                    name="asr_completed",
+                    data=processing_result_payload(
+                        session_id, chunk_id, "asr", result, processing_time
+                    ),
+                    source="asr_worker",
+                    correlation_id=event.correlation_id
+                )
+                await self._publish_result(result_event)
+                
+                if self._level_logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "Speech chunk processed successfully",
+                        processing_time_ms=processing_time,
+                        transcription=_truncate_text(result.get("text", ""))
+                    )
+                
+            except asyncio.TimeoutError:
+                processing_time = (self._loop.time() - start_time) * 1000.0
+                await self._handle_processing_error(
+                    chunk_data, "Processing timeout", processing_time
+                )
+            except Exception as e:
+                processing_time = (self._loop.time() - start_time) * 1000.0
+                await self._handle_processing_error(
+                    chunk_data, str(e), processing_time
+                )
+    
+    async def _with_chunk_timeout(self, coro: Awaitable[Any]) -> Any:
+        """
+        Await a transcription, cancelling it once chunk_timeout has passed.
+        
+        One call_later timer cancels the task; unlike wait_for there is no
+        extra waiter future or timeout bookkeeping per chunk. Cancellation
+        from outside (e.g. stop()) is re-raised as is, not reported as a
+        timeout.
+        
+        Raises:
+            asyncio.TimeoutError: If the transcription took too long
+        """
+        task = asyncio.ensure_future(coro)
+        timed_out = False
+        
+        def expire() -> None:
+            nonlocal timed_out
+            timed_out = True
+            task.cancel()
+        
+        handle = self._loop.call_later(self.chunk_timeout, expire)
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if timed_out:
+                raise asyncio.TimeoutError() from None
+            raise
+        finally:
+            handle.cancel()
     
     async def _handle_processing_error(
         self, 
@@ -270,40 +384,33 @@ class ASRWorker(IWorker):
         
         Senior approach: Structured error handling with proper logging
         """
+        # session_id/chunk_id come from the callers' bound context
         self.logger.error(
             "ASR processing failed",
             error=error_message,
-            session_id=chunk_data.get("session_id"),
-            chunk_id=chunk_data.get("chunk_id"),
             processing_time_ms=processing_time
         )
         
-        # Create error result with required ASR fields
-        error_result = ProcessingResultModel(
-            session_id=chunk_data.get("session_id", "unknown"),
-            chunk_id=chunk_data.get("chunk_id", -1),
-            component="asr",
-            result={
-                "text": "",
-                "confidence": 0.0,
-                "segments": [],
-                "language": "unknown",
-                "error": error_message
-            },
-            processing_time_ms=processing_time,
+        # Error result with required ASR fields, built directly like the
+        # success payload instead of validating and dumping a model
+        error_result = processing_result_payload(
+            chunk_data.get("session_id", "unknown"),
+            chunk_data.get("chunk_id", -1),
+            "asr",
+            _error_result(error_message),
+            processing_time,
             success=False
         )
         
         # Publish error result
         try:
-            from ..interfaces.events import Event
             error_event = Event(
                 name="asr_completed",
-                data=error_result.model_dump(),
+                data=error_result,
                 source="asr_worker",
                 correlation_id=None  # No correlation_id available in error context
             )
-            await self.event_bus.publish(error_event)
+            await self._publish_result(error_event)
         except Exception as publish_error:
             self.logger.error(
                 "Failed to publish error result",
@@ -311,6 +418,47 @@ class ASRWorker(IWorker):
                 original_error=error_message
             )
     
+    async def _publish_result(self, event: Event) -> None:
+        """Publish an asr_completed event, via the flusher when batching."""
+        if self._flusher:
+            self._publish_queue.put_nowait(event)
+        else:
+            await self.event_bus.publish(event)
+    
+    async def _flush_loop(self) -> None:
+        """Collect finished results and publish each batch in one dispatch."""
+        loop = self._loop
+        stopping = False
+        
+        while not stopping:
+            event = await self._publish_queue.get()
+            if event is None:
+                return
+            batch = [event]
+            deadline = loop.time() + self.publish_window
+            
+            while len(batch) < self.publish_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self._publish_queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if event is None:
+                    stopping = True
+                    break
+                batch.append(event)
+            
+            try:
+                await self.event_bus.publish_batch(batch)
+            except Exception as e:
+                self.logger.error(
+                    "Failed to publish ASR results",
+                    batch_size=len(batch),
+                    error=str(e)
+                )
+    
     async def _cleanup_on_error(self) -> None:
         """Clean up resources when startup fails."""
         try:
@@ -340,83 +488,71 @@ class ASRWorker(IWorker):
         if not self.is_running:
             raise WorkerError("ASR worker is not running")
         
-        start_time = time.time()
+        start_time = self._loop.time()
         
-        try:
-            # Run ASR transcription
-            result = await asyncio.wait_for(
-                self.asr_service.transcribe(audio_data, sample_rate),
-                timeout=self.chunk_timeout
-            )
-            
-            processing_time_ms = (time.time() - start_time) * 1000
-            
-            # Create processing result
-            processing_result = ProcessingResultModel(
-                session_id=session_id,
-                chunk_id=chunk_id,
-                component="asr",
-                result=result if isinstance(result, dict) else result.model_dump(),
-                processing_time_ms=processing_time_ms,
-                success=True
-            )
-            
-            self.logger.debug(
-                "ASR processing completed",
-                session_id=session_id,
-                chunk_id=chunk_id,
-                text_length=len(result.get("text", "")),
-                confidence=result.get("confidence", 0.0),
-                processing_time_ms=processing_time_ms
-            )
-            
-            return processing_result
-            
-        except asyncio.TimeoutError:
-            processing_time_ms = (time.time() - start_time) * 1000
-            await self._handle_processing_error(
-                {"session_id": session_id, "chunk_id": chunk_id}, 
-                "Processing timeout", 
-                processing_time_ms
-            )
-            # Return error result
-            return ProcessingResultModel(
-                session_id=session_id,
-                chunk_id=chunk_id,
-                component="asr",
-                result={
-                    "text": "",
-                    "confidence": 0.0,
-                    "segments": [],
-                    "language": "unknown",
-                    "error": "Processing timeout"
-                },
-                processing_time_ms=processing_time_ms,
-                success=False
-            )
-        except Exception as e:
-            processing_time_ms = (time.time() - start_time) * 1000
-            await self._handle_processing_error(
-                {"session_id": session_id, "chunk_id": chunk_id}, 
-                str(e), 
-                processing_time_ms
-            )
-            # Return error result
-            return ProcessingResultModel(
-                session_id=session_id,
-                chunk_id=chunk_id,
-                component="asr",
-                result={
-                    "text": "",
-                    "confidence": 0.0,
-                    "segments": [],
-                    "language": "unknown",
-                    "error": str(e)
-                },
-                processing_time_ms=processing_time_ms,
-                success=False
-            )
-
+        with structlog.contextvars.bound_contextvars(session_id=session_id, chunk_id=chunk_id):
+            try:
+                # Run ASR transcription
+                async with self.stage_semaphore:
+                    result = await self._with_chunk_timeout(
+                        self.asr_service.transcribe(audio_data, sample_rate)
+                    )
+                
+                processing_time_ms = (self._loop.time() - start_time) * 1000.0
+                
+                # Build the result without re-validation: the transcript comes
+                # from our own service and the IDs from internal callers
+                processing_result = ProcessingResultModel.model_construct(
+                    session_id=session_id,
+                    chunk_id=chunk_id,
+                    component="asr",
+                    result=result if isinstance(result, dict) else result.model_dump(),
+                    processing_time_ms=processing_time_ms,
+                    success=True
+                )
+                
+                self.logger.debug(
+                    "ASR processing completed",
+                    text_length=len(result.get("text", "")),
+                    confidence=result.get("confidence", 0.0),
+                    processing_time_ms=processing_time_ms
+                )
+                
+                return processing_result
+                
+            except asyncio.TimeoutError:
+                processing_time_ms = (self._loop.time() - start_time) * 1000.0
+                await self._handle_processing_error(
+                    {"session_id": session_id, "chunk_id": chunk_id}, 
+                    "Processing timeout", 
+                    processing_time_ms
+                )
+                # Return error result
+                return ProcessingResultModel(
+                    session_id=session_id,
+                    chunk_id=chunk_id,
+                    component="asr",
+                    result=_error_result("Processing timeout"),
+                    processing_time_ms=processing_time_ms,
+                    success=False
+                )
+            except Exception as e:
+                processing_time_ms = (self._loop.time() - start_time) * 1000.0
+                await self._handle_processing_error(
+                    {"session_id": session_id, "chunk_id": chunk_id}, 
+                    str(e), 
+                    processing_time_ms
+                )
+                # Return error result
+                return ProcessingResultModel(
+                    session_id=session_id,
+                    chunk_id=chunk_id,
+                    component="asr",
+                    result=_error_result(str(e)),
+                    processing_time_ms=processing_time_ms,
+                    success=False
+                )
+    
     def get_status(self) -> Dict[str, Any]:
         """
         Get current worker status.
@@ -426,11 +562,13 @@ class ASRWorker(IWorker):
         """
         return {
             "is_running": self.is_running,
-            "processing_tasks": len(self.processing_tasks),
+            "processing_tasks": self._active_chunks,
+            "queued_chunks": self._queue.qsize(),
             "max_concurrent_tasks": self.max_concurrent_tasks,
             "chunk_timeout": self.chunk_timeout,
+            "stage_concurrency": self.stage_concurrency,
             "asr_service_info": {
                 "type": type(self.asr_service).__name__,
-                "initialized": hasattr(self.asr_service, 'is_initialized') and self.asr_service.is_initialized
+                "initialized": self.asr_service.is_initialized
             }
         }
\ No newline at end of file
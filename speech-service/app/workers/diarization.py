@@ -8,16 +8,18 @@ and publishes speaker identification results.
 
 import asyncio
 import time
-from typing import Dict, Any, Optional, Set
+from typing import Dict, Any, List, Optional
 import structlog
 
-from ..interfaces.services import IDiarizationService, IWorker, WorkerError
+from ..interfaces.services import IDiarizationService, WorkerError
 from ..interfaces.events import IEventBus, Event
-from ..models.audio import ProcessingResultModel
+from ..models.audio import ProcessingResultModel, processing_result_payload
+from ..models.speech import SpeechDetectedPayload
 from ..config import ProcessingSettings
+from ..utils.pcm import AudioBuffer
 
 
-class DiarizationWorker(IWorker):
+class DiarizationWorker:
     """
     Diarization Worker implementation with Clean DI approach.
     
@@ -45,10 +47,20 @@ class DiarizationWorker(IWorker):
         
         # Internal state management
         self.is_running = False
-        self.processing_tasks: Set[asyncio.Task] = set()
         self.max_concurrent_tasks = config.max_concurrent_workers
         self.chunk_timeout = config.chunk_timeout_seconds
         
+        # Bursts queue up here for max_concurrent_tasks persistent consumers
+        # instead of spawning (or dropping) a task per chunk
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent_tasks * 4)
+        self._consumers: List[asyncio.Task] = []
+        self._active_chunks = 0
+        
+        # Bound concurrent model calls for this stage; queued chunks wait here
+        # instead of contending for the model (e.g. a single GPU)
+        self.stage_concurrency = config.diarization_concurrency or self.max_concurrent_tasks
+        self.stage_semaphore = asyncio.Semaphore(self.stage_concurrency)
+        
         # Event bus will be set via set_event_bus() 
         # Senior pattern: separate object creation from configuration
         self._event_bus: Optional[IEventBus] = None
@@ -97,8 +109,12 @@ class DiarizationWorker(IWorker):
             await self.event_bus.subscribe("speech_detected", self._handle_speech_detected)
             self.logger.info("Subscribed to speech_detected events")
             
-            # Phase 3: Mark as running
+            # Phase 3: Mark as running and start consuming
             self.is_running = True
+            self._consumers = [
+                asyncio.create_task(self._consumer_loop())
+                for _ in range(self.max_concurrent_tasks)
+            ]
             self.logger.info("Diarization worker started successfully")
             
         except Exception as e:
@@ -117,25 +133,30 @@ class DiarizationWorker(IWorker):
         # Phase 1: Mark as not running (stop accepting new work)
         self.is_running = False
         
-        # Phase 2: Wait for current tasks to complete
-        if self.processing_tasks:
-            self.logger.info(f"Waiting for {len(self.processing_tasks)} tasks to complete")
-            
-            # Wait with timeout
-            done, pending = await asyncio.wait(
-                self.processing_tasks, 
-                timeout=self.chunk_timeout * 2,
-                return_when=asyncio.ALL_COMPLETED
-            )
+        # Phase 2: Drain queued and in-flight chunks, then stop consumers
+        pending_chunks = self._queue.qsize() + self._active_chunks
+        if pending_chunks:
+            self.logger.info(f"Waiting for {pending_chunks} chunks to complete")
             
-            # Force cancel pending tasks
-            if pending:
-                self.logger.warning(f"Force cancelling {len(pending)} pending tasks")
-                for task in pending:
-                    task.cancel()
-                
-                # Wait for cancellation to complete
-                await asyncio.gather(*pending, return_exceptions=True)
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=self.chunk_timeout * 2)
+            except asyncio.TimeoutError:
+                self.logger.warning(
+                    "Force cancelling unfinished chunks",
+                    queued=self._queue.qsize(),
+                    active=self._active_chunks
+                )
+        
+        for consumer in self._consumers:
+            consumer.cancel()
+        if self._consumers:
+            await asyncio.wait(self._consumers)
+        self._consumers = []
+        
+        # Chunks left after a forced stop are abandoned, not replayed on restart
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
         
         # Phase 3: Unsubscribe from events
         try:
@@ -163,21 +184,30 @@ class DiarizationWorker(IWorker):
             self.logger.debug("Ignoring event - worker not running")
             return
         
-        # Check concurrency limits
-        if len(self.processing_tasks) >= self.max_concurrent_tasks:
+        # Hand off to the consumers; only drop once the backlog is full
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
             self.logger.warning(
-                "Max concurrent tasks reached, dropping speech chunk",
-                active_tasks=len(self.processing_tasks),
+                "Diarization queue full, dropping speech chunk",
+                queued=self._queue.qsize(),
                 max_tasks=self.max_concurrent_tasks
             )
-            return
-        
-        # Create processing task
-        task = asyncio.create_task(self._process_speech_chunk(event))
-        self.processing_tasks.add(task)
-        
-        # Clean up completed tasks
-        task.add_done_callback(self.processing_tasks.discard)
+    
+    async def _consumer_loop(self) -> None:
+        """Process queued speech chunks one at a time until cancelled."""
+        while True:
+            event = await self._queue.get()
+            self._active_chunks += 1
+            try:
+                await self._process_speech_chunk(event)
+            except Exception as e:
+                # A consumer that dies leaves the queue to fill up and drop
+                # chunks silently, so nothing may escape this loop
+                self.logger.error("Unhandled error processing speech chunk", error=str(e), exc_info=True)
+            finally:
+                self._active_chunks -= 1
+                self._queue.task_done()
     
     async def _process_speech_chunk(self, event: Event) -> None:
         """
@@ -185,55 +215,47 @@ class DiarizationWorker(IWorker):
         
         Senior approach: Comprehensive error handling and performance tracking
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         chunk_data = event.data
         
         try:
-            # Extract audio data from the event (following VAD/ASR format)
-            audio_data = chunk_data.get("data")  # Primary format from speech_detected
-            sample_rate = chunk_data.get("sample_rate", 16000)
+            # Unpack the event once, including the legacy nested-result format
+            payload = SpeechDetectedPayload.from_event(event)
+            audio_data = payload.audio_data
+            sample_rate = payload.sample_rate
+            session_id = payload.session_id
+            chunk_id = payload.chunk_id
             
-            if not audio_data:
-                # Fallback: try to get from result (new format)
-                result_data = chunk_data.get("result", {})
-                audio_data = result_data.get("audio_data")
-                sample_rate = result_data.get("sample_rate", 16000)
-            
-            if not audio_data:
+            if audio_data is None:
                 raise ValueError("No audio data found in speech_detected event")
             
-            session_id = chunk_data.get("session_id", "unknown")
-            chunk_id = chunk_data.get("chunk_id", -1)
-            
             self.logger.debug(
                 "Processing speech chunk for diarization",
                 session_id=session_id,
                 chunk_id=chunk_id,
-                data_size=len(audio_data) if isinstance(audio_data, (bytes, list)) else "unknown"
+                data_size=len(audio_data) if isinstance(audio_data, (bytes, memoryview, list, AudioBuffer)) else "unknown"
             )
             
             # Process through diarization service with timeout
-            result = await asyncio.wait_for(
-                self.diarization_service.diarize(audio_data, sample_rate),
-                timeout=self.chunk_timeout
-            )
+            async with self.stage_semaphore:
+                result = await asyncio.wait_for(
+                    self.diarization_service.diarize(audio_data, sample_rate, session_id=session_id),
+                    timeout=self.chunk_timeout
+                )
             
-            processing_time = (time.time() - start_time) * 1000  # Convert to ms
-            
-            # Create result model
-            processing_result = ProcessingResultModel(
-                session_id=session_id,
-                chunk_id=chunk_id,
-                component="diarization",
-                result=result if isinstance(result, dict) else result.model_dump(),
-                processing_time_ms=processing_time,
-                success=True
-            )
+            processing_time = (time.perf_counter_ns() - start_time) / 1_000_000  # Convert to ms
             
-            # Publish results
+            # Publish results; the payload is built directly since the
+            # service result's shape is already known
             result_event = Event(
                 name="diarization_completed",
-                data=processing_result.model_dump(),
+                data=processing_result_payload(
+                    session_id,
+                    chunk_id,
+                    "diarization",
+                    result if isinstance(result, dict) else result.model_dump(),
+                    processing_time
+                ),
                 source="diarization_worker",
                 correlation_id=event.correlation_id
             )
@@ -247,15 +269,11 @@ class DiarizationWorker(IWorker):
                 speakers_found=len(result.get("speakers", []))
             )
             
-        except asyncio.TimeoutError:
-            processing_time = (time.time() - start_time) * 1000
-            await self._handle_processing_error(
-                chunk_data, "Processing timeout", processing_time
-            )
         except Exception as e:
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.perf_counter_ns() - start_time) / 1_000_000
+            error_message = "Processing timeout" if isinstance(e, asyncio.TimeoutError) else str(e)
             await self._handle_processing_error(
-                chunk_data, str(e), processing_time
+                chunk_data, error_message, processing_time
             )
     
     async def _handle_processing_error(
@@ -277,17 +295,18 @@ class DiarizationWorker(IWorker):
             processing_time_ms=processing_time
         )
         
-        # Create error result with required diarization fields
-        error_result = ProcessingResultModel(
-            session_id=chunk_data.get("session_id", "unknown"),
-            chunk_id=chunk_data.get("chunk_id", -1),
-            component="diarization",
-            result={
+        # Error result with required diarization fields, built directly like
+        # the success payload instead of validating and dumping a model
+        error_result = processing_result_payload(
+            chunk_data.get("session_id", "unknown"),
+            chunk_data.get("chunk_id", -1),
+            "diarization",
+            {
                 "speakers": [],
                 "segments": [],
                 "error": error_message
             },
-            processing_time_ms=processing_time,
+            processing_time,
             success=False
         )
         
@@ -295,7 +314,7 @@ class DiarizationWorker(IWorker):
         try:
             error_event = Event(
                 name="diarization_completed",
-                data=error_result.model_dump(),
+                data=error_result,
                 source="diarization_worker",
                 correlation_id=None  # No correlation_id available in error context
             )
@@ -342,16 +361,17 @@ class DiarizationWorker(IWorker):
         if not self.is_running:
             raise WorkerError("Diarization worker is not running")
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             # Run diarization service
-            result = await asyncio.wait_for(
-                self.diarization_service.diarize(audio_data, sample_rate),
-                timeout=self.chunk_timeout
-            )
+            async with self.stage_semaphore:
+                result = await asyncio.wait_for(
+                    self.diarization_service.diarize(audio_data, sample_rate, session_id=session_id),
+                    timeout=self.chunk_timeout
+                )
             
-            processing_time_ms = (time.time() - start_time) * 1000
+            processing_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             
             # Create processing result
             processing_result = ProcessingResultModel(
@@ -373,31 +393,12 @@ class DiarizationWorker(IWorker):
             
             return processing_result
             
-        except asyncio.TimeoutError:
-            processing_time_ms = (time.time() - start_time) * 1000
-            await self._handle_processing_error(
-                {"session_id": session_id, "chunk_id": chunk_id}, 
-                "Processing timeout", 
-                processing_time_ms
-            )
-            # Return error result
-            return ProcessingResultModel(
-                session_id=session_id,
-                chunk_id=chunk_id,
-                component="diarization",
-                result={
-                    "speakers": [],
-                    "segments": [],
-                    "error": "Processing timeout"
-                },
-                processing_time_ms=processing_time_ms,
-                success=False
-            )
         except Exception as e:
-            processing_time_ms = (time.time() - start_time) * 1000
+            processing_time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+            error_message = "Processing timeout" if isinstance(e, asyncio.TimeoutError) else str(e)
             await self._handle_processing_error(
                 {"session_id": session_id, "chunk_id": chunk_id}, 
-                str(e), 
+                error_message, 
                 processing_time_ms
             )
             # Return error result
@@ -408,7 +409,7 @@ class DiarizationWorker(IWorker):
                 result={
                     "speakers": [],
                     "segments": [],
-                    "error": str(e)
+                    "error": error_message
                 },
                 processing_time_ms=processing_time_ms,
                 success=False
@@ -423,9 +424,11 @@ class DiarizationWorker(IWorker):
         """
         return {
             "is_running": self.is_running,
-            "processing_tasks": len(self.processing_tasks),
+            "processing_tasks": self._active_chunks,
+            "queued_chunks": self._queue.qsize(),
             "max_concurrent_tasks": self.max_concurrent_tasks,
             "chunk_timeout": self.chunk_timeout,
+            "stage_concurrency": self.stage_concurrency,
             "diarization_service_info": {
                 "type": type(self.diarization_service).__name__,
                 "config": getattr(self.diarization_service, 'config', {})
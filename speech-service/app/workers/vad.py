@@ -11,13 +11,15 @@ import time
 from typing import Dict, Any, Optional, Set
 import structlog
 
-from ..interfaces.services import IVADService, IWorker, WorkerError
+from ..interfaces.services import IVADService, WorkerError
 from ..interfaces.events import IEventBus, Event
 from ..models.audio import AudioChunkModel, ProcessingResultModel
+from ..models.speech import SpeechDetectedPayload
 from ..config import ProcessingSettings
+from ..utils.pcm import AudioBuffer
 
 
-class VADWorker(IWorker):
+class VADWorker:
     """
     VAD Worker implementation with Clean DI approach.
     
@@ -49,6 +51,11 @@ class VADWorker(IWorker):
         self.max_concurrent_tasks = config.max_concurrent_workers
         self.chunk_timeout = config.chunk_timeout_seconds
         
+        # Bound concurrent model calls for this stage; queued chunks wait here
+        # instead of contending for the model (e.g. a single GPU)
+        self.stage_concurrency = config.vad_concurrency or self.max_concurrent_tasks
+        self.stage_semaphore = asyncio.Semaphore(self.stage_concurrency)
+        
         # Event bus will be set via set_event_bus() 
         # Senior pattern: separate object creation from configuration
         self._event_bus: Optional[IEventBus] = None
@@ -189,8 +196,15 @@ class VADWorker(IWorker):
         chunk_data = event.data
         
         try:
-            # Parse audio chunk
-            audio_chunk = AudioChunkModel(**chunk_data)
+            # Build audio chunk without re-validation: the payload was already
+            # validated as an AudioChunkModel by the WebSocket handler
+            audio_chunk = AudioChunkModel.model_construct(
+                session_id=chunk_data["session_id"],
+                chunk_id=chunk_data["chunk_id"],
+                data=chunk_data["data"],
+                sample_rate=chunk_data.get("sample_rate", 16000),
+                channels=chunk_data.get("channels", 1)
+            )
             
             self.logger.debug(
                 "Processing audio chunk",
@@ -199,11 +213,15 @@ class VADWorker(IWorker):
                 data_size=len(audio_chunk.data)
             )
             
-            # Process through VAD service with timeout
-            result = await asyncio.wait_for(
-                self.vad_service.detect_speech(audio_chunk.data, audio_chunk.sample_rate),
-                timeout=self.chunk_timeout
-            )
+            # Reuse the result of inline VAD gating if the handler already ran it
+            result = chunk_data.get("vad_result")
+            if result is None:
+                # Process through VAD service with timeout
+                async with self.stage_semaphore:
+                    result = await asyncio.wait_for(
+                        self.vad_service.detect_speech(audio_chunk.data, audio_chunk.sample_rate),
+                        timeout=self.chunk_timeout
+                    )
             
             processing_time = (time.time() - start_time) * 1000  # Convert to ms
             
@@ -257,12 +275,21 @@ class VADWorker(IWorker):
         # Publish speech_detected if speech was detected
         if vad_result.get("is_speech", False):  # Handle dict result
             # Create special format for speech_detected event (for ASR/Diarization workers)
+            # ASR and diarization both consume this chunk; share one decode
+            meta = SpeechDetectedPayload(
+                session_id=processing_result.session_id,
+                chunk_id=processing_result.chunk_id,
+                audio_data=AudioBuffer(chunk_data["data"]),
+                sample_rate=chunk_data.get("sample_rate", 16000)
+            )
             speech_data = {
-                "session_id": processing_result.session_id,
-                "chunk_id": processing_result.chunk_id,
-                "data": chunk_data.get("data"),  # Raw audio data for processing
-                "sample_rate": chunk_data.get("sample_rate", 16000),
-                "vad_confidence": vad_result.get("confidence", 0.0)
+                "session_id": meta.session_id,
+                "chunk_id": meta.chunk_id,
+                "data": meta.audio_data,
+                "sample_rate": meta.sample_rate,
+                "vad_confidence": vad_result.get("confidence", 0.0),
+                # Unpacked payload, so consumers skip the dict lookups above
+                "meta": meta
             }
             
             speech_detected_event = Event(
@@ -352,10 +379,11 @@ class VADWorker(IWorker):
         
         try:
             # Run VAD detection
-            result = await asyncio.wait_for(
-                self.vad_service.detect_speech(audio_chunk.data, audio_chunk.sample_rate),
-                timeout=self.chunk_timeout
-            )
+            async with self.stage_semaphore:
+                result = await asyncio.wait_for(
+                    self.vad_service.detect_speech(audio_chunk.data, audio_chunk.sample_rate),
+                    timeout=self.chunk_timeout
+                )
             
             processing_time_ms = (time.time() - start_time) * 1000
             
@@ -423,6 +451,7 @@ class VADWorker(IWorker):
             "processing_tasks": len(self.processing_tasks),
             "max_concurrent_tasks": self.max_concurrent_tasks,
             "chunk_timeout": self.chunk_timeout,
+            "stage_concurrency": self.stage_concurrency,
             "vad_service_info": {
                 "type": type(self.vad_service).__name__,
                 "initialized": hasattr(self.vad_service, '_initialized') and self.vad_service._initialized
@@ -10,13 +10,13 @@ import time
 from typing import Dict, Any, Optional
 import structlog
 
-from ..interfaces.services import IVADService, IWorker, WorkerError
+from ..interfaces.services import IVADService, WorkerError
 from ..interfaces.events import IEventBus, Event
 from ..models.audio import AudioChunkModel, ProcessingResultModel
 from ..config import ProcessingSettings
 
 
-class VADWorker(IWorker):
+class VADWorker:
     """
     VAD Worker implementation with Clean DI approach.
     
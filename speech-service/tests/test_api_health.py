@@ -111,6 +111,12 @@ class TestHealthAPI:
     
     def test_readiness_probe(self, client):
         """Test Kubernetes readiness probe."""
+        # Not ready until the lifespan has initialized all services
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "not_ready"
+        
+        client.app.state.ready = True
         response = client.get("/health/ready")
         
         assert response.status_code == 200
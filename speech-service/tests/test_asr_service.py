@@ -8,10 +8,13 @@ and testing purposes, ensuring proper interface compliance.
 import pytest
 from unittest.mock import AsyncMock, patch
 import asyncio
+import threading
+import numpy as np
 
-from app.services.asr_service import MockASRService
+from app.services.asr_service import FasterWhisperASRService, MockASRService, _to_whisper_rate
+from app.models.transcript import TranscriptSegment
 from app.interfaces.services import ASRServiceError
-from app.config import ASRSettings
+from app.config import ASRSettings, ProcessingSettings
 
 
 class TestMockASRService:
@@ -56,7 +59,8 @@ class TestMockASRService:
         
         result = await mock_asr_service.transcribe(
             audio_data=audio_data,
-            sample_rate=16000
+            sample_rate=16000,
+            include_all_language_probs=True
         )
         
         # Check required fields
@@ -96,6 +100,19 @@ class TestMockASRService:
         assert result1["confidence"] == result2["confidence"] == result3["confidence"]
         assert result1["language"] == result2["language"] == result3["language"]
     
+    @pytest.mark.asyncio
+    async def test_mock_asr_accepts_memoryview(self, mock_asr_service):
+        """Test a memoryview is transcribed like the bytes it views."""
+        await mock_asr_service.initialize()
+        
+        audio_data = b'\x01\x02\x03\x04' * 1000
+        
+        from_bytes = await mock_asr_service.transcribe(audio_data)
+        from_view = await mock_asr_service.transcribe(memoryview(audio_data))
+        
+        assert from_view["text"] == from_bytes["text"]
+        assert from_view["duration"] == from_bytes["duration"]
+    
     @pytest.mark.asyncio
     async def test_mock_asr_different_audio_different_results(self, mock_asr_service):
         """Test that different audio data produces different transcriptions."""
@@ -147,13 +164,23 @@ class TestMockASRService:
         for lang in languages:
             result = await mock_asr_service.transcribe(
                 audio_data=audio_data,
-                language=lang
+                language=lang,
+                include_all_language_probs=True
             )
             
             assert result["language"] == lang
             assert lang in result["all_language_probs"]
             assert result["all_language_probs"][lang] == 0.99
     
+    @pytest.mark.asyncio
+    async def test_mock_asr_all_language_probs_opt_in(self, mock_asr_service):
+        """Test per-language probabilities are omitted unless requested."""
+        await mock_asr_service.initialize()
+        
+        result = await mock_asr_service.transcribe(audio_data=b'\x00' * 1000)
+        
+        assert "all_language_probs" not in result
+    
     @pytest.mark.asyncio
     async def test_mock_asr_language_default_from_config(self, mock_asr_service):
         """Test that default language comes from config."""
@@ -182,24 +209,24 @@ class TestMockASRService:
         
         # Check each segment
         for segment in segments:
-            assert "start" in segment
-            assert "end" in segment
-            assert "text" in segment
-            assert "confidence" in segment
+            assert isinstance(segment, TranscriptSegment)
             
-            assert isinstance(segment["start"], float)
-            assert isinstance(segment["end"], float)
-            assert isinstance(segment["text"], str)
-            assert isinstance(segment["confidence"], float)
+            assert isinstance(segment.start, float)
+            assert isinstance(segment.end, float)
+            assert isinstance(segment.text, str)
+            assert isinstance(segment.confidence, float)
             
             # Time consistency
-            assert segment["start"] <= segment["end"]
-            assert 0.0 <= segment["confidence"] <= 1.0
-            assert len(segment["text"]) > 0
+            assert segment.start <= segment.end
+            assert 0.0 <= segment.confidence <= 1.0
+            assert len(segment.text) > 0
+            
+            # Wire format used when results are sent to clients
+            assert set(segment.to_dict()) == {"start", "end", "text", "confidence"}
         
         # Check time sequence
         for i in range(1, len(segments)):
-            assert segments[i]["start"] >= segments[i-1]["end"]
+            assert segments[i].start >= segments[i-1].end
     
     @pytest.mark.asyncio
     async def test_mock_asr_text_word_count_matches_segments(self, mock_asr_service):
@@ -218,7 +245,7 @@ class TestMockASRService:
         
         # Check that segment texts match text words
         for i, segment in enumerate(segments):
-            assert segment["text"] == text_words[i]
+            assert segment.text == text_words[i]
     
     @pytest.mark.asyncio
     async def test_mock_asr_duration_calculation(self, mock_asr_service):
@@ -345,4 +372,104 @@ class TestMockASRService:
         for text in mock_asr_service.mock_texts:
             assert isinstance(text, str)
             assert len(text) > 0
-            assert len(text.split()) > 0  # Should contain words
\ No newline at end of file
+            assert len(text.split()) > 0  # Should contain words
+
+
+class TestFasterWhisperASRService:
+    """Test suite for FasterWhisperASRService with the Whisper model stubbed out."""
+    
+    @pytest.fixture
+    def whisper_service(self):
+        """Create a micro-batching service whose model load is stubbed."""
+        service = FasterWhisperASRService(ASRSettings(batch_window_ms=5.0))
+        service._load_whisper_model = lambda: object()
+        return service
+    
+    @staticmethod
+    def _empty_result() -> dict:
+        return {"text": "", "confidence": 0.0, "segments": [], "language": "en"}
+    
+    @pytest.mark.asyncio
+    async def test_default_settings_use_micro_batching(self, whisper_service):
+        """Test concurrent chunks share a batch unless segment streaming is enabled."""
+        assert ProcessingSettings().stream_asr_segments is False
+        await whisper_service.initialize()
+        
+        batch_sizes = []
+        def run_batch(batch):
+            batch_sizes.append(len(batch))
+            return [(self._empty_result(), None) for _ in batch]
+        whisper_service._run_transcription_batch = run_batch
+        
+        await asyncio.gather(*(
+            whisper_service.transcribe(bytes([i]) * 640) for i in range(3)
+        ))
+        
+        assert batch_sizes == [3]
+        await whisper_service.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_drops_scratch_in_use(self, whisper_service):
+        """Test a batch interrupted by cleanup does not recycle its scratch buffer."""
+        await whisper_service.initialize()
+        
+        started = threading.Event()
+        release = threading.Event()
+        def blocking_run_batch(batch):
+            started.set()
+            release.wait(5)
+            return [(self._empty_result(), None) for _ in batch]
+        whisper_service._run_transcription_batch = blocking_run_batch
+        
+        loop = asyncio.get_running_loop()
+        running = asyncio.ensure_future(whisper_service.transcribe(b"\x01\x00" * 320))
+        assert await loop.run_in_executor(None, started.wait, 5)
+        
+        try:
+            await whisper_service.cleanup()
+            with pytest.raises(ASRServiceError, match="stopped"):
+                await asyncio.wait_for(running, 1)
+        finally:
+            release.set()
+        
+        assert whisper_service._scratch_buffers == []
+    
+    @pytest.mark.asyncio
+    async def test_restart_after_cleanup(self, whisper_service):
+        """Test the service can be initialized and used again after cleanup."""
+        await whisper_service.initialize()
+        await whisper_service.cleanup()
+        assert not whisper_service.is_initialized
+        
+        await whisper_service.initialize()
+        whisper_service._run_transcription_batch = lambda batch: [
+            (self._empty_result(), None) for _ in batch
+        ]
+        
+        result = await whisper_service.transcribe(b"\x01\x00" * 320)
+        
+        assert result["text"] == ""
+        await whisper_service.cleanup()
+
+
+class TestWhisperResampling:
+    """Test resampling of non-16 kHz audio before it reaches Whisper."""
+    
+    def test_16khz_returned_unchanged(self):
+        """Test 16 kHz input is passed through without a copy."""
+        audio = np.zeros(1600, dtype=np.float32)
+        
+        assert _to_whisper_rate(audio, 16000) is audio
+    
+    @pytest.mark.parametrize("sample_rate", [8000, 48000])
+    def test_resampled_to_16khz_length(self, sample_rate):
+        """Test 8 kHz and 48 kHz input come back with 16 kHz worth of samples."""
+        pytest.importorskip("torchaudio")
+        
+        t = np.arange(sample_rate, dtype=np.float32) / sample_rate
+        audio = np.sin(2 * np.pi * 440 * t).astype(np.float32)  # 1 s tone
+        
+        resampled = _to_whisper_rate(audio, sample_rate)
+        
+        assert resampled.dtype == np.float32
+        assert len(resampled) == 16000
@@ -9,6 +9,7 @@ Tests Event-driven ASR Worker functionality:
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
@@ -53,8 +54,8 @@ class TestASRWorker:
         """Create MockASRService instance."""
         return MockASRService(asr_config)
     
-    @pytest.fixture
-    def asr_worker(self, event_bus, mock_asr_service, processing_config):
+    @pytest_asyncio.fixture
+    async def asr_worker(self, event_bus, mock_asr_service, processing_config):
         """Create ASRWorker instance with Clean DI approach."""
         # Create worker with Clean DI
         worker = ASRWorker(
@@ -65,13 +66,16 @@ class TestASRWorker:
         # Set event bus via setter injection
         worker.set_event_bus(event_bus)
         
-        return worker
+        yield worker
+
+        if worker.is_running:
+            await worker.stop()
     
     @pytest.mark.asyncio
     async def test_asr_worker_initialization(self, asr_worker):
         """Test worker initialization and state."""
         assert not asr_worker.is_running
-        assert len(asr_worker.processing_tasks) == 0
+        assert asr_worker._queue.empty()
         assert asr_worker.max_concurrent_tasks == 2
         assert asr_worker.chunk_timeout == 5
         assert asr_worker.asr_service is not None
@@ -125,6 +129,8 @@ class TestASRWorker:
         assert "text" in result.result
         assert "confidence" in result.result
         assert result.processing_time_ms >= 0
+        assert result.error is None
+        assert result.timestamp is not None
     
     @pytest.mark.asyncio
     async def test_asr_worker_speech_event_handling(self, asr_worker, event_bus):
@@ -159,8 +165,7 @@ class TestASRWorker:
         await event_bus.publish(speech_event)
         await asyncio.sleep(0.1)
         
-        if asr_worker.processing_tasks:
-            await asyncio.gather(*asr_worker.processing_tasks, return_exceptions=True)
+        await asr_worker._queue.join()
         
         # Verify ASR result published
         assert len(published_events) == 1
@@ -202,8 +207,7 @@ class TestASRWorker:
         await event_bus.publish(large_speech_event)
         await asyncio.sleep(0.1)
         
-        if asr_worker.processing_tasks:
-            await asyncio.gather(*asr_worker.processing_tasks, return_exceptions=True)
+        await asr_worker._queue.join()
         
         assert len(published_events) == 1
         result = published_events[0]
@@ -250,8 +254,7 @@ class TestASRWorker:
         await event_bus.publish(error_event)
         await asyncio.sleep(0.1)
         
-        if asr_worker.processing_tasks:
-            await asyncio.gather(*asr_worker.processing_tasks, return_exceptions=True)
+        await asr_worker._queue.join()
         
         # Should have error result
         assert len(published_events) == 1
@@ -260,6 +263,93 @@ class TestASRWorker:
         assert error_result.data["success"] is False
         assert "error" in error_result.data["result"]
     
+    @pytest.mark.asyncio
+    async def test_asr_worker_survives_malformed_event(self, asr_worker, event_bus):
+        """Test a malformed event yields an error result and consumers keep running."""
+        await asr_worker.asr_service.initialize()
+        await asr_worker.start()
+        
+        published_events = []
+        
+        async def capture_event(event: Event):
+            published_events.append(event)
+        
+        await event_bus.subscribe("asr_completed", capture_event)
+        
+        await event_bus.publish(Event(
+            name="speech_detected",
+            data={"session_id": "bad_session", "chunk_id": 1, "result": "bad"},
+            source="vad_worker"
+        ))
+        await asr_worker._queue.join()
+        
+        assert all(not consumer.done() for consumer in asr_worker._consumers)
+        
+        await event_bus.publish(Event(
+            name="speech_detected",
+            data={"session_id": "good_session", "chunk_id": 2, "data": b"good_data" * 100},
+            source="vad_worker"
+        ))
+        await asr_worker._queue.join()
+        
+        assert [e.data["success"] for e in published_events] == [False, True]
+        assert "Malformed" in published_events[0].data["result"]["error"]
+    
+    @pytest.mark.asyncio
+    async def test_asr_worker_timeout(self, asr_worker, event_bus):
+        """Test slow transcriptions are cut off at chunk_timeout."""
+        await asr_worker.start()
+        asr_worker.chunk_timeout = 0.05
+        
+        async def slow_transcribe(*args, **kwargs):
+            await asyncio.sleep(1)
+        
+        asr_worker.asr_service.transcribe = slow_transcribe
+        
+        published_events = []
+        
+        async def capture_event(event: Event):
+            published_events.append(event)
+        
+        await event_bus.subscribe("asr_completed", capture_event)
+        
+        await event_bus.publish(Event(
+            name="speech_detected",
+            data={
+                "session_id": "timeout_session",
+                "chunk_id": 1,
+                "data": b"slow_data" * 100,
+                "sample_rate": 16000
+            },
+            source="vad_worker"
+        ))
+        await asr_worker._queue.join()
+        
+        assert len(published_events) == 1
+        assert published_events[0].data["success"] is False
+        assert published_events[0].data["result"]["error"] == "Processing timeout"
+    
+    @pytest.mark.asyncio
+    async def test_chunk_timeout_leaves_outside_cancellation_alone(self, asr_worker):
+        """Test cancelling a chunk (e.g. on stop) is not reported as a timeout."""
+        await asr_worker.start()
+        started = asyncio.Event()
+        
+        async def slow_transcribe():
+            started.set()
+            await asyncio.sleep(10)
+        
+        task = asyncio.ensure_future(asr_worker._with_chunk_timeout(slow_transcribe()))
+        await started.wait()
+        task.cancel()
+        
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        
+        asr_worker.chunk_timeout = 0.01
+        with pytest.raises(asyncio.TimeoutError):
+            await asr_worker._with_chunk_timeout(slow_transcribe())
+    
     @pytest.mark.asyncio
     async def test_asr_worker_not_running_error(self, asr_worker):
         """Test error when processing while not running."""
@@ -309,12 +399,48 @@ class TestASRWorker:
         
         await asyncio.sleep(0.2)
         
-        if asr_worker.processing_tasks:
-            await asyncio.gather(*asr_worker.processing_tasks, return_exceptions=True)
+        await asr_worker._queue.join()
+        
+        # Events beyond max_concurrent_tasks are queued, not dropped
+        assert len(published_events) == 3
+    
+    @pytest.mark.asyncio
+    async def test_asr_worker_batched_publish(self, event_bus, mock_asr_service):
+        """Test results are flushed in batches when a publish window is set."""
+        config = ProcessingSettings(
+            max_concurrent_workers=2,
+            chunk_timeout_seconds=5,
+            publish_batch_window_ms=20.0
+        )
+        worker = ASRWorker(asr_service=mock_asr_service, config=config)
+        worker.set_event_bus(event_bus)
+        await worker.start()
+        
+        published_events = []
+        
+        async def capture_event(event: Event):
+            published_events.append(event)
+        
+        await event_bus.subscribe("asr_completed", capture_event)
+        event_bus.publish_batch = AsyncMock(wraps=event_bus.publish_batch)
+        
+        for i in range(3):
+            await event_bus.publish(Event(
+                name="speech_detected",
+                data={
+                    "session_id": "batch_session",
+                    "chunk_id": i,
+                    "data": b"batched_speech" * 100,
+                    "sample_rate": 16000
+                },
+                source="vad_worker"
+            ))
+        
+        # stop() flushes results still waiting in the publish window
+        await worker.stop()
         
-        # Should process some events (limited by concurrency)
-        assert len(published_events) >= 1
-        assert len(published_events) <= 3
+        assert sorted(e.data["chunk_id"] for e in published_events) == [0, 1, 2]
+        assert event_bus.publish_batch.await_count < 3
     
     @pytest.mark.asyncio
     async def test_asr_worker_get_status(self, asr_worker):
@@ -329,4 +455,6 @@ class TestASRWorker:
         
         assert status["is_running"] is False
         assert status["processing_tasks"] == 0
+        assert status["queued_chunks"] == 0
+        assert status["asr_service_info"]["initialized"] is False
         assert status["max_concurrent_tasks"] == 2
\ No newline at end of file
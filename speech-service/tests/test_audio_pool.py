@@ -0,0 +1,88 @@
+"""
+Tests for AudioBufferPool and Float32BufferPool.
+
+Tests buffer pooling functionality:
+- Size class rounding
+- Buffer reuse
+- Retention limits
+"""
+
+import numpy as np
+import pytest
+
+from app.utils.audio_pool import AudioBufferPool, Float32BufferPool
+from app.utils.pcm import as_float32
+
+
+class TestAudioBufferPool:
+    """Test cases for AudioBufferPool."""
+    
+    @pytest.fixture
+    def pool(self):
+        """Create AudioBufferPool instance."""
+        return AudioBufferPool(size_class_bytes=4096, max_buffers_per_class=2)
+    
+    def test_size_class_rounding(self, pool):
+        """Test requested sizes are rounded up to the size class."""
+        assert pool.size_class(1) == 4096
+        assert pool.size_class(4096) == 4096
+        assert pool.size_class(4097) == 8192
+        assert len(pool.acquire(5000)) == 8192
+    
+    def test_released_buffer_is_reused(self, pool):
+        """Test a released buffer is handed out again."""
+        buffer = pool.acquire(1000)
+        pool.release(buffer)
+        
+        assert pool.idle_count() == 1
+        assert pool.acquire(2000) is buffer
+        assert pool.idle_count() == 0
+    
+    def test_retention_limit(self, pool):
+        """Test the pool keeps at most max_buffers_per_class idle buffers."""
+        buffers = [pool.acquire(100) for _ in range(3)]
+        for buffer in buffers:
+            pool.release(buffer)
+        
+        assert pool.idle_count() == 2
+    
+    def test_foreign_buffer_ignored(self, pool):
+        """Test buffers that are not a size class are not pooled."""
+        pool.release(bytearray(100))
+        
+        assert pool.idle_count() == 0
+
+
+class TestFloat32BufferPool:
+    """Test cases for Float32BufferPool."""
+    
+    @pytest.fixture
+    def pool(self):
+        """Create Float32BufferPool instance."""
+        return Float32BufferPool(size_class_samples=1000, max_buffers_per_class=2)
+    
+    def test_acquire_rounds_up_to_float32_array(self, pool):
+        """Test acquired arrays are float32 and sized to the size class."""
+        buffer = pool.acquire(1500)
+        
+        assert buffer.dtype == np.float32
+        assert len(buffer) == 2000
+    
+    def test_decode_into_released_buffer(self, pool):
+        """Test a released array is reused as as_float32 output."""
+        buffer = pool.acquire(4)
+        pool.release(buffer)
+        reused = pool.acquire(4)
+        
+        samples = as_float32(np.array([0, 16384, -32768, 0], dtype=np.int16).tobytes(), out=reused)
+        
+        assert reused is buffer
+        assert np.shares_memory(samples, buffer)
+        assert samples.tolist() == [0.0, 0.5, -1.0, 0.0]
+    
+    def test_foreign_arrays_ignored(self, pool):
+        """Test arrays that are not a float32 size class are not pooled."""
+        pool.release(np.empty(1000, dtype=np.float64))
+        pool.release(np.empty(999, dtype=np.float32))
+        
+        assert pool.idle_count() == 0
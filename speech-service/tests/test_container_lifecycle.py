@@ -9,7 +9,8 @@ import pytest
 import asyncio
 from unittest.mock import AsyncMock, patch
 
-from app.container import ServiceLifecycleManager, container
+from app.config import Settings
+from app.container import Container, ServiceLifecycleManager, container
 
 
 class TestContainerLifecycle:
@@ -109,6 +110,46 @@ class TestContainerLifecycle:
         # But should be same type
         assert type(asr_worker1.asr_service) is type(asr_worker2.asr_service)
     
+    @pytest.mark.asyncio
+    async def test_websocket_handler_inline_vad_via_container(self):
+        """Test the started handler, with its initialized inline VAD, is the one served."""
+        test_container = Container()
+        test_container.config.override(Settings(websocket={"inline_vad": True}))
+        
+        handler = test_container.websocket_handler()
+        await handler.start()
+        
+        # Lifespan binds container.websocket_handler() after startup
+        bound_handler = test_container.websocket_handler()
+        assert bound_handler is handler
+        assert bound_handler.vad_service.is_initialized
+        
+        captured_events = []
+        async def capture_audio_event(event):
+            captured_events.append(event)
+        await test_container.event_bus().subscribe("audio_chunk_received", capture_audio_event)
+        
+        websocket = AsyncMock()
+        session_id = await bound_handler.session_manager.create_session()
+        await bound_handler.handle_audio_data(websocket, b"\x10" * 2048, session_id)
+        
+        assert len(captured_events) == 1
+        assert captured_events[0].data["vad_result"]["is_speech"] is True
+        
+        await bound_handler.stop()
+        assert not bound_handler.vad_service.is_initialized
+    
+    @pytest.mark.parametrize("sample_rate, window_bytes", [(16000, 1024), (8000, 512)])
+    def test_websocket_coalescing_window_from_vad_config(self, sample_rate, window_bytes):
+        """Test coalesced frames fill exactly one VAD model window."""
+        test_container = Container()
+        test_container.config.override(Settings(
+            websocket={"coalesce_frames": True},
+            vad={"sample_rate": sample_rate}
+        ))
+        
+        assert test_container.websocket_handler().coalesce_window_bytes == window_bytes
+    
     def test_container_configuration(self):
         """Test container configuration and providers."""
         # Container should have all necessary providers
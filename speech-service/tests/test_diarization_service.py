@@ -12,12 +12,14 @@ This module tests the MockDiarizationService functionality including:
 
 import pytest
 import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Dict, Any
 
-from app.services.diarization_service import MockDiarizationService
+from app.services.diarization_service import MockDiarizationService, PyAnnoteDiarizationService
 from app.interfaces.services import DiarizationServiceError
 from app.config import DiarizationSettings
+from app.utils.audio_pool import Float32BufferPool
 
 
 class TestMockDiarizationService:
@@ -339,4 +341,118 @@ class TestMockDiarizationService:
         assert config.min_speakers > 0
         assert config.max_speakers >= config.min_speakers
         assert isinstance(config.model_name, str)
-        assert isinstance(config.clustering_method, str)
\ No newline at end of file
+        assert isinstance(config.clustering_method, str)
+
+
+class TestPyAnnoteDiarizationService:
+    """Test suite for PyAnnoteDiarizationService with the pipeline stubbed out."""
+    
+    @pytest.fixture
+    def pyannote_service(self):
+        """Create a service whose pipeline load and inference are stubbed."""
+        service = PyAnnoteDiarizationService(DiarizationSettings())
+        service._load_pyannote_pipeline = lambda: object()
+        service._run_diarization = lambda audio, num_speakers, session_id: {
+            "speakers": [],
+            "segments": [],
+            "speaker_count": 0,
+            "session_id": session_id
+        }
+        return service
+    
+    @pytest.fixture
+    def batched_service(self, pyannote_service):
+        """Stubbed service with diarization micro-batching enabled."""
+        service = PyAnnoteDiarizationService(DiarizationSettings(batch_window_ms=20.0, max_batch_size=2))
+        service._load_pyannote_pipeline = pyannote_service._load_pyannote_pipeline
+        service._run_diarization = pyannote_service._run_diarization
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_batch_window_groups_chunks(self, batched_service):
+        """Test concurrent chunks share executor jobs of at most max_batch_size."""
+        await batched_service.initialize()
+        
+        batch_sizes = []
+        run_batch = batched_service._run_diarization_batch
+        def recording_run_batch(batch):
+            batch_sizes.append(len(batch))
+            return run_batch(batch)
+        batched_service._run_diarization_batch = recording_run_batch
+        
+        with patch("app.services.diarization_service.float32_buffer_pool", Float32BufferPool()) as pool:
+            results = await asyncio.gather(*(
+                batched_service.diarize(b"\x01\x00" * 320, session_id=f"s{i}") for i in range(3)
+            ))
+        
+        assert batch_sizes == [2, 1]
+        assert [result["session_id"] for result in results] == ["s0", "s1", "s2"]
+        assert pool.idle_count() == 3  # every array recycled once its job finished
+        await batched_service.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_batch_error_isolated_per_chunk(self, batched_service):
+        """Test a failing chunk does not fail the other chunks in its batch."""
+        run_diarization = batched_service._run_diarization
+        def failing_run_diarization(audio, num_speakers, session_id):
+            if session_id == "bad":
+                raise RuntimeError("pipeline failed")
+            return run_diarization(audio, num_speakers, session_id)
+        batched_service._run_diarization = failing_run_diarization
+        await batched_service.initialize()
+        
+        good, bad = await asyncio.gather(
+            batched_service.diarize(b"\x01\x00" * 320, session_id="good"),
+            batched_service.diarize(b"\x01\x00" * 320, session_id="bad"),
+            return_exceptions=True
+        )
+        
+        assert good["session_id"] == "good"
+        assert isinstance(bad, DiarizationServiceError)
+        assert "pipeline failed" in str(bad)
+        await batched_service.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_fails_pending_chunks(self, batched_service):
+        """Test cleanup fails pending chunks without recycling arrays still in use."""
+        started = threading.Event()
+        release = threading.Event()
+        run_diarization = batched_service._run_diarization
+        def blocking_run_diarization(audio, num_speakers, session_id):
+            started.set()
+            release.wait(5)
+            return run_diarization(audio, num_speakers, session_id)
+        batched_service._run_diarization = blocking_run_diarization
+        await batched_service.initialize()
+        
+        loop = asyncio.get_running_loop()
+        pool = Float32BufferPool()
+        with patch("app.services.diarization_service.float32_buffer_pool", pool):
+            running = asyncio.ensure_future(batched_service.diarize(b"\x01\x00" * 320, session_id="running"))
+            assert await loop.run_in_executor(None, started.wait, 5)
+            queued = asyncio.ensure_future(batched_service.diarize(b"\x01\x00" * 320, session_id="queued"))
+            await asyncio.sleep(0)
+            
+            try:
+                await batched_service.cleanup()
+                
+                for task in (running, queued):
+                    with pytest.raises(DiarizationServiceError, match="stopped"):
+                        await asyncio.wait_for(task, 1)
+            finally:
+                release.set()
+        
+        # The running job was still reading its waveform, so nothing was recycled
+        assert pool.idle_count() == 0
+    
+    @pytest.mark.asyncio
+    async def test_restart_after_cleanup(self, pyannote_service):
+        """Test the service can be initialized and used again after cleanup."""
+        await pyannote_service.initialize()
+        await pyannote_service.cleanup()
+        
+        await pyannote_service.initialize()
+        result = await pyannote_service.diarize(b"\x01\x00" * 320, session_id="s1")
+        
+        assert result["session_id"] == "s1"
+        await pyannote_service.cleanup()
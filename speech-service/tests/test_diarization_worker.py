@@ -9,6 +9,7 @@ Tests Event-driven Diarization Worker functionality:
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
@@ -52,18 +53,21 @@ class TestDiarizationWorker:
         """Create MockDiarizationService instance."""
         return MockDiarizationService(diarization_config)
     
-    @pytest.fixture
-    def diarization_worker(self, event_bus, mock_diarization_service, processing_config):
+    @pytest_asyncio.fixture
+    async def diarization_worker(self, event_bus, mock_diarization_service, processing_config):
         """Create DiarizationWorker instance with Clean DI pattern."""
         worker = DiarizationWorker(diarization_service=mock_diarization_service, config=processing_config)
         worker.set_event_bus(event_bus)
-        return worker
+        yield worker
+
+        if worker.is_running:
+            await worker.stop()
     
     @pytest.mark.asyncio
     async def test_diarization_worker_initialization(self, diarization_worker):
         """Test worker initialization and state."""
         assert not diarization_worker.is_running
-        assert len(diarization_worker.processing_tasks) == 0
+        assert diarization_worker._queue.empty()
         assert diarization_worker.max_concurrent_tasks == 2
         assert diarization_worker.chunk_timeout == 5
         assert diarization_worker.diarization_service is not None
@@ -122,6 +126,7 @@ class TestDiarizationWorker:
         # Проверяем корректные значения
         assert status["is_running"] is False
         assert status["processing_tasks"] == 0
+        assert status["queued_chunks"] == 0
         assert status["max_concurrent_tasks"] == 2
     
     @pytest.mark.asyncio
@@ -326,7 +331,7 @@ class TestDiarizationWorker:
         
         # Send more events than max_concurrent_tasks (which is 2)
         events = []
-        for i in range(5):  # Send 5 events, but only 2 should be processed concurrently
+        for i in range(5):  # Send 5 events; only 2 are processed concurrently, the rest queue
             event = Event(
                 name="speech_detected",
                 data={
@@ -343,14 +348,15 @@ class TestDiarizationWorker:
         
         # Check that only max_concurrent_tasks are being processed
         await asyncio.sleep(0.05)  # Small delay to let tasks start
-        assert len(diarization_worker.processing_tasks) <= diarization_worker.max_concurrent_tasks
+        status = diarization_worker.get_status()
+        assert status["processing_tasks"] == diarization_worker.max_concurrent_tasks
+        assert status["queued_chunks"] == 3
         
         # Wait for all processing to complete
-        await asyncio.sleep(0.5)
+        await diarization_worker._queue.join()
         
-        # Should have results (some may be dropped due to concurrency limit)
-        assert len(captured_events) <= 5  # Some may be dropped
-        assert len(captured_events) >= 2  # At least max_concurrent should succeed
+        # Queued chunks are processed rather than dropped
+        assert len(captured_events) == 5
         
         # Restore and clean up
         diarization_worker.diarization_service.diarize = original_diarize
@@ -147,5 +147,100 @@ async def test_event_publisher_mixin():
     assert received_events[0].data["message"] == "from_mixin"
 
 
+
+@pytest.mark.asyncio
+async def test_event_publisher_mixin_prebuilt_event():
+    """Тест публикации готового Event через publish_event_obj."""
+    event_bus = AsyncEventBus()
+    received_events = []
+    
+    async def test_handler(event: Event):
+        received_events.append(event)
+    
+    await event_bus.subscribe("test_event", test_handler)
+    
+    publisher = EventPublisherMixin(event_bus, "test_publisher")
+    event = Event("test_event", {"message": "prebuilt"}, "test_publisher", "corr_1")
+    
+    await publisher.publish_event_obj(event)
+    
+    # Событие доставлено без повторной обёртки
+    assert len(received_events) == 1
+    assert received_events[0] is event
+    assert received_events[0].correlation_id == "corr_1"
+
+
+
+@pytest.mark.asyncio
+async def test_subscribe_many():
+    """Тест пакетной подписки нескольких обработчиков."""
+    event_bus = AsyncEventBus()
+    received = []
+    
+    async def handler_a(event: Event):
+        received.append(("a", event.name))
+    
+    async def handler_b(event: Event):
+        received.append(("b", event.name))
+    
+    await event_bus.subscribe_many([
+        ("event_a", handler_a),
+        ("event_b", handler_b),
+    ])
+    
+    assert await event_bus.get_subscribers("event_a") == [handler_a]
+    assert await event_bus.get_subscribers("event_b") == [handler_b]
+    
+    await event_bus.publish(Event("event_a", {}, "test"))
+    await event_bus.publish(Event("event_b", {}, "test"))
+    
+    assert received == [("a", "event_a"), ("b", "event_b")]
+
+
+@pytest.mark.asyncio
+async def test_event_bus_depth():
+    """Тест счётчика событий в обработке."""
+    event_bus = AsyncEventBus()
+    release = asyncio.Event()
+    depths = []
+    
+    async def slow_handler(event: Event):
+        depths.append(event_bus.depth())
+        await release.wait()
+    
+    await event_bus.subscribe("slow_event", slow_handler)
+    
+    publish_tasks = [
+        asyncio.create_task(event_bus.publish(Event("slow_event", {}, "test")))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0.01)
+    
+    assert event_bus.depth() == 2
+    assert (await event_bus.get_stats())["pending_events"] == 2
+    
+    release.set()
+    await asyncio.gather(*publish_tasks)
+    
+    assert event_bus.depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_publish_batch():
+    """Тест пакетной публикации событий."""
+    event_bus = AsyncEventBus()
+    received = []
+    
+    async def handler(event: Event):
+        received.append(event.data["i"])
+    
+    await event_bus.subscribe("batch_event", handler)
+    await event_bus.publish_batch([Event("batch_event", {"i": i}, "test") for i in range(3)])
+    
+    assert sorted(received) == [0, 1, 2]
+    assert len(await event_bus.get_event_history("batch_event")) == 3
+    assert event_bus.depth() == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -5,6 +5,7 @@ This module tests all data models for proper validation,
 serialization, and business logic compliance.
 """
 
+import json
 import pytest
 from datetime import datetime
 from pydantic import ValidationError
@@ -12,8 +13,11 @@ from pydantic import ValidationError
 from app.models.audio import (
     AudioChunkModel,
     ProcessingResultModel,
-    WebSocketResponseModel
+    WebSocketResponseModel,
+    processing_result_payload
 )
+from app.models.speech import SpeechDetectedPayload
+from app.interfaces.events import Event
 
 
 class TestAudioChunkModel:
@@ -65,6 +69,14 @@ class TestAudioChunkModel:
                 chunk_id=0,
                 data=b"test"
             )
+        
+        # Non-string session_id should fail rather than be coerced
+        with pytest.raises(ValidationError):
+            AudioChunkModel(
+                session_id=b"test_session",
+                chunk_id=0,
+                data=b"test"
+            )
     
     def test_invalid_chunk_id_validation(self):
         """Test chunk_id validation."""
@@ -125,6 +137,18 @@ class TestAudioChunkModel:
                 channels=3  # Should be <= 2
             )
 
+    def test_memoryview_data_kept_by_reference(self):
+        """Test that memoryview audio is stored as-is and never serialized."""
+        view = memoryview(b"audio_data_bytes")
+        chunk = AudioChunkModel(session_id="test", chunk_id=0, data=view)
+
+        assert chunk.data is view
+        assert "data" not in chunk.model_dump()
+        assert "data" not in json.loads(chunk.model_dump_json())
+
+        with pytest.raises(ValidationError):
+            AudioChunkModel(session_id="test", chunk_id=0, data=memoryview(b""))
+
 
 class TestProcessingResultModel:
     """Test suite for ProcessingResultModel."""
@@ -265,6 +289,32 @@ class TestProcessingResultModel:
         
         assert result.success is False
         assert result.error == "Processing failed due to invalid audio format"
+    
+    def test_processing_result_payload_matches_model_dump(self):
+        """Test direct payload has the same shape as a dumped model."""
+        result = {"text": "Hello world", "confidence": 0.89}
+        payload = processing_result_payload("test", 3, "asr", result, 12.5)
+        expected = ProcessingResultModel(
+            session_id="test",
+            chunk_id=3,
+            component="asr",
+            result=result,
+            processing_time_ms=12.5
+        ).model_dump()
+        
+        assert payload.keys() == expected.keys()
+        assert isinstance(payload.pop("timestamp"), datetime)
+        expected.pop("timestamp")
+        assert payload == expected
+        assert payload["result"] is result
+    
+    def test_failed_processing_result_payload(self):
+        """Test direct payload for a failed result."""
+        result = {"text": "", "confidence": 0.0, "error": "Processing timeout"}
+        payload = processing_result_payload("test", 3, "asr", result, 12.5, success=False)
+        
+        assert payload["success"] is False
+        assert payload["result"]["error"] == "Processing timeout"
 
 
 class TestWebSocketResponseModel:
@@ -338,4 +388,39 @@ class TestWebSocketResponseModel:
         
         assert response.processing_complete is False
         assert response.transcript is None
-        assert response.speakers is None
\ No newline at end of file
+        assert response.speakers is None
+
+
+class TestSpeechDetectedPayload:
+    """Test suite for SpeechDetectedPayload."""
+    
+    def test_from_event_primary_format(self):
+        """Test unpacking the format published by the VAD worker."""
+        event = Event("speech_detected", {
+            "session_id": "s1", "chunk_id": 4, "data": b"pcm", "sample_rate": 8000
+        }, "vad_worker")
+        payload = SpeechDetectedPayload.from_event(event)
+        
+        assert payload == SpeechDetectedPayload("s1", 4, b"pcm", 8000)
+    
+    def test_from_event_nested_result_and_missing_audio(self):
+        """Test the nested result fallback and defaults for missing fields."""
+        nested = Event("speech_detected", {
+            "result": {"audio_data": b"pcm", "sample_rate": 16000}
+        }, "vad_worker")
+        payload = SpeechDetectedPayload.from_event(nested)
+        
+        assert payload == SpeechDetectedPayload("unknown", -1, b"pcm", 16000)
+        assert SpeechDetectedPayload.from_event(
+            Event("speech_detected", {"data": b""}, "vad_worker")
+        ).audio_data is None
+    
+    def test_from_event_uses_attached_meta(self):
+        """Test a payload attached by the publisher is returned as is."""
+        meta = SpeechDetectedPayload("s1", 4, b"pcm", 8000)
+        event = Event("speech_detected", {"data": b"other", "meta": meta}, "vad_worker")
+        
+        assert SpeechDetectedPayload.from_event(event) is meta
+        with pytest.raises(AttributeError):
+            meta.chunk_id = 5
+
@@ -0,0 +1,51 @@
+"""
+Tests for PCM conversion helpers.
+"""
+
+import numpy as np
+
+from app.utils.pcm import AudioBuffer, as_int16, as_float32
+
+
+def test_as_int16_is_zero_copy():
+    """Test int16 view shares memory with the source buffer."""
+    buffer = bytearray(np.array([0, 1, -1, 32767], dtype=np.int16).tobytes())
+    samples = as_int16(buffer)
+    
+    assert samples.tolist() == [0, 1, -1, 32767]
+    buffer[0:2] = np.array([5], dtype=np.int16).tobytes()
+    assert samples[0] == 5
+
+
+def test_as_float32_normalizes():
+    """Test float32 conversion scales samples to [-1, 1)."""
+    buffer = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+    samples = as_float32(buffer)
+    
+    assert samples.dtype == np.float32
+    np.testing.assert_allclose(samples, [0.0, 0.5, -1.0])
+
+
+def test_as_float32_writes_into_out_buffer():
+    """Test float32 conversion reuses a larger preallocated buffer."""
+    buffer = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+    out = np.full(8, 7.0, dtype=np.float32)
+    samples = as_float32(buffer, out=out)
+    
+    assert np.shares_memory(samples, out)
+    assert len(samples) == 3
+    np.testing.assert_allclose(samples, [0.0, 0.5, -1.0])
+    assert out[3] == 7.0
+
+
+def test_audio_buffer_shares_one_conversion():
+    """Test an AudioBuffer converts once and hands every caller the same array."""
+    raw = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+    audio = AudioBuffer(raw)
+    
+    assert len(audio) == len(raw)
+    assert as_int16(audio).tolist() == [0, 16384, -32768]
+    
+    samples = as_float32(audio)
+    assert as_float32(audio) is samples
+    np.testing.assert_allclose(samples, [0.0, 0.5, -1.0])
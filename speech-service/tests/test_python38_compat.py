@@ -0,0 +1,87 @@
+"""
+Tests that the app stays importable on Python 3.8.
+
+The README documents Python 3.8+, but the suite usually runs on a newer
+interpreter where newer stdlib names import fine. These checks read the
+source instead, so a 3.9+ only name fails here on any interpreter.
+"""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+# typing names added after 3.8 (use typing_extensions instead)
+TYPING_NAMES_AFTER_38 = {
+    "Annotated", "Concatenate", "LiteralString", "Never", "NotRequired",
+    "ParamSpec", "ParamSpecArgs", "ParamSpecKwargs", "Required", "Self",
+    "TypeAlias", "TypeGuard", "TypeVarTuple", "Unpack", "assert_never",
+    "assert_type", "dataclass_transform", "is_typeddict", "override",
+    "reveal_type",
+}
+
+# (module, attribute) pairs added after 3.8
+ATTRIBUTES_AFTER_38 = {
+    ("asyncio", "timeout"), ("asyncio", "timeout_at"),
+    ("asyncio", "to_thread"), ("asyncio", "TaskGroup"),
+    ("typing", "Annotated"),
+}
+
+# Builtins that only became subscriptable (list[int]) in 3.9
+GENERIC_BUILTINS = {"dict", "frozenset", "list", "set", "tuple", "type"}
+
+# Keyword arguments added after 3.8
+KEYWORDS_AFTER_38 = {
+    "dataclass": {"slots", "kw_only", "match_args"},
+    "shutdown": {"cancel_futures"},
+}
+
+
+def _app_modules():
+    return sorted(APP_DIR.rglob("*.py"))
+
+
+def _call_name(func: ast.expr) -> str:
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    if isinstance(func, ast.Name):
+        return func.id
+    return ""
+
+
+@pytest.mark.parametrize("path", _app_modules(), ids=lambda p: str(p.relative_to(APP_DIR)))
+def test_module_avoids_post_38_features(path):
+    """Test a module parses as 3.8 and uses no newer stdlib names or keywords."""
+    source = path.read_text(encoding="utf-8")
+    tree = ast.parse(source, filename=str(path), feature_version=(3, 8))
+
+    postponed = any(
+        isinstance(node, ast.ImportFrom) and node.module == "__future__"
+        and any(alias.name == "annotations" for alias in node.names)
+        for node in tree.body
+    )
+
+    problems = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module == "typing":
+            problems += [
+                f"line {node.lineno}: typing.{alias.name}"
+                for alias in node.names if alias.name in TYPING_NAMES_AFTER_38
+            ]
+        elif isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if (node.value.id, node.attr) in ATTRIBUTES_AFTER_38:
+                problems.append(f"line {node.lineno}: {node.value.id}.{node.attr}")
+        elif isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name):
+            if node.value.id in GENERIC_BUILTINS and not postponed:
+                problems.append(f"line {node.lineno}: {node.value.id}[...]")
+        elif isinstance(node, ast.Call):
+            newer = KEYWORDS_AFTER_38.get(_call_name(node.func), set())
+            problems += [
+                f"line {node.lineno}: {_call_name(node.func)}({keyword.arg}=...)"
+                for keyword in node.keywords if keyword.arg in newer
+            ]
+
+    assert not problems, f"{path.name} needs Python > 3.8: {problems}"
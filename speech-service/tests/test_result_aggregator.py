@@ -171,7 +171,7 @@ class TestResultAggregator:
         await asyncio.sleep(0.01)  # Let event process
         
         # Check chunk state was created
-        chunk_key = "test_session_1"
+        chunk_key = ("test_session", 1)
         assert chunk_key in result_aggregator.chunk_states
         
         chunk_state = result_aggregator.chunk_states[chunk_key]
@@ -261,11 +261,35 @@ class TestResultAggregator:
         assert "diarization" in results
         
         # Verify chunk state was cleaned up
-        chunk_key = "test_session_1"
+        chunk_key = ("test_session", 1)
         assert chunk_key not in result_aggregator.chunk_states
         
         await result_aggregator.stop()
     
+    @pytest.mark.asyncio
+    async def test_clear_session(self, result_aggregator, event_bus):
+        """Test clearing a session drops its pending chunks."""
+        await result_aggregator.start()
+        
+        await event_bus.publish(Event(
+            name="vad_completed",
+            data={
+                "session_id": "cleared_session",
+                "chunk_id": 1,
+                "component": "vad",
+                "success": True,
+                "result": {}
+            },
+            source="vad_worker"
+        ))
+        assert ("cleared_session", 1) in result_aggregator.chunk_states
+        
+        await result_aggregator.clear_session("cleared_session")
+        
+        assert result_aggregator.chunk_states == {}
+        
+        await result_aggregator.stop()
+    
     @pytest.mark.asyncio
     async def test_partial_results_before_stop(self, result_aggregator, event_bus):
         """Test handling partial results during shutdown."""
@@ -8,8 +8,13 @@ and testing purposes, ensuring proper interface compliance.
 import pytest
 from unittest.mock import AsyncMock, patch
 import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import torch
 
-from app.services.vad_service import MockVADService
+from app.services.vad_service import MockVADService, SileroVADService
 from app.interfaces.services import VADServiceError
 from app.config import VADSettings
 
@@ -257,4 +262,96 @@ class TestMockVADService:
             assert len(segment) == 2
             assert isinstance(segment[0], float)  # start time
             assert isinstance(segment[1], float)  # end time
-            assert segment[0] <= segment[1]      # start <= end
\ No newline at end of file
+            assert segment[0] <= segment[1]      # start <= end
+
+
+class TestSileroVADService:
+    """Test suite for SileroVADService with the Silero model stubbed out."""
+    
+    @pytest.fixture
+    def silero_service(self):
+        """Create a service whose model load is stubbed."""
+        service = SileroVADService(VADSettings())
+        service._load_silero_model = lambda: object()
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_restart_after_cleanup(self, silero_service):
+        """Test the service can be initialized and used again after cleanup."""
+        await silero_service.initialize()
+        await silero_service.cleanup()
+        
+        await silero_service.initialize()
+        silero_service._run_vad_detection_pcm = lambda audio, sample_rate: {
+            "is_speech": False,
+            "confidence": 0.0,
+            "speech_segments": [],
+            "frame_count": 1,
+            "audio_duration": 0.02
+        }
+        
+        result = await silero_service.detect_speech(b"\x00\x00" * 320)
+        
+        assert result["is_speech"] is False
+        await silero_service.cleanup()
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batch_window_ms", [0.0, 5.0])
+    async def test_resampling_runs_in_executor(self, batch_window_ms):
+        """Test chunks at another rate are resampled off the event loop."""
+        class SilentModel:
+            def reset_states(self):
+                pass
+            
+            def __call__(self, frame, sample_rate):
+                return torch.zeros(frame.shape[0] if frame.dim() > 1 else 1)
+        
+        service = SileroVADService(VADSettings(batch_window_ms=batch_window_ms))
+        service._load_silero_model = lambda: SilentModel()
+        
+        resample_threads = []
+        
+        def resample(audio, orig_sr, target_sr):
+            resample_threads.append(threading.current_thread())
+            return np.zeros(len(audio) * target_sr // orig_sr, dtype=np.float32)
+        
+        service._resample_audio = resample
+        await service.initialize()
+        try:
+            result = await service.detect_speech(b"\x00\x00" * 4000, sample_rate=8000)
+        finally:
+            await service.cleanup()
+        
+        assert len(resample_threads) == 1
+        assert resample_threads[0] is not threading.main_thread()
+        assert result["audio_duration"] == pytest.approx(0.5)
+    
+    def test_concurrent_detections_do_not_interleave_model_state(self, silero_service):
+        """Test executor threads never step the shared recurrent model at once."""
+        class RecurrentModel:
+            """Flags any window stepped by a thread other than the one that reset it."""
+            
+            def __init__(self):
+                self.owner = None
+                self.interleaved = False
+            
+            def reset_states(self):
+                self.owner = threading.get_ident()
+            
+            def __call__(self, frame, sample_rate):
+                if self.owner != threading.get_ident():
+                    self.interleaved = True
+                time.sleep(0.001)
+                return torch.zeros(frame.shape[0] if frame.dim() > 1 else 1)
+        
+        model = RecurrentModel()
+        silero_service.model = model
+        audio = np.zeros(512 * 8, dtype=np.float32)
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            singles = [pool.submit(silero_service._run_vad_detection, audio) for _ in range(4)]
+            batches = [pool.submit(silero_service._run_vad_detection_batch, [audio, audio]) for _ in range(4)]
+            results = [f.result() for f in singles] + [r for f in batches for r in f.result()]
+        
+        assert not model.interleaved
+        assert all(result["frame_count"] == 8 for result in results)
@@ -17,6 +17,7 @@ from datetime import datetime, timedelta
 from app.handlers.websocket_handler import WebSocketHandler, WebSocketManager, SessionManager
 from app.events import AsyncEventBus
 from app.interfaces.events import Event
+from app.models.transcript import TranscriptSegment, TranscriptWord
 from app.interfaces.websocket import WebSocketHandlerError, WebSocketManagerError, SessionManagerError
 
 
@@ -187,6 +188,26 @@ class TestWebSocketManager:
         with pytest.raises(WebSocketManagerError):
             await websocket_manager.broadcast_to_session("nonexistent", {"test": "data"})
 
+    def test_encode_message_formats_datetimes(self, websocket_manager):
+        """Test that datetimes are formatted to ISO strings at encode time."""
+        ts = datetime(2024, 1, 2, 3, 4, 5)
+        payload = websocket_manager.encode_message({"type": "test", "results": {"timestamp": ts}})
+
+        assert json.loads(payload)["results"]["timestamp"] == ts.isoformat()
+
+    def test_encode_message_formats_transcript_segments(self, websocket_manager):
+        """Test that transcript segments are encoded in their dict wire format."""
+        segment = TranscriptSegment(0.0, 1.5, "hello", -0.2, [TranscriptWord("hello", 0.0, 1.5, 0.9)])
+        payload = websocket_manager.encode_message({"type": "test", "segments": [segment]})
+
+        assert json.loads(payload)["segments"] == [{
+            "start": 0.0,
+            "end": 1.5,
+            "text": "hello",
+            "confidence": -0.2,
+            "words": [{"word": "hello", "start": 0.0, "end": 1.5, "confidence": 0.9}]
+        }]
+
 
 class TestWebSocketHandler:
     """Test cases for WebSocketHandler."""
@@ -261,6 +282,7 @@ class TestWebSocketHandler:
         assert audio_event.data["session_id"] == session_id
         assert audio_event.data["chunk_id"] == 0
         assert audio_event.data["data"] == audio_data
+        assert audio_event.correlation_id == f"{session_id}_0"
         
         # Verify acknowledgment sent
         assert len(mock_ws.messages_sent) == 1
@@ -344,6 +366,64 @@ class TestWebSocketHandler:
         
         await websocket_handler.stop()
     
+    @pytest.mark.asyncio
+    async def test_asr_segment_forwarding(self, websocket_handler, event_bus):
+        """Test ASR segments are forwarded to the client as they arrive."""
+        await websocket_handler.start()
+        
+        mock_ws = MockWebSocket()
+        session_id = await websocket_handler.session_manager.create_session()
+        await websocket_handler.websocket_manager.add_connection(session_id, mock_ws)
+        
+        segment = {"start": 0.0, "end": 1.2, "text": "hello", "confidence": 0.9}
+        await event_bus.publish(Event(
+            name="asr_segment",
+            data={"session_id": session_id, "chunk_id": 4, "segment": segment},
+            source="asr_worker"
+        ))
+        await asyncio.sleep(0.01)
+        
+        assert len(mock_ws.messages_sent) == 1
+        message = json.loads(mock_ws.messages_sent[0])
+        assert message["type"] == "transcript_segment"
+        assert message["chunk_id"] == 4
+        assert message["segment"] == segment
+        
+        await websocket_handler.stop()
+    
+    @pytest.mark.asyncio
+    async def test_chunk_complete_reuses_response_template(self, websocket_handler, event_bus):
+        """Test consecutive chunk results reuse the session template and are cleaned up."""
+        await websocket_handler.start()
+        
+        mock_ws = MockWebSocket()
+        session_id = await websocket_handler.session_manager.create_session()
+        await websocket_handler.websocket_manager.add_connection(session_id, mock_ws)
+        
+        for chunk_id, text in ((1, "first"), (2, "second")):
+            await event_bus.publish(Event(
+                name="chunk_complete",
+                data={
+                    "session_id": session_id,
+                    "chunk_id": chunk_id,
+                    "is_complete": True,
+                    "completed_components": ["asr"],
+                    "results": {"asr": {"text": text, "confidence": 0.8}}
+                },
+                source="result_aggregator"
+            ))
+            await asyncio.sleep(0.01)
+        
+        responses = [json.loads(message) for message in mock_ws.messages_sent]
+        assert [response["chunk_id"] for response in responses] == [1, 2]
+        assert [response["results"]["asr"]["text"] for response in responses] == ["first", "second"]
+        assert session_id in websocket_handler._response_templates
+        
+        await websocket_handler.handle_disconnect(session_id)
+        assert session_id not in websocket_handler._response_templates
+        
+        await websocket_handler.stop()
+    
     @pytest.mark.asyncio
     async def test_send_response(self, websocket_handler):
         """Test sending responses to WebSocket."""
@@ -387,6 +467,24 @@ class TestWebSocketHandler:
         
         await websocket_handler.stop()
     
+    @pytest.mark.asyncio
+    async def test_stop_disconnects_all_sessions(self, websocket_handler):
+        """Test stop() disconnects every active session."""
+        await websocket_handler.start()
+        
+        session_ids = []
+        for _ in range(5):
+            session_id = await websocket_handler.session_manager.create_session()
+            await websocket_handler.websocket_manager.add_connection(session_id, MockWebSocket())
+            session_ids.append(session_id)
+        
+        await websocket_handler.stop()
+        
+        assert await websocket_handler.websocket_manager.get_active_sessions() == []
+        for session_id in session_ids:
+            session_info = await websocket_handler.session_manager.get_session_info(session_id)
+            assert session_info["status"] == "ended"
+    
     @pytest.mark.asyncio
     async def test_get_stats(self, websocket_handler):
         """Test statistics retrieval."""
@@ -402,6 +500,137 @@ class TestWebSocketHandler:
         assert stats["max_audio_chunk_size"] == 1024
         assert stats["session_timeout_minutes"] == 30
     
+    @pytest.mark.asyncio
+    async def test_audio_frame_coalescing(self, event_bus):
+        """Test small frames are coalesced into one published chunk."""
+        handler = WebSocketHandler(
+            event_bus=event_bus,
+            max_audio_chunk_size=1024,
+            coalesce_window_bytes=512
+        )
+        await handler.start()
+        
+        captured_events = []
+        async def capture_audio_event(event):
+            captured_events.append(event)
+        
+        await event_bus.subscribe("audio_chunk_received", capture_audio_event)
+        
+        mock_ws = MockWebSocket()
+        session_id = await handler.session_manager.create_session()
+        
+        frames = [bytes([i]) * 160 for i in range(4)]  # 640 bytes total
+        for frame in frames:
+            await handler.handle_audio_data(mock_ws, frame, session_id)
+        
+        # Only the frame that filled the window triggers a publish
+        assert len(captured_events) == 1
+        assert captured_events[0].data["data"] == b"".join(frames)
+        assert captured_events[0].data["chunk_id"] == 0
+        
+        ack_message = json.loads(mock_ws.messages_sent[-1])
+        assert ack_message["size"] == 640
+        
+        await handler.stop()
+    
+    @pytest.mark.asyncio
+    async def test_partial_window_published_on_disconnect(self, event_bus):
+        """Test audio short of a full window is still published when the client leaves."""
+        handler = WebSocketHandler(
+            event_bus=event_bus,
+            max_audio_chunk_size=1024,
+            coalesce_window_bytes=512
+        )
+        await handler.start()
+        
+        captured_events = []
+        async def capture_audio_event(event):
+            captured_events.append(event)
+        
+        await event_bus.subscribe("audio_chunk_received", capture_audio_event)
+        
+        mock_ws = MockWebSocket()
+        session_id = await handler.session_manager.create_session()
+        
+        await handler.handle_audio_data(mock_ws, b"\x01" * 320, session_id)
+        assert captured_events == []
+        
+        await handler.handle_disconnect(session_id)
+        
+        assert len(captured_events) == 1
+        assert captured_events[0].data["data"] == b"\x01" * 320
+        assert captured_events[0].data["chunk_id"] == 0
+        assert session_id not in handler._coalescing_buffers
+        
+        await handler.stop()
+    
+    @pytest.mark.asyncio
+    async def test_audio_backpressure(self, event_bus):
+        """Test audio is rejected with a backpressure frame while the bus is saturated."""
+        handler = WebSocketHandler(event_bus=event_bus, max_pending_events=2)
+        await handler.start()
+        
+        captured_events = []
+        async def capture_audio_event(event):
+            captured_events.append(event)
+        
+        await event_bus.subscribe("audio_chunk_received", capture_audio_event)
+        
+        mock_ws = MockWebSocket()
+        session_id = await handler.session_manager.create_session()
+        
+        event_bus._pending_events = 2
+        await handler.handle_audio_data(mock_ws, b"x" * 320, session_id)
+        
+        assert captured_events == []
+        backpressure_message = json.loads(mock_ws.messages_sent[-1])
+        assert backpressure_message["type"] == "backpressure"
+        assert backpressure_message["pending_events"] == 2
+        
+        event_bus._pending_events = 0
+        await handler.handle_audio_data(mock_ws, b"x" * 320, session_id)
+        
+        assert len(captured_events) == 1
+        
+        await handler.stop()
+    
+    @pytest.mark.asyncio
+    async def test_inline_vad_gating(self, event_bus):
+        """Test inline VAD drops silence and forwards its result for speech."""
+        vad_service = AsyncMock()
+        vad_service.detect_speech.side_effect = [
+            {"is_speech": False, "confidence": 0.1},
+            {"is_speech": True, "confidence": 0.9},
+        ]
+        handler = WebSocketHandler(event_bus=event_bus, vad_service=vad_service)
+        await handler.start()
+        vad_service.initialize.assert_awaited_once()
+        
+        captured_events = []
+        async def capture_audio_event(event):
+            captured_events.append(event)
+        
+        await event_bus.subscribe("audio_chunk_received", capture_audio_event)
+        
+        mock_ws = MockWebSocket()
+        session_id = await handler.session_manager.create_session()
+        
+        await handler.handle_audio_data(mock_ws, b"\x00" * 320, session_id)
+        
+        assert captured_events == []
+        silence_ack = json.loads(mock_ws.messages_sent[-1])
+        assert silence_ack["type"] == "chunk_received"
+        assert silence_ack["is_speech"] is False
+        
+        await handler.handle_audio_data(mock_ws, b"\x10" * 320, session_id)
+        
+        assert len(captured_events) == 1
+        assert captured_events[0].data["chunk_id"] == 1
+        assert captured_events[0].data["vad_result"]["is_speech"] is True
+        
+        await handler.stop()
+        vad_service.cleanup.assert_awaited_once()
+    
     @pytest.mark.asyncio
     async def test_empty_audio_data_handling(self, websocket_handler):
         """Test handling of empty audio data."""